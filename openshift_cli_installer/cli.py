@@ -4,11 +4,17 @@ from typing import Any
 import click
 from pyhelper_utils.runners import function_runner_with_pdb
 
-from openshift_cli_installer.cli_entrypoint import cli_entrypoint
 from openshift_cli_installer.utils.click_dict_type import DictParamType
 from openshift_cli_installer.utils.const import (
+    CACHE_DIRECTORY,
+    CLUSTER_PHASE_JOURNAL_FILENAME,
     CREATE_STR,
     DESTROY_STR,
+    ON_FAILURE_DESTROY_ALL_STR,
+    ON_FAILURE_FAIL_FAST_STR,
+    ON_FAILURE_KEEP_SUCCESSFUL_STR,
+    RUN_RESULT_MANIFEST_SUFFIX,
+    SUPPORTED_ON_FAILURE_POLICIES,
 )
 
 
@@ -26,6 +32,48 @@ from openshift_cli_installer.utils.const import (
     is_flag=True,
     show_default=True,
 )
+@click.option(
+    "--max-parallel",
+    help="""
+\b
+Max clusters to create / destroy concurrently when running with `--parallel`, default: no limit.
+Per platform, region and OCM environment limits can be set with `concurrency_limits` in the clusters YAML file.
+""",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--on-failure",
+    help=f"""
+\b
+What to do when a cluster fails to create.
+{ON_FAILURE_DESTROY_ALL_STR}: wait for all clusters, then destroy all clusters.
+{ON_FAILURE_FAIL_FAST_STR}: cancel clusters not created yet, destroy only created clusters.
+{ON_FAILURE_KEEP_SUCCESSFUL_STR}: wait for all clusters, keep created clusters (see `--retry-failed`).
+A run result manifest is written to `<clusters-install-data-directory>{RUN_RESULT_MANIFEST_SUFFIX}`.
+""",
+    type=click.Choice(SUPPORTED_ON_FAILURE_POLICIES),
+    default=ON_FAILURE_DESTROY_ALL_STR,
+    show_default=True,
+)
+@click.option(
+    "--retry-failed",
+    help="""
+\b
+Run result manifest of a previous create run.
+Create again only clusters which were not created, then run the missing ACM steps (install, observability, attach).
+""",
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--resume",
+    help=f"""
+\b
+Resume a killed create run from `<clusters-install-data-directory>{RUN_RESULT_MANIFEST_SUFFIX}`.
+Each cluster continues from its last completed phase, recorded in `<cluster directory>/{CLUSTER_PHASE_JOURNAL_FILENAME}`.
+""",
+    is_flag=True,
+    show_default=True,
+)
 @click.option(
     "--ssh-key-file",
     help="id_rsa.pub file path for AWS IPI or ACM clusters",
@@ -165,6 +213,26 @@ Get the S3 object from cluster_data.yaml, download, extract it and call destroy
     show_default=True,
     is_flag=True,
 )
+@click.option(
+    "--list-clusters",
+    help="""
+\b
+List the clusters of --clusters-install-data-directory (from its clusters inventory) and exit.
+    """,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--list-clusters-filter",
+    type=DictParamType(),
+    help="""
+\b
+Filter `--list-clusters` clusters.
+Format to pass is:
+    'platform=rosa;region=us-east-2;older-than=12h;expired=true'
+Supported filters: platform, region, older-than (s/m/h), expired (true/false).
+    """,
+)
 @click.option(
     "--clusters-yaml-config-file",
     help="""
@@ -191,6 +259,33 @@ must-gather will try to collect data when cluster installation fails and cluster
 """,
     type=click.Path(exists=True),
 )
+@click.option(
+    "--cache-dir",
+    help="""
+\b
+Path to a persistent cache directory, can be shared between runs on the same host.
+Used to cache extracted openshift-install binaries and the OpenShift release catalog.
+Pass an empty string to disable the cache.
+""",
+    default=os.environ.get("OPENSHIFT_CLI_INSTALLER_CACHE_DIR", CACHE_DIRECTORY),
+    type=click.Path(),
+    show_default=True,
+)
+@click.option(
+    "--terraform-provider-mirror",
+    help="""
+\b
+Path to a local terraform providers mirror (created with `terraform providers mirror`).
+Hypershift VPC terraform providers are installed from the mirror, without network access.
+""",
+    type=click.Path(exists=True, file_okay=False),
+)
+@click.option(
+    "--offline-catalog",
+    help="Use only the cached OpenShift release catalog from --cache-dir, do not call the release controller",
+    is_flag=True,
+    show_default=True,
+)
 @click.option(
     "--dry-run",
     help="For testing, only verify user input",
@@ -207,6 +302,9 @@ def main(**kwargs: Any) -> None:
     """
     Create/Destroy Openshift cluster/s
     """
+    # Imported on use, `--help` and shell completion do not load the clusters modules
+    from openshift_cli_installer.cli_entrypoint import cli_entrypoint
+
     kwargs.pop("pdb", None)
     cli_entrypoint(**kwargs)
 
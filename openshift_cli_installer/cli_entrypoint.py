@@ -1,19 +1,36 @@
 import shutil
 from typing import Any
 
-from openshift_cli_installer.libs.clusters.ocp_clusters import OCPClusters
 from openshift_cli_installer.libs.user_input import UserInput
-from openshift_cli_installer.utils.clusters import destroy_clusters_from_s3_bucket_or_local_directory
-from openshift_cli_installer.utils.const import CREATE_STR, DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY
-from openshift_cli_installer.utils.gcp_utils import restore_gcp_configuration, set_gcp_configuration
+from openshift_cli_installer.utils.const import (
+    CLUSTERS_INSTALL_DATA_DIRECTORY,
+    CREATE_STR,
+    DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY,
+)
 
 
 def cli_entrypoint(**kwargs: Any) -> None:
+    # Clusters modules (cloud and OCM SDKs) are imported only when clusters are processed, see `test_import_time`
+    if kwargs.get("list_clusters"):
+        from openshift_cli_installer.utils.clusters import list_clusters_from_install_data_directory
+
+        list_clusters_from_install_data_directory(
+            clusters_install_data_directory=kwargs.get("clusters_install_data_directory")
+            or CLUSTERS_INSTALL_DATA_DIRECTORY,
+            filters=kwargs.get("list_clusters_filter"),
+        )
+        return
+
     user_input = UserInput(**kwargs)
 
     if user_input.dry_run:
         return
 
+    from openshift_cli_installer.libs.clusters.ocp_clusters import OCPClusters
+    from openshift_cli_installer.utils.clusters import destroy_clusters_from_s3_bucket_or_local_directory
+    from openshift_cli_installer.utils.gcp_utils import restore_gcp_configuration, set_gcp_configuration
+    from openshift_cli_installer.utils.installer_cache import release_installer_cache_entries
+
     gcp_params = set_gcp_configuration(user_input=user_input)
 
     try:
@@ -28,19 +45,18 @@ def cli_entrypoint(**kwargs: Any) -> None:
 
             try:
                 clusters = OCPClusters(user_input=user_input)
-                clusters.run_create_or_destroy_clusters()
+                clusters.run_destroy_clusters()
             finally:
                 shutil.rmtree(DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY, ignore_errors=True)
 
         else:
             user_input.destroy_from_s3_bucket_or_local_directory = False
             clusters = OCPClusters(user_input=user_input)
-            clusters.run_create_or_destroy_clusters()
-
             if user_input.action == CREATE_STR:
-                clusters.install_acm_on_clusters()
-                clusters.enable_observability_on_acm_clusters()
-                clusters.attach_clusters_to_acm_cluster_hub()
+                clusters.run_create_clusters_workflow()
+            else:
+                clusters.run_destroy_clusters()
 
     finally:
         restore_gcp_configuration(gcp_params=gcp_params)
+        release_installer_cache_entries()
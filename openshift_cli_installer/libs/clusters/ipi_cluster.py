@@ -6,6 +6,7 @@ import shlex
 import tempfile
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import partial
 from typing import Any
 
 import click
@@ -18,6 +19,7 @@ from openshift_cli_installer.libs.clusters.ocp_cluster import OCPCluster
 from openshift_cli_installer.libs.user_input import UserInput
 from openshift_cli_installer.utils.cluster_versions import (
     get_cluster_version_to_install,
+    get_ipi_cluster_version_index,
     get_ipi_cluster_versions,
     parse_openshift_release_url,
 )
@@ -27,8 +29,14 @@ from openshift_cli_installer.utils.general import (
     get_dict_from_json,
     get_install_config_j2_template,
     get_local_ssh_key,
+    run_single_flight,
     zip_and_upload_to_s3,
 )
+from openshift_cli_installer.utils.installer_cache import (
+    get_cached_openshift_install_binary,
+    get_installer_cache_key,
+)
+from openshift_cli_installer.utils.s3_index import get_s3_backup_index_entry
 
 
 class IpiCluster(OCPCluster):
@@ -43,6 +51,9 @@ class IpiCluster(OCPCluster):
             registry_config_file=self.user_input.registry_config_file,
             docker_config_file=self.user_input.docker_config_file,
         )
+        self.release_catalog_cache_dir = (
+            os.path.join(self.user_input.cache_dir, "release-catalog") if self.user_input.cache_dir else ""
+        )
         self.fips = self.cluster_info.get("fips")
         if self.fips:
             self.fips = self.fips.lower() == "true"
@@ -56,10 +67,14 @@ class IpiCluster(OCPCluster):
             self.cluster["ocm-env"] = self.cluster_info["ocm-env"] = PRODUCTION_STR
 
     def _prepare_ipi_cluster(self) -> None:
-        self.ipi_base_available_versions = get_ipi_cluster_versions()
+        self.ipi_base_available_versions = get_ipi_cluster_versions(
+            cache_dir=self.release_catalog_cache_dir, offline=self.user_input.offline_catalog
+        )
         self.cluster["version"] = get_cluster_version_to_install(
             wanted_version=self.cluster_info["user-requested-version"],
-            base_versions_dict=self.ipi_base_available_versions,
+            base_versions_dict=get_ipi_cluster_version_index(
+                cache_dir=self.release_catalog_cache_dir, offline=self.user_input.offline_catalog
+            ),
             platform=self.cluster_info["platform"],
             stream=self.cluster_info["stream"],
             log_prefix=self.log_prefix,
@@ -72,9 +87,32 @@ class IpiCluster(OCPCluster):
     def _ipi_download_installer(self) -> None:
         openshift_install_binary = f"openshift-install{'-fips' if self.fips else ''}"
         version_url = self.cluster_info["version-url"]
-        binary_dir = os.path.join(tempfile.TemporaryDirectory().name, version_url)
-        self.openshift_install_binary_path = os.path.join(binary_dir, openshift_install_binary)
 
+        # Clusters with the same version share a single extraction per run
+        self.openshift_install_binary_path = run_single_flight(
+            key=get_installer_cache_key(version_url=version_url, openshift_install_binary=openshift_install_binary),
+            func=partial(self._get_openshift_install_binary_path, openshift_install_binary=openshift_install_binary),
+        )
+
+    def _get_openshift_install_binary_path(self, openshift_install_binary: str) -> str:
+        extract_func = partial(
+            self._extract_openshift_install_binary, openshift_install_binary=openshift_install_binary
+        )
+
+        if self.user_input.cache_dir:
+            return get_cached_openshift_install_binary(
+                cache_dir=os.path.join(self.user_input.cache_dir, "installers"),
+                version_url=self.cluster_info["version-url"],
+                openshift_install_binary=openshift_install_binary,
+                extract_func=extract_func,
+            )
+
+        binary_dir = os.path.join(tempfile.TemporaryDirectory().name, self.cluster_info["version-url"])
+        extract_func(binary_dir)
+        return os.path.join(binary_dir, openshift_install_binary)
+
+    def _extract_openshift_install_binary(self, binary_dir: str, openshift_install_binary: str) -> None:
+        version_url = self.cluster_info["version-url"]
         with self._set_docker_config_file() as unified_pull_secret:
             rc, _, err = run_command(
                 command=shlex.split(
@@ -130,15 +168,15 @@ class IpiCluster(OCPCluster):
     def _set_install_version_url(self) -> None:
         version_url = None
         cluster_version = self.cluster["version"]
-        for tr in parse_openshift_release_url():
-            version = any(_tr for _tr in tr.text.splitlines() if cluster_version == _tr)
-            if version:
-                href = tr.find_all("a", attrs={"class": "text-success"})[0]["href"]
-                version_url_match = re.search(
-                    r"oc adm release extract --tools (.*?)<",
-                    requests.get(f"https://{next(iter(self.ipi_base_available_versions))}{href}").text,
-                )
-                version_url = version_url_match.group(1) if version_url_match else None
+        release_row = parse_openshift_release_url(
+            cache_dir=self.release_catalog_cache_dir, offline=self.user_input.offline_catalog
+        ).get(cluster_version)
+        if release_row and release_row.href:
+            version_url_match = re.search(
+                r"oc adm release extract --tools (.*?)<",
+                requests.get(f"https://{next(iter(self.ipi_base_available_versions))}{release_row.href}").text,
+            )
+            version_url = version_url_match.group(1) if version_url_match else None
 
         if version_url:
             self.cluster_info["version-url"] = version_url
@@ -182,11 +220,18 @@ class IpiCluster(OCPCluster):
             self.destroy_cluster()
             raise click.Abort()
 
-        self.timeout_watch = self.start_time_watcher()
-        res, _, _ = self.run_installer_command(action=CREATE_STR, raise_on_failure=False)
+        def _run_installer_create() -> None:
+            res, _, _ = self.run_installer_command(action=CREATE_STR, raise_on_failure=False)
+            if not res:
+                _rollback_on_error()
 
-        if not res:
-            _rollback_on_error()
+        self.raise_if_create_cancelled(phase="openshift-install create")
+        self.timeout_watch = self.start_time_watcher()
+        self.run_phase(
+            phase="openshift-install-create",
+            func=_run_installer_create,
+            resume_func=self.wait_for_install_complete,
+        )
 
         try:
             self.add_cluster_info_to_cluster_object()
@@ -200,8 +245,24 @@ class IpiCluster(OCPCluster):
                 install_dir=self.cluster_info["cluster-dir"],
                 s3_bucket_name=self.user_input.s3_bucket_name,
                 s3_bucket_object_name=self.cluster_info["s3-object-name"],
+                index_entry=get_s3_backup_index_entry(cluster_info=self.cluster_info),
             )
 
+    def wait_for_install_complete(self) -> bool:
+        """
+        Wait for an install started by a previous (killed) run, the install state is kept in the cluster directory.
+        """
+        self.logger.info(f"{self.log_prefix}: Waiting for install started by a previous run to complete")
+        res, _, _ = run_command(
+            command=shlex.split(
+                f"{self.openshift_install_binary_path} wait-for install-complete --dir"
+                f" {self.cluster_info['cluster-dir']} --log-level {self.log_level}"
+            ),
+            capture_output=False,
+            check=False,
+        )
+        return res
+
     def destroy_cluster(self) -> None:
         self.timeout_watch = self.start_time_watcher()
         self.run_installer_command(action=DESTROY_STR, raise_on_failure=True)
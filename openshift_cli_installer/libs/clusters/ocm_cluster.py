@@ -1,5 +1,5 @@
+import os
 import re
-import sys
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -10,23 +10,19 @@ from simple_logger.logger import get_logger
 
 from openshift_cli_installer.libs.clusters.ocp_cluster import OCPCluster
 from openshift_cli_installer.libs.user_input import UserInput
+from openshift_cli_installer.utils.cluster_versions import VersionIndex, get_ocm_version_index
 from openshift_cli_installer.utils.const import STAGE_STR
 
-version = sys.version_info
-if version[0] == 3 and version[1] < 9:
-    from functools import lru_cache as cache
-else:
-    from functools import cache  # type: ignore[no-redef]
-
 
 class OcmCluster(OCPCluster):
     def __init__(self, ocp_cluster: dict[str, Any], user_input: UserInput) -> None:
         super().__init__(ocp_cluster=ocp_cluster, user_input=user_input)
         self.logger = get_logger(f"{self.__class__.__module__}-{self.__class__.__name__}")
+        self.ocm_versions_cache_dir = (
+            os.path.join(self.user_input.cache_dir, "ocm-versions") if self.user_input.cache_dir else ""
+        )
 
         if not self.user_input.destroy_from_s3_bucket_or_local_directory:
-            self.osd_base_available_versions_dict: dict[str, dict[str, list[str]]] = {}
-            self.rosa_base_available_versions_dict: dict[str, dict[str, list[str]]] = {}
             self.cluster["channel-group"] = self.cluster_info["channel-group"] = self.cluster.get(
                 "channel-group", "stable"
             )
@@ -50,8 +46,15 @@ class OcmCluster(OCPCluster):
                 f"{(datetime.now(tz=UTC) + timedelta(seconds=_expiration_time)).isoformat()}"
             )
 
-    @cache  # noqa: B019
-    def get_osd_versions(self) -> None:
+    def get_osd_version_index(self) -> VersionIndex:
+        return get_ocm_version_index(
+            fetch_func=self._fetch_osd_versions,
+            ocm_env=self.cluster_info["ocm-env"],
+            channel_group=self.cluster_info["channel-group"],
+            cache_dir=self.ocm_versions_cache_dir,
+        )
+
+    def _fetch_osd_versions(self) -> dict[str, dict[str, list[str]]]:
         updated_versions_dict: dict[str, dict[str, list[str]]] = {}
         for channel, versions in (
             Versions(client=self.ocm_client).get(channel_group=self.cluster_info["channel-group"]).items()
@@ -61,4 +64,4 @@ class OcmCluster(OCPCluster):
                 _version_key = re.findall(r"^\d+.\d+", version)[0]
                 updated_versions_dict[channel].setdefault(_version_key, []).append(version)
 
-        self.osd_base_available_versions_dict.update(updated_versions_dict)
+        return updated_versions_dict
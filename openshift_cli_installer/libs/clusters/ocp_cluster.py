@@ -5,10 +5,11 @@ import copy
 import os
 import shlex
 import shutil
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections.abc import Callable, Iterable
 from datetime import timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 import botocore
 import click
@@ -18,7 +19,6 @@ from clouds.aws.aws_utils import aws_region_names, get_least_crowded_aws_vpc_reg
 from clouds.aws.session_clients import s3_client
 from kubernetes.dynamic import DynamicClient
 from ocm_python_client.api.default_api import DefaultApi
-from ocm_python_wrapper.ocm_client import OCMPythonClient
 from ocp_resources.cluster_version import ClusterVersion
 from ocp_resources.managed_cluster import ManagedCluster
 from ocp_resources.multi_cluster_hub import MultiClusterHub
@@ -34,29 +34,46 @@ from simple_logger.logger import get_logger
 from timeout_sampler import TimeoutWatch
 
 from openshift_cli_installer.libs.user_input import UserInput
+from openshift_cli_installer.utils.cluster_state import ClusterStateStore
 from openshift_cli_installer.utils.cluster_versions import (
     get_cluster_stream,
 )
+from openshift_cli_installer.utils.clusters import get_clusters_inventory
 from openshift_cli_installer.utils.const import (
     AWS_OSD_STR,
     AWS_STR,
+    CLUSTER_DATA_PERSISTED_KEYS,
     CLUSTER_DATA_YAML_FILENAME,
+    CLUSTER_PHASE_JOURNAL_FILENAME,
     HYPERSHIFT_STR,
     PRODUCTION_STR,
     S3_STR,
     STAGE_STR,
     TIMEOUT_60MIN,
 )
+from openshift_cli_installer.utils.ocm_client_pool import get_pooled_ocm_client
+from openshift_cli_installer.utils.phase_journal import PHASE_COMPLETED_STR, PHASE_STARTED_STR, PhaseJournal
+from openshift_cli_installer.utils.s3_index import update_s3_backup_index
 
-if TYPE_CHECKING:
-    from openshift_cli_installer.libs.clusters.ocp_clusters import OCPClusters
+
+class ClusterCreateCancelledError(Exception):
+    pass
 
 
 class OCPCluster:
     def __init__(self, ocp_cluster: dict[str, Any], user_input: UserInput) -> None:
         self.user_input = user_input
+        # Set by the scheduler to stop a create in its early phases (fail-fast)
+        self.cancel_event = threading.Event()
         self.logger = get_logger(f"{self.__class__.__module__}-{self.__class__.__name__}")
         self.cluster = ocp_cluster
+        # User input as given, before the run adds generated values (expiration time, OIDC config, subnets)
+        self.user_input_cluster: dict[str, Any] = copy.deepcopy(ocp_cluster)
+        self.phase_journal: PhaseJournal | None = None
+        self.cluster_state_store: ClusterStateStore | None = None
+        # Create phases recorded by a previous run, loaded with `--resume`
+        self.completed_phases: dict[str, dict[str, Any]] = {}
+        self.interrupted_phases: set[str] = set()
 
         self.s3_bucket_name = self.user_input.s3_bucket_name or self.cluster.get("cluster_info", {}).get(
             "s3_bucket_name", ""
@@ -78,7 +95,10 @@ class OCPCluster:
             self.cluster_info.update({
                 "display-name": self.cluster_info["name"],
                 "user-requested-version": self.cluster_info["version"],
-                "shortuuid": self.user_input.s3_bucket_path_uuid or self.cluster_shortuuid,
+                # Pinned in the run result manifest when retrying failed clusters
+                "shortuuid": self.user_input.s3_bucket_path_uuid
+                or self.cluster.get("shortuuid")
+                or self.cluster_shortuuid,
                 "aws-access-key-id": self.cluster.pop("aws-access-key-id", ""),
                 "aws-secret-access-key": self.cluster.pop("aws-secret-access-key", ""),
             })
@@ -111,6 +131,15 @@ class OCPCluster:
             self.cluster_info["auth-path"] = auth_path = os.path.join(cluster_dir, "auth")
             self.cluster_info["kubeconfig-path"] = os.path.join(auth_path, "kubeconfig")
             Path(auth_path).mkdir(parents=True, exist_ok=True)
+            if self.user_input.create:
+                self.phase_journal = PhaseJournal(
+                    journal_file=os.path.join(cluster_dir, CLUSTER_PHASE_JOURNAL_FILENAME)
+                )
+                if self.user_input.resume:
+                    self.completed_phases, self.interrupted_phases = self.phase_journal.load()
+                else:
+                    self.phase_journal.reset()
+
             if self.s3_bucket_name:
                 self._add_s3_bucket_data()
 
@@ -134,6 +163,65 @@ class OCPCluster:
     def to_dict(self) -> dict[str, Any]:
         return self.__dict__
 
+    def raise_if_create_cancelled(self, phase: str) -> None:
+        if self.cancel_event.is_set():
+            self.logger.warning(f"{self.log_prefix}: Cluster create cancelled before {phase}")
+            raise ClusterCreateCancelledError(f"{self.cluster_info['name']}: create cancelled before {phase}")
+
+    @property
+    def resumed(self) -> bool:
+        return bool(self.completed_phases or self.interrupted_phases)
+
+    def run_phase(
+        self,
+        phase: str,
+        func: Callable[[], Any],
+        restore_keys: Iterable[str] = (),
+        resume_func: Callable[[], bool] | None = None,
+    ) -> None:
+        """
+        Run a create phase and record it in the cluster phase journal.
+
+        With `--resume`, a phase completed by the previous run is skipped and its `restore_keys` values are
+        restored to the cluster data. For a phase interrupted by the previous run, `resume_func` is called first,
+        the phase runs again only if `resume_func` did not complete it.
+
+        Args:
+            phase (str): Phase name.
+            func (Callable): Run the phase.
+            restore_keys (Iterable): Cluster data keys set by the phase, needed by the next phases.
+            resume_func (Callable): Complete an interrupted phase, returns True if the phase is completed.
+        """
+        if phase in self.completed_phases:
+            self.logger.info(f"{self.log_prefix}: Phase {phase} completed by a previous run, skipping")
+            for _key, _value in self.completed_phases[phase].items():
+                self.cluster[_key] = self.cluster_info[_key] = _value
+
+            return
+
+        if phase in self.interrupted_phases and resume_func and resume_func():
+            self.logger.info(f"{self.log_prefix}: Phase {phase} interrupted by a previous run, resumed")
+        else:
+            if self.phase_journal:
+                self.phase_journal.record(phase=phase, event=PHASE_STARTED_STR)
+
+            func()
+
+        if self.phase_journal:
+            self.phase_journal.record(
+                phase=phase,
+                event=PHASE_COMPLETED_STR,
+                data={_key: self.cluster_info.get(_key, self.cluster.get(_key)) for _key in restore_keys},
+            )
+
+    def load_created_cluster(self) -> None:
+        """
+        Use a cluster created by a previous run (`--retry-failed`), ACM steps run against its kubeconfig.
+        """
+        self.logger.info(f"{self.log_prefix}: Cluster created by a previous run, skipping create")
+        self.timeout_watch = self.start_time_watcher()
+        self.ocp_client = get_client(config_file=self.cluster_info["kubeconfig-path"])
+
     def start_time_watcher(self) -> TimeoutWatch:
         if self.timeout_watch:
             self.logger.info(
@@ -157,12 +245,7 @@ class OCPCluster:
         self.ocm_client = self.get_ocm_client()
 
     def get_ocm_client(self) -> DefaultApi:
-        return OCMPythonClient(
-            token=self.user_input.ocm_token,
-            endpoint="https://sso.redhat.com/auth/realms/redhat-external/protocol/openid-connect/token",
-            api_host=self.cluster_info["ocm-env"],
-            discard_unknown_keys=True,
-        ).client
+        return get_pooled_ocm_client(ocm_token=self.user_input.ocm_token, ocm_env=self.cluster_info["ocm-env"])
 
     def _add_s3_bucket_data(self) -> None:
         object_name = (
@@ -183,40 +266,17 @@ class OCPCluster:
         if not self.user_input.create:
             return
 
-        _cluster_data = {}
-        keys_to_pop = (
-            "name",
-            "ocm_client",
-            "ocp_client",
-            "cluster_object",
-            "logger",
-            "clusters",
-            "user_kwargs",
-            "log_prefix",
-            "create",
-            "action",
-            "clusters_yaml_config_file",
-            "all_available_versions",
-            "gcp_service_account",
-            "osd_base_available_versions_dict",
-            "rosa_base_available_versions_dict",
-            "timeout",
-            "terraform",
-            "timeout_watch",
-            "ipi_base_available_versions",
-            "_already_processed",
-            "user_input",
-        )
-        for _key, _val in self.to_dict.items():
-            if _key in keys_to_pop or not _val:
-                continue
-
-            _cluster_data[_key] = _val
+        if not self.cluster_state_store:
+            self.cluster_state_store = ClusterStateStore(
+                state_file=os.path.join(self.cluster_info["cluster-dir"], CLUSTER_DATA_YAML_FILENAME)
+            )
 
-        _cluster_data_yaml_file = os.path.join(self.cluster_info["cluster-dir"], CLUSTER_DATA_YAML_FILENAME)
-        self.logger.info(f"{self.log_prefix}: Writing cluster data to {_cluster_data_yaml_file}")
-        with open(_cluster_data_yaml_file, "w") as fd:
-            fd.write(yaml.dump(_cluster_data))
+        _cluster_data = {_key: _val for _key in CLUSTER_DATA_PERSISTED_KEYS if (_val := getattr(self, _key, None))}
+        if self.cluster_state_store.save(state=_cluster_data):
+            self.logger.info(f"{self.log_prefix}: Cluster data written to {self.cluster_state_store.state_file}")
+            get_clusters_inventory(clusters_install_data_directory=self.user_input.clusters_install_data_directory).add(
+                cluster_dir=self.cluster_info["cluster-dir"], cluster_info=self.cluster_info
+            )
 
     def collect_must_gather(self) -> None:
         name: str = self.cluster_info["name"]
@@ -313,7 +373,14 @@ class OCPCluster:
     def delete_cluster_s3_buckets(self) -> None:
         if s3_file := self.cluster_info.get("s3-object-name"):
             self.logger.info(f"{self.log_prefix}: Deleting S3 file {s3_file} from {self.s3_bucket_name}")
-            s3_client().delete_object(Bucket=self.s3_bucket_name, Key=s3_file)
+            _s3_client = s3_client()
+            _s3_client.delete_object(Bucket=self.s3_bucket_name, Key=s3_file)
+            update_s3_backup_index(
+                client=_s3_client,
+                s3_bucket_name=self.s3_bucket_name,
+                s3_bucket_path=os.path.dirname(s3_file),
+                remove_object_key=s3_file,
+            )
             self.logger.success(f"{self.log_prefix}: {s3_file} deleted ")
 
     def install_acm(self) -> None:
@@ -407,38 +474,16 @@ class OCPCluster:
 
             raise click.Abort()
 
-    def attach_clusters_to_acm_hub(self, clusters: OCPClusters) -> None:
-        futures = []
-        with ThreadPoolExecutor() as executor:
-            for _managed_acm_cluster in self.cluster_info.get("acm-clusters", []):
-                _managed_acm_cluster_object = clusters.get_cluster_object_by_name(name=_managed_acm_cluster)
-                _managed_cluster_name = _managed_acm_cluster_object.cluster_info["name"]
-                managed_acm_cluster_kubeconfig = self.get_cluster_kubeconfig_from_install_dir(
-                    cluster_name=_managed_cluster_name,
-                    cluster_platform=_managed_acm_cluster_object.cluster_info["platform"],
-                )
-                action_kwargs = {
-                    "managed_acm_cluster_name": _managed_cluster_name,
-                    "acm_cluster_kubeconfig": self.cluster_info["kubeconfig-path"],
-                    "managed_acm_cluster_kubeconfig": managed_acm_cluster_kubeconfig,
-                }
-
-                self.logger.info(f"{self.log_prefix}: Attach {_managed_cluster_name} to ACM hub")
-
-                if self.user_input.parallel:
-                    futures.append(executor.submit(self.attach_cluster_to_acm, **action_kwargs))
-                else:
-                    self.attach_cluster_to_acm(**action_kwargs)
-
-            if futures:
-                for result in as_completed(futures):
-                    _exception = result.exception()
-                    if _exception:
-                        self.logger.error(
-                            f"{self.log_prefix}: Failed to attach"
-                            f" {_managed_cluster_name} to ACM hub Error: {_exception}"
-                        )
-                        raise click.Abort()
+    def get_attach_cluster_to_acm_kwargs(self, managed_acm_cluster: OCPCluster) -> dict[str, str]:
+        _managed_cluster_name = managed_acm_cluster.cluster_info["name"]
+        return {
+            "managed_acm_cluster_name": _managed_cluster_name,
+            "acm_cluster_kubeconfig": self.cluster_info["kubeconfig-path"],
+            "managed_acm_cluster_kubeconfig": self.get_cluster_kubeconfig_from_install_dir(
+                cluster_name=_managed_cluster_name,
+                cluster_platform=managed_acm_cluster.cluster_info["platform"],
+            ),
+        }
 
     def attach_cluster_to_acm(
         self,
@@ -1,30 +1,55 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 import click
-import rosa.cli
-from clouds.aws.aws_utils import set_and_verify_aws_credentials
-from clouds.gcp.utils import get_gcp_regions
-from ocm_python_wrapper.ocm_client import OCMPythonClient
 from simple_logger.logger import get_logger
 
-from openshift_cli_installer.libs.clusters.ipi_cluster import (
-    AwsIpiCluster,
-    GcpIpiCluster,
-)
-from openshift_cli_installer.libs.clusters.osd_cluster import OsdCluster
-from openshift_cli_installer.libs.clusters.rosa_cluster import RosaCluster
 from openshift_cli_installer.libs.user_input import UserInput
+from openshift_cli_installer.utils.clusters import get_existing_ocm_clusters_names
+from openshift_cli_installer.utils.clusters_inventory import ClustersInventory
 from openshift_cli_installer.utils.const import (
     AWS_OSD_STR,
     AWS_STR,
+    CLUSTER_STATUS_CANCELLED_STR,
+    CLUSTER_STATUS_CREATED_STR,
+    CLUSTER_STATUS_DESTROYED_STR,
+    CLUSTER_STATUS_FAILED_STR,
+    CLUSTER_STATUS_IN_PROGRESS_STR,
+    DESTROY_CLUSTER_ATTEMPTS,
+    DESTROY_CLUSTER_RETRY_BACKOFF_SECONDS,
+    DESTROY_PARTIAL_FAILURE_EXIT_CODE,
+    DESTROY_STR,
     GCP_OSD_STR,
     GCP_STR,
     HYPERSHIFT_STR,
-    PRODUCTION_STR,
+    OCM_MANAGED_PLATFORMS,
+    ON_FAILURE_DESTROY_ALL_STR,
+    ON_FAILURE_FAIL_FAST_STR,
+    ON_FAILURE_KEEP_SUCCESSFUL_STR,
+    PREPARE_CLUSTERS_MAX_WORKERS,
     ROSA_STR,
-    STAGE_STR,
 )
+from openshift_cli_installer.utils.dag_scheduler import DagResult, DagTask, run_dag
+from openshift_cli_installer.utils.general import run_single_flight
+from openshift_cli_installer.utils.run_manifest import (
+    get_retry_completed_tasks,
+    get_run_result_manifest_path,
+    write_run_result_manifest,
+)
+
+# Platform modules and cloud SDKs are imported when a cluster of the platform is processed
+if TYPE_CHECKING:
+    from ocm_python_wrapper.ocm_client import OCMPythonClient
+
+    from openshift_cli_installer.libs.clusters.ipi_cluster import AwsIpiCluster, GcpIpiCluster
+    from openshift_cli_installer.libs.clusters.osd_cluster import OsdCluster
+    from openshift_cli_installer.libs.clusters.rosa_cluster import RosaCluster
 
 
 class OCPClusters:
@@ -37,37 +62,104 @@ class OCPClusters:
         self.rosa_clusters: list[RosaCluster] = []
         self.hypershift_clusters: list[RosaCluster] = []
         self.gcp_osd_clusters: list[OsdCluster] = []
+        # Managed ACM clusters are looked up by name for every attach
+        self.clusters_by_name: dict[str, Any] = {}
 
         self.s3_target_dirs: list[str] = []
+        # Shared by all clusters, set on the first failure when `on_failure` is fail-fast
+        self.cancel_event = threading.Event()
+        # Set on the first failed create when `on_failure` is destroy-all, running creates are not interrupted
+        self.rollback_event = threading.Event()
+        # Tasks completed by the run retried with `--retry-failed`
+        self.retry_completed_tasks = (
+            get_retry_completed_tasks(manifest=self.user_input.run_result_manifest)
+            if self.user_input.run_result_manifest
+            else set()
+        )
 
-        for _cluster in user_input.clusters:
-            self.add_to_cluster_lists(ocp_cluster=_cluster)
+        self.prepare_clusters()
 
         if self.user_input.create:
-            self.check_ocm_managed_existing_clusters()
-            self.is_region_support_hypershift()
-            self.is_region_support_aws()
-            self.is_region_support_gcp()
+            self.run_preflight_checks()
+
+    def prepare_clusters(self) -> None:
+        """
+        Build all cluster objects concurrently.
+
+        Cluster objects constructors may call slow network operations (versions lookup, installer extraction,
+        OCM login etc.), they are executed in a bounded pool regardless of `--parallel`.
+        All failures are reported together before aborting.
+        """
+        futures: dict[Future[Any], dict[str, Any]] = {}
+        failed_clusters: list[str] = []
+
+        self.logger.info(f"Preparing {len(self.user_input.clusters)} cluster(s)")
+        with ThreadPoolExecutor(max_workers=PREPARE_CLUSTERS_MAX_WORKERS) as executor:
+            for _cluster in self.user_input.clusters:
+                futures[executor.submit(self.get_cluster_object, ocp_cluster=_cluster)] = _cluster
+
+        # Iterate in user input order to keep clusters lists order deterministic
+        for future, _cluster in futures.items():
+            if _exception := future.exception():
+                # Destroy from S3 / install data directory clusters only have `cluster_info`
+                _cluster_name = (
+                    _cluster.get("name") or _cluster.get("name-prefix") or _cluster.get("cluster_info", {}).get("name")
+                )
+                failed_clusters.append(f"{_cluster_name}: {_exception.__class__.__name__} {_exception}".strip())
+            else:
+                self.add_to_cluster_lists(cluster_object=future.result())
 
-    def add_to_cluster_lists(self, ocp_cluster: dict[str, Any]) -> None:
+        if failed_clusters:
+            _failed_clusters_str = "\n".join(failed_clusters)
+            self.logger.error(f"The following clusters failed to prepare:\n{_failed_clusters_str}")
+            raise click.Abort()
+
+    def get_cluster_object(self, ocp_cluster: dict[str, Any]) -> Any:
         _cluster_platform = ocp_cluster["platform"]
         if _cluster_platform == AWS_STR:
-            self.aws_ipi_clusters.append(AwsIpiCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            from openshift_cli_installer.libs.clusters.ipi_cluster import AwsIpiCluster
+
+            return AwsIpiCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+
+        if _cluster_platform == GCP_STR:
+            from openshift_cli_installer.libs.clusters.ipi_cluster import GcpIpiCluster
+
+            return GcpIpiCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+
+        if _cluster_platform in (AWS_OSD_STR, GCP_OSD_STR):
+            from openshift_cli_installer.libs.clusters.osd_cluster import OsdCluster
+
+            return OsdCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+
+        if _cluster_platform in (ROSA_STR, HYPERSHIFT_STR):
+            from openshift_cli_installer.libs.clusters.rosa_cluster import RosaCluster
+
+            return RosaCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+
+        self.logger.error(f"Unsupported platform {_cluster_platform}")
+        raise click.Abort()
+
+    def add_to_cluster_lists(self, cluster_object: Any) -> None:
+        cluster_object.cancel_event = self.cancel_event
+        self.clusters_by_name[cluster_object.cluster_info["name"]] = cluster_object
+        _cluster_platform = cluster_object.cluster_info["platform"]
+        if _cluster_platform == AWS_STR:
+            self.aws_ipi_clusters.append(cluster_object)
 
         if _cluster_platform == GCP_STR:
-            self.gcp_ipi_clusters.append(GcpIpiCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            self.gcp_ipi_clusters.append(cluster_object)
 
         if _cluster_platform == AWS_OSD_STR:
-            self.aws_osd_clusters.append(OsdCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            self.aws_osd_clusters.append(cluster_object)
 
         if _cluster_platform == ROSA_STR:
-            self.rosa_clusters.append(RosaCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            self.rosa_clusters.append(cluster_object)
 
         if _cluster_platform == HYPERSHIFT_STR:
-            self.hypershift_clusters.append(RosaCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            self.hypershift_clusters.append(cluster_object)
 
         if _cluster_platform == GCP_OSD_STR:
-            self.gcp_osd_clusters.append(OsdCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            self.gcp_osd_clusters.append(cluster_object)
 
     @property
     def list_clusters(self) -> list[Any]:
@@ -88,23 +180,67 @@ class OCPClusters:
     def ocm_managed_clusters(self) -> list[Any]:
         return self.aws_managed_clusters + self.gcp_osd_clusters
 
-    def check_ocm_managed_existing_clusters(self) -> None:
-        if self.ocm_managed_clusters:
-            self.logger.info("Check for existing OCM-managed clusters.")
-            existing_clusters_list = [
-                _cluster.cluster_info["name"]
-                for _cluster in self.ocm_managed_clusters
-                if _cluster.cluster_object.exists
-            ]
-
-            if existing_clusters_list:
-                self.logger.error(
-                    f"At least one cluster already exists: {existing_clusters_list}",
+    def run_preflight_checks(self) -> None:
+        """
+        Run all preflight checks concurrently and report all failures together.
+
+        Each check returns a list of failures; checks results (regions lists, credentials verification) are
+        shared for the whole run.
+        """
+        preflight_checks = (
+            self.check_ocm_managed_existing_clusters,
+            self.is_region_support_hypershift,
+            self.is_region_support_aws,
+            self.is_region_support_gcp,
+        )
+        failures: list[str] = []
+
+        with ThreadPoolExecutor(max_workers=len(preflight_checks)) as executor:
+            futures = {executor.submit(_check): _check.__name__ for _check in preflight_checks}
+
+        for future, _check_name in futures.items():
+            if _exception := future.exception():
+                failures.append(f"{_check_name}: {_exception.__class__.__name__} {_exception}".strip())
+            else:
+                failures.extend(future.result())
+
+        if failures:
+            _failures_str = "\n".join(failures)
+            self.logger.error(f"Preflight checks failed:\n{_failures_str}")
+            raise click.Abort()
+
+    def check_ocm_managed_existing_clusters(self) -> list[str]:
+        if not self.ocm_managed_clusters:
+            return []
+
+        self.logger.info("Check for existing OCM-managed clusters.")
+        clusters_by_ocm_env: dict[str, list[Any]] = {}
+        for _cluster in self.ocm_managed_clusters:
+            # Created by the run retried with `--retry-failed`, or submitted by the run resumed with `--resume`
+            if f"create:{_cluster.cluster_info['name']}" in self.retry_completed_tasks or _cluster.resumed:
+                continue
+
+            clusters_by_ocm_env.setdefault(_cluster.cluster_info["ocm-env"], []).append(_cluster)
+
+        existing_clusters_list: list[str] = []
+        for _clusters in clusters_by_ocm_env.values():
+            # All clusters of the same OCM environment share the same (pooled) OCM client
+            existing_clusters_list.extend(
+                get_existing_ocm_clusters_names(
+                    ocm_client=_clusters[0].ocm_client,
+                    names=[_cluster.cluster_info["name"] for _cluster in _clusters],
                 )
-                raise click.Abort()
+            )
+
+        if existing_clusters_list:
+            return [f"At least one cluster already exists: {sorted(existing_clusters_list)}"]
+
+        return []
 
     @staticmethod
     def _hypershift_regions(ocm_client: OCMPythonClient) -> list[str]:
+        import rosa.cli
+
         rosa_regions = rosa.cli.execute(
             command="list regions",
             aws_region="us-west-2",
@@ -112,107 +248,427 @@ class OCPClusters:
         )["out"]
         return [region["id"] for region in rosa_regions if region["supports_hypershift"] is True]
 
-    def is_region_support_hypershift(self) -> None:
-        if self.hypershift_clusters:
-            self.logger.info(f"Check if regions are {HYPERSHIFT_STR}-supported.")
-            unsupported_regions = []
-            hypershift_regions_dict: dict[str, list[str]] = {PRODUCTION_STR: [], STAGE_STR: []}
-            for _cluster in self.hypershift_clusters:
-                region = _cluster.cluster_info["region"]
-                ocm_env = _cluster.cluster_info["ocm-env"]
-                _hypershift_regions: list[str] = hypershift_regions_dict[ocm_env]
-                if not _hypershift_regions:
-                    _hypershift_regions = self._hypershift_regions(ocm_client=_cluster.ocm_client)
-                    hypershift_regions_dict[ocm_env] = _hypershift_regions
-
-                if region not in _hypershift_regions:
-                    unsupported_regions.append(f"Cluster {_cluster.cluster_info['name']}, region: {region}\n")
-
-                if unsupported_regions:
-                    self.logger.error(
-                        f"The following {HYPERSHIFT_STR} clusters regions are no"
-                        f" supported: {unsupported_regions}.\nSupported hypershift"
-                        f" regions are: {_hypershift_regions}",
-                    )
-                    raise click.Abort()
+    def is_region_support_hypershift(self) -> list[str]:
+        if not self.hypershift_clusters:
+            return []
+
+        self.logger.info(f"Check if regions are {HYPERSHIFT_STR}-supported.")
+        unsupported_regions = []
+        for _cluster in self.hypershift_clusters:
+            region = _cluster.cluster_info["region"]
+            ocm_env = _cluster.cluster_info["ocm-env"]
+            _hypershift_regions = run_single_flight(
+                key=f"hypershift-regions|{ocm_env}",
+                func=partial(self._hypershift_regions, ocm_client=_cluster.ocm_client),
+            )
+            if region not in _hypershift_regions:
+                unsupported_regions.append(
+                    f"{HYPERSHIFT_STR} cluster {_cluster.cluster_info['name']}, region: {region} is not supported;"
+                    f" supported regions in {ocm_env}: {_hypershift_regions}"
+                )
+
+        return unsupported_regions
 
-    def is_region_support_aws(self) -> None:
+    def is_region_support_aws(self) -> list[str]:
         _clusters = self.aws_ipi_clusters + self.aws_managed_clusters
-        if _clusters:
-            self.logger.info(f"Check if regions are {AWS_STR}-supported.")
-            _regions_to_verify = set()
-            for _cluster in self.aws_ipi_clusters + self.aws_managed_clusters:
-                _regions_to_verify.add(_cluster.cluster_info["region"])
-
-            for _region in _regions_to_verify:
-                set_and_verify_aws_credentials(region_name=_region)
-
-    def is_region_support_gcp(self) -> None:
-        if _clusters := self.gcp_ipi_clusters + self.gcp_osd_clusters:
-            self.logger.info(f"Check if regions are {GCP_STR}-supported.")
-            supported_regions = get_gcp_regions(gcp_service_account_file=self.user_input.gcp_service_account_file)
-            unsupported_regions = []
-            for _cluster in _clusters:
-                cluster_region = _cluster.cluster_info["region"]
-                if cluster_region not in supported_regions:
-                    unsupported_regions.append(f"cluster: {_cluster.cluster_info['name']}, region: {cluster_region}")
-
-            if unsupported_regions:
-                self.logger.error("The following clusters regions are not supported in GCP: {unsupported_regions}")
-                raise click.Abort()
-
-    def run_create_or_destroy_clusters(self) -> None:
-        futures: list[Any] = []
-        action_str = "create_cluster" if self.user_input.create else "destroy_cluster"
-
-        with ThreadPoolExecutor() as executor:
-            for cluster in self.list_clusters:
-                action_func = getattr(cluster, action_str)
-                self.logger.info(
-                    f"Executing {self.user_input.action} cluster {cluster.cluster_info['name']} "
-                    f"[parallel: {self.user_input.parallel}]"
+        if not _clusters:
+            return []
+
+        from clouds.aws.aws_utils import set_and_verify_aws_credentials
+
+        self.logger.info(f"Check if regions are {AWS_STR}-supported.")
+        _regions_to_verify = {_cluster.cluster_info["region"] for _cluster in _clusters}
+        with ThreadPoolExecutor(max_workers=PREPARE_CLUSTERS_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    run_single_flight,
+                    key=f"aws-region|{self.user_input.aws_account_id}|{_region}",
+                    func=partial(set_and_verify_aws_credentials, region_name=_region),
+                ): _region
+                for _region in sorted(_regions_to_verify)
+            }
+
+        unsupported_regions = []
+        for future, _region in futures.items():
+            if _exception := future.exception():
+                _clusters_names = [
+                    _cluster.cluster_info["name"]
+                    for _cluster in _clusters
+                    if _cluster.cluster_info["region"] == _region
+                ]
+                unsupported_regions.append(
+                    f"{AWS_STR} region: {_region} (clusters: {_clusters_names}) failed verification:"
+                    f" {_exception.__class__.__name__} {_exception}"
                 )
-                if self.user_input.parallel:
-                    futures.append(executor.submit(action_func))
-                else:
-                    action_func()
-
-            if futures:
-                self.process_create_destroy_clusters_threads_results(futures=futures)
-
-    def process_create_destroy_clusters_threads_results(self, futures: list[Any]) -> None:
-        create_clusters_error = False
-        for result in as_completed(futures):
-            _exception = result.exception()
-            if _exception:
-                if self.user_input.create:
-                    create_clusters_error = True
-                else:
-                    raise click.Abort()
 
-        # If one cluster failed to create we want to destroy all clusters
-        if create_clusters_error:
-            self.user_input.create = False
-            self.logger.error("One cluster failed to create, destroying all clusters")
-            self.run_create_or_destroy_clusters()
-            raise click.Abort()
+        return unsupported_regions
 
-    def attach_clusters_to_acm_cluster_hub(self) -> None:
-        for cluster in self.list_clusters:
-            if cluster.cluster_info.get("acm-clusters"):
-                cluster.attach_clusters_to_acm_hub(clusters=self)
+    def is_region_support_gcp(self) -> list[str]:
+        _clusters = self.gcp_ipi_clusters + self.gcp_osd_clusters
+        if not _clusters:
+            return []
 
-    def get_cluster_object_by_name(self, name: str) -> Any:
+        from clouds.gcp.utils import get_gcp_regions
+
+        self.logger.info(f"Check if regions are {GCP_STR}-supported.")
+        supported_regions = run_single_flight(
+            key=f"gcp-regions|{self.user_input.gcp_service_account_file}",
+            func=partial(get_gcp_regions, gcp_service_account_file=self.user_input.gcp_service_account_file),
+        )
+        return [
+            f"{GCP_STR} cluster: {_cluster.cluster_info['name']}, region: {_cluster.cluster_info['region']}"
+            " is not supported"
+            for _cluster in _clusters
+            if _cluster.cluster_info["region"] not in supported_regions
+        ]
+
+    @property
+    def max_parallel(self) -> int | None:
+        return (self.user_input.max_parallel or None) if self.user_input.parallel else 1
+
+    def get_cluster_concurrency_limits(self, cluster: Any) -> tuple[str, ...]:
+        """
+        Get the concurrency limits a cluster create/destroy counts against.
+
+        Limits are configured in `concurrency_limits` (clusters YAML file), see `get_concurrency_limits`.
+        """
+        _platform = cluster.cluster_info["platform"]
+        _region = cluster.cluster_info.get("region", "")
+        limits = [f"platform:{_platform}", f"platform-per-region:{_platform}:{_region}", f"region:{_region}"]
+        if _platform in OCM_MANAGED_PLATFORMS:
+            limits.append(f"ocm-env:{cluster.cluster_info['ocm-env']}")
+
+        return tuple(limits)
+
+    def get_concurrency_limits(self) -> dict[str, int]:
+        """
+        Translate `concurrency_limits` user input to scheduler limits.
+
+        Example:
+            concurrency_limits:
+              platform:             # per platform
+                aws: 5
+              platform-per-region:  # per platform in each region
+                hypershift: 3
+              region:               # per region, all platforms
+                us-east-2: 6
+              ocm-env:              # per OCM environment, OCM-managed platforms
+                stage: 5
+        """
+        limits: dict[str, int] = {}
+        user_limits = self.user_input.concurrency_limits
         for _cluster in self.list_clusters:
-            if _cluster.cluster_info["name"] == name:
-                return _cluster
+            for _limit in self.get_cluster_concurrency_limits(cluster=_cluster):
+                _limit_type, _limit_key = _limit.split(":", 1)
+                if _limit_type == "platform-per-region":
+                    _limit_value = user_limits.get(_limit_type, {}).get(_limit_key.split(":", 1)[0])
+                else:
+                    _limit_value = user_limits.get(_limit_type, {}).get(_limit_key)
+
+                if _limit_value:
+                    limits[_limit] = _limit_value
 
-    def install_acm_on_clusters(self) -> None:
+        return limits
+
+    @property
+    def fail_fast(self) -> bool:
+        return self.user_input.on_failure == ON_FAILURE_FAIL_FAST_STR
+
+    def run_destroy_clusters(self) -> None:
+        self.report_destroy_clusters_result(result=self.destroy_clusters(clusters=self.list_clusters))
+
+    def destroy_clusters(self, clusters: list[Any]) -> DagResult:
+        tasks = []
+        for cluster in clusters:
+            self.logger.info(
+                f"Executing destroy cluster {cluster.cluster_info['name']} [parallel: {self.user_input.parallel}]"
+            )
+            tasks.append(
+                DagTask(
+                    name=f"destroy_cluster:{cluster.cluster_info['name']}",
+                    func=partial(self.destroy_cluster_with_retries, cluster=cluster),
+                    limits=self.get_cluster_concurrency_limits(cluster=cluster),
+                )
+            )
+
+        return run_dag(tasks=tasks, max_workers=self.max_parallel, limits=self.get_concurrency_limits())
+
+    def destroy_cluster_with_retries(self, cluster: Any) -> None:
+        """
+        Destroy a cluster, failed attempts are retried with exponential backoff.
+
+        Destroy is idempotent (already deleted resources are skipped), transient failures (cloud API throttling,
+        OCM errors, stuck deletions) are retried up to DESTROY_CLUSTER_ATTEMPTS times.
+        """
+        for _attempt in range(1, DESTROY_CLUSTER_ATTEMPTS + 1):
+            try:
+                cluster.destroy_cluster()
+                ClustersInventory(
+                    clusters_install_data_directory=self.user_input.clusters_install_data_directory
+                ).remove(cluster_dir=cluster.cluster_info["cluster-dir"])
+                return
+
+            except Exception as ex:
+                if _attempt == DESTROY_CLUSTER_ATTEMPTS:
+                    raise
+
+                _backoff = DESTROY_CLUSTER_RETRY_BACKOFF_SECONDS * 2 ** (_attempt - 1)
+                self.logger.warning(
+                    f"Failed to destroy cluster {cluster.cluster_info['name']} "
+                    f"[attempt {_attempt}/{DESTROY_CLUSTER_ATTEMPTS}], retrying in {_backoff} seconds. "
+                    f"error: {ex.__class__.__name__} {ex}".strip()
+                )
+                time.sleep(_backoff)
+
+    def report_destroy_clusters_result(self, result: DagResult) -> None:
+        """
+        Log a per-cluster destroy summary once all clusters were processed.
+
+        Raises:
+            click.Abort: All clusters failed to destroy, or clusters failed to destroy after a failed create.
+            click.exceptions.Exit: Some clusters failed to destroy (DESTROY_PARTIAL_FAILURE_EXIT_CODE).
+        """
+        _summary = [f"{_task_name.split(':', 1)[1]}: destroyed" for _task_name in result.succeeded]
+        _summary.extend(
+            f"{_task_name.split(':', 1)[1]}: failed, {_exception.__class__.__name__} {_exception}".strip()
+            for _task_name, _exception in result.failed.items()
+        )
+        _summary_str = "\n".join(_summary)
+        if not result.failed:
+            self.logger.success(f"Destroy summary, {len(result.succeeded)} cluster(s) destroyed:\n{_summary_str}")
+            return
+
+        self.logger.error(
+            f"Destroy summary, {len(result.failed)} of {len(result.failed) + len(result.succeeded)} "
+            f"cluster(s) failed to destroy:\n{_summary_str}"
+        )
+        if result.succeeded and self.user_input.action == DESTROY_STR:
+            raise click.exceptions.Exit(code=DESTROY_PARTIAL_FAILURE_EXIT_CODE)
+
+        raise click.Abort()
+
+    def get_rollback_clusters(self, created_clusters_names: list[str]) -> list[Any]:
+        """
+        Get the clusters to destroy after a cluster failed to create, according to `on_failure` policy.
+
+        destroy-all: all clusters are destroyed.
+        fail-fast: only created clusters are destroyed, failed creates clean their own leftovers and cancelled
+            creates did not create anything.
+        keep-successful: created clusters are kept, failed clusters can be created again with `--retry-failed`.
+        """
+        if self.user_input.on_failure == ON_FAILURE_KEEP_SUCCESSFUL_STR:
+            return []
+
+        if self.fail_fast:
+            return [self.get_cluster_object_by_name(name=_name) for _name in created_clusters_names]
+
+        return self.list_clusters
+
+    def rollback_clusters_create(self, clusters: list[Any]) -> DagResult | None:
+        """
+        Destroy `clusters` after a cluster failed to create.
+
+        Returns:
+            DagResult: Destroy result, None if there is no cluster to destroy.
+        """
+        if not clusters:
+            self.logger.error(
+                f"One cluster failed to create, no cluster to destroy [on-failure: {self.user_input.on_failure}]"
+            )
+            return None
+
+        self.logger.error(
+            f"One cluster failed to create, destroying clusters: {[_cluster.cluster_info['name'] for _cluster in clusters]}"
+            f" [on-failure: {self.user_input.on_failure}]"
+        )
+        self.user_input.create = False
+        return self.destroy_clusters(clusters=clusters)
+
+    def get_create_clusters_tasks(self) -> list[DagTask]:
+        """
+        Build the create workflow tasks graph.
+
+        ACM install on a hub starts once the hub is created, observability once ACM is installed on it and
+        each managed cluster is attached once both the hub has ACM installed and the managed cluster is created.
+        With destroy-all `on_failure` policy, a failed create cancels the ACM tasks not started yet, all clusters are
+        destroyed anyway; running creates continue.
+        """
+        tasks: list[DagTask] = []
         for _cluster in self.list_clusters:
+            _name = _cluster.cluster_info["name"]
+            tasks.append(
+                DagTask(
+                    name=f"create:{_name}",
+                    func=partial(
+                        self.run_create_task,
+                        func=_cluster.load_created_cluster
+                        if f"create:{_name}" in self.retry_completed_tasks
+                        else _cluster.create_cluster,
+                    ),
+                    limits=self.get_cluster_concurrency_limits(cluster=_cluster),
+                    cancellable=self.fail_fast,
+                )
+            )
+
             if _cluster.cluster_info["acm"]:
-                _cluster.install_acm()
+                tasks.append(
+                    DagTask(
+                        name=f"install-acm:{_name}",
+                        func=partial(_cluster.run_phase, phase="install-acm", func=_cluster.install_acm),
+                        dependencies=(f"create:{_name}",),
+                    )
+                )
+
+                if _cluster.cluster_info["acm-observability"]:
+                    tasks.append(
+                        DagTask(
+                            name=f"enable-observability:{_name}",
+                            func=partial(
+                                _cluster.run_phase, phase="enable-observability", func=_cluster.enable_observability
+                            ),
+                            dependencies=(f"install-acm:{_name}",),
+                        )
+                    )
 
-    def enable_observability_on_acm_clusters(self) -> None:
         for _cluster in self.list_clusters:
-            if _cluster.cluster_info["acm"] and _cluster.cluster_info["acm-observability"]:
-                _cluster.enable_observability()
+            _hub_name = _cluster.cluster_info["name"]
+            for _managed_cluster_name in _cluster.cluster_info.get("acm-clusters") or []:
+                _managed_cluster = self.get_cluster_object_by_name(name=_managed_cluster_name)
+                tasks.append(
+                    DagTask(
+                        name=f"attach:{_hub_name}:{_managed_cluster_name}",
+                        func=partial(self.attach_cluster_to_acm_hub, hub=_cluster, managed_cluster=_managed_cluster),
+                        dependencies=(f"install-acm:{_hub_name}", f"create:{_managed_cluster_name}"),
+                    )
+                )
+
+        return [
+            _task._replace(func=partial(self.logger.info, f"{_task.name}: completed by a previous run, skipping"))
+            if _task.name in self.retry_completed_tasks and not _task.name.startswith("create:")
+            else _task
+            for _task in tasks
+        ]
+
+    def run_create_task(self, func: Callable[[], Any]) -> None:
+        try:
+            func()
+        except Exception:
+            if self.user_input.on_failure == ON_FAILURE_DESTROY_ALL_STR:
+                self.rollback_event.set()
+
+            raise
+
+    @staticmethod
+    def attach_cluster_to_acm_hub(hub: Any, managed_cluster: Any) -> None:
+        hub.run_phase(
+            phase=f"attach:{managed_cluster.cluster_info['name']}",
+            func=partial(
+                hub.attach_cluster_to_acm, **hub.get_attach_cluster_to_acm_kwargs(managed_acm_cluster=managed_cluster)
+            ),
+        )
+
+    def run_create_clusters_workflow(self) -> None:
+        """
+        Create clusters, install ACM, enable observability and attach managed clusters, each step starts as soon
+        as the steps it depends on are done.
+
+        If a cluster failed to create, clusters are destroyed according to `on_failure` policy, see
+        `get_rollback_clusters`.
+        With `--retry-failed`, tasks completed by the previous run are not executed again; with `--resume`,
+        clusters continue from their last completed phase (see `OCPCluster.run_phase`).
+        """
+        self.logger.info(f"Executing create clusters workflow [parallel: {self.user_input.parallel}]")
+        # Written before the clusters are created, a killed run can be continued with `--resume`
+        self.write_run_result_manifest(result=DagResult(succeeded=[], failed={}, skipped=[], cancelled=[]))
+        result = run_dag(
+            tasks=self.get_create_clusters_tasks(),
+            max_workers=self.max_parallel,
+            limits=self.get_concurrency_limits(),
+            **self.get_create_clusters_cancel_kwargs(),
+        )
+
+        if result.failed:
+            _failed_str = "\n".join(
+                f"{_task_name}: {_exception.__class__.__name__} {_exception}".strip()
+                for _task_name, _exception in result.failed.items()
+            )
+            self.logger.error(f"The following tasks failed:\n{_failed_str}")
+            if result.skipped:
+                self.logger.error(f"The following tasks were skipped: {result.skipped}")
+
+            if result.cancelled:
+                self.logger.error(f"The following tasks were cancelled: {result.cancelled}")
+
+        rollback_result = None
+        # A cluster failed to create or was cancelled, the requested clusters set is incomplete
+        if any(_task_name.startswith("create:") for _task_name in [*result.failed, *result.cancelled]):
+            rollback_result = self.rollback_clusters_create(
+                clusters=self.get_rollback_clusters(
+                    created_clusters_names=[
+                        _task_name.split(":", 1)[1]
+                        for _task_name in result.succeeded
+                        if _task_name.startswith("create:")
+                    ]
+                )
+            )
+
+        # Written once the rollback is done, clusters which failed to destroy are still live
+        self.write_run_result_manifest(result=result, rollback_result=rollback_result)
+        if rollback_result:
+            self.report_destroy_clusters_result(result=rollback_result)
+
+        if result.failed:
+            raise click.Abort()
+
+    def get_create_clusters_cancel_kwargs(self) -> dict[str, Any]:
+        if self.fail_fast:
+            return {"cancel_event": self.cancel_event}
+
+        if self.user_input.on_failure == ON_FAILURE_DESTROY_ALL_STR:
+            # Only a failed create sets the event, see `run_create_task`
+            return {"cancel_event": self.rollback_event, "cancel_on_failure": False}
+
+        return {}
+
+    def write_run_result_manifest(self, result: DagResult, rollback_result: DagResult | None = None) -> None:
+        """
+        Write the create run result manifest next to the clusters install data directory, used by `--retry-failed`
+        and `--resume`.
+
+        Clusters destroyed by the rollback (`rollback_result`) are `destroyed`, clusters which failed to destroy are
+        `failed`.
+        """
+        rollback_result = rollback_result or DagResult(succeeded=[], failed={}, skipped=[], cancelled=[])
+        destroyed_clusters_names = {_task_name.split(":", 1)[1] for _task_name in rollback_result.succeeded}
+        destroy_failed_clusters_names = {_task_name.split(":", 1)[1] for _task_name in rollback_result.failed}
+        clusters_statuses: dict[str, str] = {}
+        for _cluster in self.list_clusters:
+            _name = _cluster.cluster_info["name"]
+            if f"create:{_name}" not in [*result.succeeded, *result.failed, *result.cancelled]:
+                clusters_statuses[_name] = CLUSTER_STATUS_IN_PROGRESS_STR
+            elif _name in destroyed_clusters_names:
+                clusters_statuses[_name] = CLUSTER_STATUS_DESTROYED_STR
+            elif _name in destroy_failed_clusters_names:
+                clusters_statuses[_name] = CLUSTER_STATUS_FAILED_STR
+            elif f"create:{_name}" in result.succeeded:
+                clusters_statuses[_name] = CLUSTER_STATUS_CREATED_STR
+            elif f"create:{_name}" in result.cancelled:
+                clusters_statuses[_name] = CLUSTER_STATUS_CANCELLED_STR
+            else:
+                clusters_statuses[_name] = CLUSTER_STATUS_FAILED_STR
+
+        try:
+            write_run_result_manifest(
+                manifest_path=get_run_result_manifest_path(
+                    clusters_install_data_directory=self.user_input.clusters_install_data_directory
+                ),
+                clusters=self.list_clusters,
+                clusters_statuses=clusters_statuses,
+                result=result,
+                on_failure=self.user_input.on_failure,
+            )
+        except OSError as ex:
+            self.logger.error(f"Failed to write run result manifest. error: {ex}")
+
+    def get_cluster_object_by_name(self, name: str) -> Any:
+        return self.clusters_by_name.get(name)
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Any
 
 import click
@@ -8,6 +9,7 @@ from openshift_cli_installer.libs.user_input import UserInput
 from openshift_cli_installer.utils.cluster_versions import get_cluster_version_to_install
 from openshift_cli_installer.utils.const import AWS_OSD_STR, GCP_OSD_STR
 from openshift_cli_installer.utils.general import get_dict_from_json, zip_and_upload_to_s3
+from openshift_cli_installer.utils.s3_index import get_s3_backup_index_entry
 
 
 class OsdCluster(OcmCluster):
@@ -22,10 +24,9 @@ class OsdCluster(OcmCluster):
 
         if self.user_input.create:
             self.cluster_info["aws-account-id"] = self.user_input.aws_account_id
-            self.get_osd_versions()
             self.cluster["version"] = get_cluster_version_to_install(
                 wanted_version=self.cluster_info["user-requested-version"],
-                base_versions_dict=self.osd_base_available_versions_dict,
+                base_versions_dict=self.get_osd_version_index(),
                 platform=platform,
                 stream=self.cluster_info["stream"],
                 log_prefix=self.log_prefix,
@@ -35,6 +36,7 @@ class OsdCluster(OcmCluster):
             self.dump_cluster_data_to_file()
 
     def create_cluster(self) -> None:
+        self.raise_if_create_cancelled(phase="OSD cluster provision")
         self.timeout_watch = self.start_time_watcher()
         try:
             ocp_version = (
@@ -67,7 +69,12 @@ class OsdCluster(OcmCluster):
             elif self.cluster_info["platform"] == GCP_OSD_STR:
                 provision_osd_kwargs.update({"gcp_service_account": self.gcp_service_account})
 
-            self.cluster_object.provision_osd(**provision_osd_kwargs)
+            self.run_phase(
+                phase="osd-provision",
+                func=partial(self.cluster_object.provision_osd, **provision_osd_kwargs),
+                # The previous run was killed after the cluster was submitted
+                resume_func=self.wait_for_provisioned_cluster_ready,
+            )
             self.add_cluster_info_to_cluster_object()
             self.set_cluster_auth()
 
@@ -90,8 +97,16 @@ class OsdCluster(OcmCluster):
                 install_dir=self.cluster_info["cluster-dir"],
                 s3_bucket_name=self.s3_bucket_name,
                 s3_bucket_object_name=self.cluster_info["s3-object-name"],
+                index_entry=get_s3_backup_index_entry(cluster_info=self.cluster_info),
             )
 
+    def wait_for_provisioned_cluster_ready(self) -> bool:
+        if not self.cluster_object.exists:
+            return False
+
+        self.cluster_object.wait_for_cluster_ready(wait_timeout=self.timeout_watch.remaining_time())
+        return True
+
     def destroy_cluster(self) -> None:
         self.timeout_watch = self.start_time_watcher()
         try:
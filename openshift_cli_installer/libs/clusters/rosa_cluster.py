@@ -1,8 +1,8 @@
 import os
 import re
 import secrets
-import shutil
 import string
+from functools import partial
 from typing import Any
 
 import click
@@ -16,12 +16,18 @@ from timeout_sampler import TimeoutSampler
 
 from openshift_cli_installer.libs.clusters.ocm_cluster import OcmCluster
 from openshift_cli_installer.libs.user_input import UserInput
-from openshift_cli_installer.utils.cluster_versions import get_cluster_version_to_install
-from openshift_cli_installer.utils.const import HYPERSHIFT_STR
+from openshift_cli_installer.utils.cluster_versions import get_cluster_version_to_install, get_ocm_version_index
+from openshift_cli_installer.utils.const import HYPERSHIFT_STR, HYPERSHIFT_TERRAFORM_FILENAME
 from openshift_cli_installer.utils.general import (
     get_manifests_path,
     zip_and_upload_to_s3,
 )
+from openshift_cli_installer.utils.s3_index import get_s3_backup_index_entry
+from openshift_cli_installer.utils.terraform_cache import (
+    get_terraform_cache_dir,
+    get_terraform_template_dir,
+    prepare_terraform_working_dir,
+)
 
 
 class RosaCluster(OcmCluster):
@@ -31,15 +37,23 @@ class RosaCluster(OcmCluster):
         if self.user_input.create:
             self.cluster_info["aws-account-id"] = self.user_input.aws_account_id
             self.assert_hypershift_missing_roles()
-            self.rosa_base_available_versions_dict = get_rosa_versions(
-                ocm_client=self.ocm_client,
-                aws_region=self.cluster_info["region"],
+            rosa_version_index = get_ocm_version_index(
+                fetch_func=partial(
+                    get_rosa_versions,
+                    ocm_client=self.ocm_client,
+                    aws_region=self.cluster_info["region"],
+                    channel_group=self.cluster_info["channel-group"],
+                    hosted_cp=self.cluster_info["platform"] == HYPERSHIFT_STR,
+                ),
+                ocm_env=self.cluster_info["ocm-env"],
                 channel_group=self.cluster_info["channel-group"],
+                region=self.cluster_info["region"],
                 hosted_cp=self.cluster_info["platform"] == HYPERSHIFT_STR,
+                cache_dir=self.ocm_versions_cache_dir,
             )
             self.cluster["version"] = get_cluster_version_to_install(
                 wanted_version=self.cluster_info["user-requested-version"],
-                base_versions_dict=self.rosa_base_available_versions_dict,
+                base_versions_dict=rosa_version_index,
                 platform=self.cluster_info["platform"],
                 stream=self.cluster_info["stream"],
                 log_prefix=self.log_prefix,
@@ -75,12 +89,19 @@ class RosaCluster(OcmCluster):
         if public_subnets:
             cluster_parameters["public_subnets"] = public_subnets
 
-        self.terraform = Terraform(working_dir=self.cluster_info["cluster-dir"], variables=cluster_parameters)
-        shutil.copy(
-            os.path.join(get_manifests_path(), "setup-vpc.tf"),
-            self.cluster_info["cluster-dir"],
+        # The VPC module and the AWS provider are downloaded once to a template shared by all hypershift clusters
+        terraform_template_dir = get_terraform_template_dir(
+            terraform_cache_dir=get_terraform_cache_dir(cache_dir=self.user_input.cache_dir),
+            terraform_file=os.path.join(get_manifests_path(), HYPERSHIFT_TERRAFORM_FILENAME),
+            provider_mirror_dir=self.user_input.terraform_provider_mirror,
         )
-        rc, out, err = self.terraform.init()
+        terraform_providers_dir = prepare_terraform_working_dir(
+            template_dir=terraform_template_dir,
+            working_dir=self.cluster_info["cluster-dir"],
+            terraform_file_name=HYPERSHIFT_TERRAFORM_FILENAME,
+        )
+        self.terraform = Terraform(working_dir=self.cluster_info["cluster-dir"], variables=cluster_parameters)
+        rc, out, err = self.terraform.init(input=False, plugin_dir=terraform_providers_dir)
         if rc != 0:
             self.logger.error(f"{self.log_prefix}: Terraform init failed. Err: {err}, Out: {out}")
             raise click.Abort()
@@ -209,32 +230,37 @@ class RosaCluster(OcmCluster):
         return command
 
     def create_cluster(self) -> None:
-        idp_user, idp_password = "", ""
-
+        self.raise_if_create_cancelled(phase="cluster resources creation")
         self.timeout_watch = self.start_time_watcher()
         if self.cluster_info["platform"] == HYPERSHIFT_STR:
-            self.create_oidc()
-            self.create_operator_role()
-            self.prepare_hypershift_vpc()
+            self.run_phase(phase="oidc", func=self.create_oidc, restore_keys=("oidc-config-id",))
+            self.run_phase(phase="operator-roles", func=self.create_operator_role)
+            self.run_phase(phase="vpc", func=self.prepare_hypershift_vpc, restore_keys=("subnet-ids",))
 
         self.dump_cluster_data_to_file()
 
         try:
-            rosa.cli.execute(
-                command=self.build_rosa_command(),
-                ocm_client=self.ocm_client,
-                aws_region=self.cluster_info["region"],
+            if self.cluster_info["platform"] == HYPERSHIFT_STR:
+                # Hypershift resources (OIDC, operator roles, VPC) are cleaned by `destroy_cluster` below
+                self.raise_if_create_cancelled(phase="rosa create cluster")
+
+            self.run_phase(
+                phase="rosa-create",
+                func=partial(
+                    rosa.cli.execute,
+                    command=self.build_rosa_command(),
+                    ocm_client=self.ocm_client,
+                    aws_region=self.cluster_info["region"],
+                ),
+                # The previous run was killed after the cluster was submitted
+                resume_func=lambda: bool(self.cluster_object.exists),
             )
 
             self.cluster_object.wait_for_cluster_ready(wait_timeout=self.timeout_watch.remaining_time())
 
             # Must be called right after the cluster is ready.
             self.add_cluster_info_to_cluster_object()
-
-            if self.cluster_info["platform"] == HYPERSHIFT_STR:
-                idp_user, idp_password = self.create_hypershift_idp()
-
-            self.set_cluster_auth(idp_user=idp_user, idp_password=idp_password)
+            self.run_phase(phase="cluster-auth", func=self.set_rosa_cluster_auth)
             self.logger.success(f"{self.log_prefix}: Cluster created successfully")
 
         except Exception as ex:  # noqa: BLE001
@@ -253,8 +279,16 @@ class RosaCluster(OcmCluster):
                 install_dir=self.cluster_info["cluster-dir"],
                 s3_bucket_name=self.s3_bucket_name,
                 s3_bucket_object_name=self.cluster_info["s3-object-name"],
+                index_entry=get_s3_backup_index_entry(cluster_info=self.cluster_info),
             )
 
+    def set_rosa_cluster_auth(self) -> None:
+        idp_user, idp_password = "", ""
+        if self.cluster_info["platform"] == HYPERSHIFT_STR:
+            idp_user, idp_password = self.create_hypershift_idp()
+
+        self.set_cluster_auth(idp_user=idp_user, idp_password=idp_password)
+
     def destroy_cluster(self) -> None:
         self.timeout_watch = self.start_time_watcher()
         should_raise = False
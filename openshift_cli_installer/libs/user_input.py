@@ -7,29 +7,47 @@ from simple_logger.logger import get_logger
 
 from openshift_cli_installer.utils.cli_utils import (
     get_aws_credentials_for_acm_observability,
-    get_cluster_data_by_name_from_clusters,
     get_managed_acm_clusters_from_user_input,
 )
 from openshift_cli_installer.utils.const import (
     AWS_OSD_STR,
+    CLUSTERS_INSTALL_DATA_DIRECTORY,
     CREATE_STR,
     GCP_OSD_STR,
     GCP_STR,
     HYPERSHIFT_STR,
     IPI_BASED_PLATFORMS,
+    IPI_BASED_PLATFORMS_STREAMS,
     OBSERVABILITY_SUPPORTED_STORAGE_TYPES,
-    ROSA_STR,
+    OCM_MANAGED_PLATFORMS,
+    ON_FAILURE_DESTROY_ALL_STR,
+    OSD_SUPPORTED_CHANNELS,
     S3_STR,
     SUPPORTED_ACTIONS,
+    SUPPORTED_CONCURRENCY_LIMITS,
+    SUPPORTED_INSTALLER_LOG_LEVELS,
+    SUPPORTED_ON_FAILURE_POLICIES,
     SUPPORTED_PLATFORMS,
     USER_INPUT_CLUSTER_BOOLEAN_KEYS,
 )
+from openshift_cli_installer.utils.run_manifest import get_run_result_manifest_path, read_run_result_manifest
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
 
 
 class UserInputError(Exception):
     pass
 
 
+class ClustersYamlConfigLoader(YamlLoader):
+    """
+    Clusters YAML config file loader, `parse_config` registers its `!ENV` resolver on this class and not on PyYAML's.
+    """
+
+
 class UserInput:
     def __init__(self, **kwargs: Any) -> None:
         self.logger = get_logger(name=self.__class__.__module__)
@@ -38,7 +56,9 @@ class UserInput:
         if self.clusters_yaml_config_file:
             # Update CLI user input from YAML file if exists
             # Since CLI user input has some defaults, YAML file will override them
-            self.user_kwargs.update(parse_config(path=self.clusters_yaml_config_file, default_value=""))
+            self.user_kwargs.update(
+                parse_config(path=self.clusters_yaml_config_file, default_value="", loader=ClustersYamlConfigLoader)
+            )
 
         self.dry_run = self.user_kwargs.get("dry_run")
         self.action = self.user_kwargs.get("action")
@@ -46,12 +66,32 @@ class UserInput:
         self.aws_secret_access_key = self.user_kwargs.get("aws_secret_access_key", "")
         self.aws_account_id = self.user_kwargs.get("aws_account_id", "")
         self.gcp_service_account_file = self.user_kwargs.get("gcp_service_account_file", "")
+        self.clusters_install_data_directory = (
+            self.user_kwargs["clusters_install_data_directory"] or CLUSTERS_INSTALL_DATA_DIRECTORY
+        )
+        self.retry_failed = self.user_kwargs.get("retry_failed", "")
+        self.resume = self.user_kwargs.get("resume", False)
+        self.run_result_manifest: dict[str, Any] = {}
+        if self.retry_failed and self.resume:
+            raise UserInputError("`--retry-failed` and `--resume` are mutually exclusive")
+
+        if self.retry_failed:
+            self.load_run_result_manifest(manifest_path=self.retry_failed, option="--retry-failed")
+
+        elif self.resume:
+            self.load_run_result_manifest(
+                manifest_path=get_run_result_manifest_path(
+                    clusters_install_data_directory=self.clusters_install_data_directory
+                ),
+                option="--resume",
+            )
+
         self.clusters = self.get_clusters_from_user_input()
         self.ocm_token = self.user_kwargs.get("ocm_token", "")
         self.parallel = False if self.clusters and len(self.clusters) == 1 else self.user_kwargs.get("parallel", False)
-        self.clusters_install_data_directory = (
-            self.user_kwargs["clusters_install_data_directory"] or "/openshift-cli-installer/clusters-install-data"
-        )
+        self.max_parallel = self.user_kwargs.get("max_parallel")
+        self.concurrency_limits = self.user_kwargs.get("concurrency_limits") or {}
+        self.on_failure = self.user_kwargs.get("on_failure") or ON_FAILURE_DESTROY_ALL_STR
         self.destroy_clusters_from_s3_config_files = self.user_kwargs.get("destroy_clusters_from_s3_config_files", "")
         self.s3_bucket_name = self.user_kwargs.get("s3_bucket_name", "")
         self.s3_bucket_path = self.user_kwargs.get("s3_bucket_path", "")
@@ -70,6 +110,9 @@ class UserInput:
         self.ssh_key_file = self.user_kwargs.get("ssh_key_file", "")
         self.docker_config_file = self.user_kwargs.get("docker_config_file", "")
         self.must_gather_output_dir = self.user_kwargs.get("must_gather_output_dir", "")
+        self.cache_dir = self.user_kwargs.get("cache_dir", "")
+        self.offline_catalog = self.user_kwargs.get("offline_catalog", False)
+        self.terraform_provider_mirror = self.user_kwargs.get("terraform_provider_mirror") or ""
         self.create = self.action == CREATE_STR
 
         # We need to make sure that we don't process the same input twice
@@ -84,6 +127,25 @@ class UserInput:
         self.logger.info("Initializing User Input")
         self.verify_user_input()
 
+    def load_run_result_manifest(self, manifest_path: str, option: str) -> None:
+        """
+        Replace clusters user input with the clusters of a previous run (`--retry-failed` or `--resume`).
+
+        All clusters are loaded (ACM steps need the hubs and managed clusters), only clusters which are not
+        created are created again; with `--resume` they continue from their last completed phase.
+        """
+        try:
+            self.run_result_manifest = read_run_result_manifest(manifest_path=manifest_path)
+        except (OSError, ValueError) as ex:
+            raise UserInputError(f"`{option}` {ex}") from ex
+
+        if self.user_kwargs.get("cluster"):
+            raise UserInputError(f"`--cluster` is not supported when running with `{option}`")
+
+        self.logger.info(f"Loading clusters from run result manifest {manifest_path} [{option}]")
+        self.action = self.user_kwargs["action"] = CREATE_STR
+        self.user_kwargs["clusters"] = [_cluster["user-input"] for _cluster in self.run_result_manifest["clusters"]]
+
     def get_clusters_from_user_input(self) -> list[dict[str, Any]]:
         # From CLI, we get `cluster`, from YAML file we get `clusters`
         clusters = self.user_kwargs.get("cluster", [])
@@ -150,189 +212,202 @@ class UserInput:
             if not self.clusters:
                 raise UserInputError("At least one '--cluster' option must be provided.")
 
-            self.assert_boolean_values()
-            self.is_platform_supported()
-            self.assert_missing_cluster_name_or_prefix()
-            self.assert_unique_cluster_names()
-            self.assert_managed_acm_clusters_user_input()
-            self.assert_ipi_installer_user_input()
-            self.assert_aws_osd_hypershift_user_input()
-            self.assert_acm_clusters_user_input()
-            self.assert_gcp_user_input()
-            self.assert_cluster_platform_support_observability()
-            self.assert_missing_cluster_region()
-            self.assert_clusters_data_directory_missing_permissions()
-            self.assert_platform_not_match_channel_or_stream()
-            self.assert_cluster_installer_log_level_user_input()
+            if violations := self.get_user_input_violations():
+                raise UserInputError("\n".join(violations))
 
     def abort_no_ocm_token(self) -> None:
         if not self.ocm_token:
             raise UserInputError("--ocm-token is required for clusters")
 
-    def is_platform_supported(self) -> None:
-        unsupported_platforms = []
-        missing_platforms = []
+    def get_user_input_violations(self) -> list[str]:
+        """
+        Validate the clusters user input and return all violations.
+
+        Clusters are traversed once: per-cluster rules run in the traversal, which also indexes clusters names
+        and platforms; rules over all clusters (unique names, managed ACM clusters, required files and credentials)
+        run once against the indexes.
+
+        Returns:
+            list: Violations messages, empty if the user input is valid.
+        """
+        violations: list[str] = []
+        clusters_names: set[str] = set()
+        named_clusters_names: list[str] = []
+        platforms: set[str] = set()
+        managed_acm_clusters_names: list[str] = []
+        missing_cluster_name: bool = False
+        missing_platforms: list[str] = []
+        unsupported_platforms: list[str] = []
+        missing_regions: list[str] = []
+        acm_hypershift_cluster: bool = False
+        unsupported_log_levels: list[str] = []
+        log_level_unsupported_platforms: list[str] = []
+        observability_unsupported_storage_types: list[str] = []
+        observability_missing_storage_data: list[str] = []
+
         for _cluster in self.clusters:
-            _platform = _cluster.get("platform")
-            if not _platform:
-                missing_platforms.append(f"Cluster {_cluster['name']} is missing platform")
+            _name = _cluster.get("name")
+            _cluster_name = _cluster.get("name", _cluster.get("name-prefix", ""))
+            if not _cluster_name:
+                missing_cluster_name = True
 
-            elif _platform not in SUPPORTED_PLATFORMS:
-                unsupported_platforms.append(f"Cluster {_cluster['name']} platform '{_platform}' is not supported.")
+            if _name is not None:
+                named_clusters_names.append(_name)
+                clusters_names.add(_name)
 
-        if unsupported_platforms or missing_platforms:
-            if unsupported_platforms:
-                raise UserInputError("\n".join(unsupported_platforms))
+            if not _cluster.get("region") and not _cluster.get("auto-region"):
+                missing_regions.append(_cluster_name)
 
-            if missing_platforms:
-                raise UserInputError("\n".join(missing_platforms))
+            if self.create:
+                if non_bool_keys := [
+                    cluster_data_key
+                    for cluster_data_key, cluster_data_value in _cluster.items()
+                    if cluster_data_key in USER_INPUT_CLUSTER_BOOLEAN_KEYS and not isinstance(cluster_data_value, bool)
+                ]:
+                    violations.append(f"The following keys must be booleans: {non_bool_keys}")
+
+                managed_acm_clusters_names.extend(get_managed_acm_clusters_from_user_input(cluster=_cluster))
+
+                if _cluster.get("acm-observability"):
+                    storage_type = _cluster.get("acm-observability-storage-type")
+                    if storage_type not in OBSERVABILITY_SUPPORTED_STORAGE_TYPES:
+                        observability_unsupported_storage_types.append(
+                            f"cluster: {_cluster_name} - storage type: {storage_type}"
+                        )
+                    else:
+                        observability_missing_storage_data.extend(
+                            self.check_missing_observability_storage_data(cluster=_cluster, storage_type=storage_type)
+                        )
 
-    def assert_unique_cluster_names(self) -> None:
-        if self.create:
-            cluster_names = [cluster.get("name") for cluster in self.clusters if cluster.get("name") is not None]
-            if len(cluster_names) != len(set(cluster_names)):
-                raise UserInputError(f"Cluster names must be unique: clusters {cluster_names}")
+            _platform = _cluster.get("platform")
+            if not _platform:
+                missing_platforms.append(f"Cluster {_cluster_name} is missing platform")
+                continue
 
-    def assert_managed_acm_clusters_user_input(self) -> None:
-        if self.create:
-            for cluster in self.clusters:
-                managed_acm_clusters = get_managed_acm_clusters_from_user_input(cluster=cluster)
-                for managed_acm_cluster in managed_acm_clusters:
-                    managed_acm_cluster_data = get_cluster_data_by_name_from_clusters(
-                        name=managed_acm_cluster, clusters=self.clusters
-                    )
-                    if not managed_acm_cluster_data:
-                        raise UserInputError(f"Managed ACM clusters: Cluster not found {managed_acm_cluster}")
-
-    def assert_ipi_installer_user_input(self) -> None:
-        if any(_cluster["platform"] in IPI_BASED_PLATFORMS for _cluster in self.clusters):
-            self.assert_registry_config_file_exists()
-            self.assert_docker_config_file_exists()
-            if self.create:
-                self.assert_public_ssh_key_file_exists()
+            if _platform not in SUPPORTED_PLATFORMS:
+                unsupported_platforms.append(f"Cluster {_cluster_name} platform '{_platform}' is not supported.")
+                continue
 
-    def assert_docker_config_file_exists(self) -> None:
-        if not self.docker_config_file:
-            raise UserInputError("Docker config file is required for IPI installations.")
+            platforms.add(_platform)
 
-        if not os.path.exists(self.docker_config_file) and not self.dry_run:
-            raise UserInputError(f"{self.docker_config_file} file does not exist.")
+            if self.create and _cluster.get("acm") is True and _platform == HYPERSHIFT_STR:
+                acm_hypershift_cluster = True
 
-    def assert_cluster_installer_log_level_user_input(self) -> None:
-        supported_log_levels = ["debug", "info", "warn", "error"]
-        unsupported_log_levels = []
-        unsupported_platforms = []
-        for _cluster in self.clusters:
             log_level = _cluster.get("log_level")
-
-            if _cluster["platform"] in IPI_BASED_PLATFORMS:
-                if log_level and log_level not in supported_log_levels:
-                    unsupported_log_levels.append(f"LogLevel {log_level} for cluster {_cluster['name']}")
+            if _platform in IPI_BASED_PLATFORMS:
+                if log_level and log_level not in SUPPORTED_INSTALLER_LOG_LEVELS:
+                    unsupported_log_levels.append(f"LogLevel {log_level} for cluster {_cluster_name}")
 
             elif log_level:
-                unsupported_platforms.append(_cluster["name"])
+                log_level_unsupported_platforms.append(_cluster_name)
 
-        if unsupported_log_levels:
-            raise UserInputError(
-                f"{unsupported_log_levels} log levels are not supported for openshift-installer cli."
-                f" Supported options are {supported_log_levels}"
-            )
+            if stream_or_channel_violation := self.get_platform_not_match_channel_or_stream_violation(cluster=_cluster):
+                violations.append(stream_or_channel_violation)
 
-        if unsupported_platforms:
-            raise UserInputError(
-                f"Cluster(s) {','.join(unsupported_platforms)} platforms do not support `log_level` option. "
-                "Did you mean: `debug: true`?"
-            )
+        violations.extend(unsupported_platforms)
+        violations.extend(missing_platforms)
 
-    def assert_public_ssh_key_file_exists(self) -> None:
-        if not self.ssh_key_file:
-            raise UserInputError("SSH file is required for IPI cluster installations.")
+        if missing_cluster_name:
+            violations.append("Cluster name or name_prefix must be provided")
 
-        if not os.path.exists(self.ssh_key_file) and not self.dry_run:
-            raise UserInputError(f"{self.ssh_key_file} file does not exist.")
+        if self.create and len(named_clusters_names) != len(clusters_names):
+            violations.append(f"Cluster names must be unique: clusters {named_clusters_names}")
 
-    def assert_registry_config_file_exists(self) -> None:
-        if not self.registry_config_file:
-            raise UserInputError("Registry config file is required for IPI cluster installations.")
+        violations.extend(
+            f"Managed ACM clusters: Cluster not found {_managed_acm_cluster}"
+            for _managed_acm_cluster in managed_acm_clusters_names
+            if _managed_acm_cluster not in clusters_names
+        )
 
-        if not os.path.exists(self.registry_config_file) and not self.dry_run:
-            raise UserInputError(f"{self.registry_config_file} file does not exist.")
+        if platforms & set(IPI_BASED_PLATFORMS):
+            violations.extend(self.get_ipi_installer_violations())
 
-    def assert_aws_osd_hypershift_user_input(self) -> None:
-        if any(_cluster["platform"] in (AWS_OSD_STR, HYPERSHIFT_STR) for _cluster in self.clusters):
-            self.assert_aws_credentials_exist()
-            if not self.aws_account_id and self.create:
-                raise UserInputError("--aws-account-id required for AWS OSD or Hypershift installations.")
+        if platforms & {AWS_OSD_STR, HYPERSHIFT_STR}:
+            violations.extend(self.get_aws_osd_hypershift_violations())
 
-    def assert_aws_credentials_exist(self) -> None:
-        if not (self.aws_secret_access_key and self.aws_access_key_id):
-            raise UserInputError(
-                "--aws-secret-access-key and --aws-access-key-id required for AWS OSD OR ACM cluster installations."
-            )
+        if acm_hypershift_cluster:
+            violations.append(f"ACM not supported for {HYPERSHIFT_STR} clusters")
 
-    def assert_acm_clusters_user_input(self) -> None:
-        acm_clusters = [_cluster for _cluster in self.clusters if _cluster.get("acm") is True]
-        if acm_clusters and self.create:
-            for _cluster in acm_clusters:
-                cluster_platform = _cluster["platform"]
-                if cluster_platform == HYPERSHIFT_STR:
-                    raise UserInputError(f"ACM not supported for {cluster_platform} clusters")
-
-    def assert_gcp_user_input(self) -> None:
-        if (
-            self.create
-            and any(cluster["platform"] in (GCP_OSD_STR, GCP_STR) for cluster in self.clusters)
-            and not self.gcp_service_account_file
-        ):
-            raise UserInputError(
+        if self.create and platforms & {GCP_OSD_STR, GCP_STR} and not self.gcp_service_account_file:
+            violations.append(
                 f"`--gcp-service-account-file` option must be provided for {GCP_OSD_STR} and {GCP_STR} clusters"
             )
 
-    def assert_boolean_values(self) -> None:
-        if self.create:
-            for cluster in self.clusters:
-                non_bool_keys = [
-                    cluster_data_key
-                    for cluster_data_key, cluster_data_value in cluster.items()
-                    if cluster_data_key in USER_INPUT_CLUSTER_BOOLEAN_KEYS and not isinstance(cluster_data_value, bool)
-                ]
-                if non_bool_keys:
-                    raise UserInputError(f"The following keys must be booleans: {non_bool_keys}")
-
-    def assert_cluster_platform_support_observability(self) -> None:
-        not_supported_clusters = []
-        missing_storage_data = []
-        for cluster in self.clusters:
-            if not (self.create and cluster.get("acm-observability")):
-                continue
-
-            cluster_name = cluster["name"]
-            storage_type = cluster.get("acm-observability-storage-type")
-            base_error_str = f"cluster: {cluster_name} - storage type: {storage_type}"
-            if storage_type not in OBSERVABILITY_SUPPORTED_STORAGE_TYPES:
-                not_supported_clusters.append(base_error_str)
-            else:
-                missing_storage_data.extend(
-                    self.check_missing_observability_storage_data(
-                        cluster=cluster,
-                        storage_type=storage_type,
-                    )
-                )
-
-        if not_supported_clusters or missing_storage_data:
+        if observability_unsupported_storage_types or observability_missing_storage_data:
             msg = ""
-            if not_supported_clusters:
-                _error_clusters = "\n".join(not_supported_clusters)
+            if observability_unsupported_storage_types:
+                _error_clusters = "\n".join(observability_unsupported_storage_types)
                 msg += (
                     "The following storage types are not supported for"
                     f" observability:\n{_error_clusters}\nsupported storage types are"
                     f" {OBSERVABILITY_SUPPORTED_STORAGE_TYPES}\n"
                 )
 
-            if missing_storage_data:
-                _storage_clusters = "\n".join(missing_storage_data)
+            if observability_missing_storage_data:
+                _storage_clusters = "\n".join(observability_missing_storage_data)
                 msg += f"The following clusters are missing storage data for observability:\n{_storage_clusters}\n"
-            raise UserInputError(msg)
+            violations.append(msg)
+
+        if missing_regions:
+            violations.append(f"Cluster region must be provided for the following clusters: {missing_regions}")
+
+        if not os.access(os.path.dirname(self.clusters_install_data_directory), os.W_OK):
+            violations.append(f"Clusters data directory: {self.clusters_install_data_directory} is not writable")
+
+        if unsupported_log_levels:
+            violations.append(
+                f"{unsupported_log_levels} log levels are not supported for openshift-installer cli."
+                f" Supported options are {SUPPORTED_INSTALLER_LOG_LEVELS}"
+            )
+
+        if log_level_unsupported_platforms:
+            violations.append(
+                f"Cluster(s) {','.join(log_level_unsupported_platforms)} platforms do not support `log_level` option. "
+                "Did you mean: `debug: true`?"
+            )
+
+        if self.offline_catalog and not self.cache_dir:
+            violations.append("`--offline-catalog` requires `--cache-dir` with a cached release catalog")
+
+        violations.extend(self.get_concurrency_limits_violations())
+
+        if self.on_failure not in SUPPORTED_ON_FAILURE_POLICIES:
+            violations.append(
+                f"On failure policy '{self.on_failure}' is not supported, supported policies: "
+                f"{SUPPORTED_ON_FAILURE_POLICIES}"
+            )
+
+        return violations
+
+    def get_ipi_installer_violations(self) -> list[str]:
+        required_files = [
+            (self.registry_config_file, "Registry config file is required for IPI cluster installations."),
+            (self.docker_config_file, "Docker config file is required for IPI installations."),
+        ]
+        if self.create:
+            required_files.append((self.ssh_key_file, "SSH file is required for IPI cluster installations."))
+
+        violations = []
+        for _file, _missing_file_error in required_files:
+            if not _file:
+                violations.append(_missing_file_error)
+
+            elif not os.path.exists(_file) and not self.dry_run:
+                violations.append(f"{_file} file does not exist.")
+
+        return violations
+
+    def get_aws_osd_hypershift_violations(self) -> list[str]:
+        violations = []
+        if not (self.aws_secret_access_key and self.aws_access_key_id):
+            violations.append(
+                "--aws-secret-access-key and --aws-access-key-id required for AWS OSD OR ACM cluster installations."
+            )
+
+        if not self.aws_account_id and self.create:
+            violations.append("--aws-account-id required for AWS OSD or Hypershift installations.")
+
+        return violations
 
     @staticmethod
     def check_missing_observability_storage_data(
@@ -340,7 +415,7 @@ class UserInput:
         storage_type: str,
     ) -> list[str]:
         missing_storage_data = []
-        base_error_str = f"cluster: {cluster['name']} - storage type: {storage_type}"
+        base_error_str = f"cluster: {cluster.get('name', cluster.get('name-prefix'))} - storage type: {storage_type}"
         if storage_type == S3_STR:
             if not cluster.get("aws-access-key-id"):
                 missing_storage_data.append(f"{base_error_str} is missing `acm-observability-s3-access-key-id`")
@@ -349,42 +424,45 @@ class UserInput:
 
         return missing_storage_data
 
-    def assert_missing_cluster_name_or_prefix(self) -> None:
-        for cluster in self.clusters:
-            if not cluster.get("name", cluster.get("name-prefix")):
-                raise UserInputError("Cluster name or name_prefix must be provided")
-
-    def assert_missing_cluster_region(self) -> None:
-        # TODO: add tests
-        if clusters_wtih_missing_regions := [
-            _cluster["name"]
-            for _cluster in self.clusters
-            if not _cluster.get("region") and not _cluster.get("auto-region")
-        ]:
-            raise UserInputError(
-                f"Cluster region must be provided for the following clusters: {clusters_wtih_missing_regions}"
-            )
+    def get_concurrency_limits_violations(self) -> list[str]:
+        # bool is an int subclass, `true` is not a valid limit
+        if self.max_parallel is not None and (
+            isinstance(self.max_parallel, bool) or not isinstance(self.max_parallel, int) or self.max_parallel < 1
+        ):
+            return [f"`--max-parallel` must be a positive integer, got {self.max_parallel}"]
 
-    def assert_clusters_data_directory_missing_permissions(self) -> None:
-        if not os.access(os.path.dirname(self.clusters_install_data_directory), os.W_OK):
-            raise UserInputError(f"Clusters data directory: {self.clusters_install_data_directory} is not writable")
-
-    def assert_platform_not_match_channel_or_stream(self) -> None:
-        ipi_based_platforms_streams = ("stable", "nightly", "ec", "ci", "rc")
-        osd_supported_channels = ("stable", "candidate", "nightly")
-        for cluster in self.clusters:
-            _platform = cluster["platform"]
-            if _platform in IPI_BASED_PLATFORMS and cluster.get("stream", "stable") not in ipi_based_platforms_streams:
-                raise UserInputError(
-                    f"{_platform} platform does not support stream {cluster['stream']}, "
-                    f"supported streams are {ipi_based_platforms_streams}",
+        if not isinstance(self.concurrency_limits, dict):
+            return [f"`concurrency_limits` must be a mapping, got {self.concurrency_limits}"]
+
+        violations = []
+        for _limit_type, _limits in self.concurrency_limits.items():
+            if _limit_type not in SUPPORTED_CONCURRENCY_LIMITS:
+                violations.append(
+                    f"Concurrency limit '{_limit_type}' is not supported, supported limits: {SUPPORTED_CONCURRENCY_LIMITS}"
                 )
 
-            elif (
-                _platform in (HYPERSHIFT_STR, ROSA_STR, AWS_OSD_STR, GCP_OSD_STR)
-                and cluster.get("channel-group", "stable") not in osd_supported_channels
+            elif not isinstance(_limits, dict) or not all(
+                isinstance(_value, int) and not isinstance(_value, bool) and _value > 0 for _value in _limits.values()
             ):
-                raise UserInputError(
-                    f"{_platform} platform does not support channel-group {cluster['channel-group']}, "
-                    f"supported channels are {osd_supported_channels}",
+                violations.append(
+                    f"Concurrency limit '{_limit_type}' must map names to positive integers, got {_limits}"
                 )
+
+        return violations
+
+    @staticmethod
+    def get_platform_not_match_channel_or_stream_violation(cluster: dict[str, Any]) -> str:
+        _platform = cluster["platform"]
+        if _platform in IPI_BASED_PLATFORMS and cluster.get("stream", "stable") not in IPI_BASED_PLATFORMS_STREAMS:
+            return (
+                f"{_platform} platform does not support stream {cluster['stream']}, "
+                f"supported streams are {IPI_BASED_PLATFORMS_STREAMS}"
+            )
+
+        if _platform in OCM_MANAGED_PLATFORMS and cluster.get("channel-group", "stable") not in OSD_SUPPORTED_CHANNELS:
+            return (
+                f"{_platform} platform does not support channel-group {cluster['channel-group']}, "
+                f"supported channels are {OSD_SUPPORTED_CHANNELS}"
+            )
+
+        return ""
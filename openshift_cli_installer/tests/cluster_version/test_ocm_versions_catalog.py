@@ -0,0 +1,91 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from openshift_cli_installer.utils import general
+from openshift_cli_installer.utils.cluster_versions import get_ocm_version_index, get_ocm_versions
+
+ROSA_VERSIONS = {"stable": {"4.15": ["4.15.8", "4.15.6"]}}
+
+
+class FakeVersionsFetcher:
+    def __init__(self):
+        self.calls = 0
+        self.calls_lock = threading.Lock()
+
+    def __call__(self):
+        with self.calls_lock:
+            self.calls += 1
+
+        time.sleep(0.1)
+        return ROSA_VERSIONS
+
+
+@pytest.fixture
+def fetcher():
+    return FakeVersionsFetcher()
+
+
+@pytest.fixture(autouse=True)
+def new_run(mocker):
+    mocker.patch.dict(general._SINGLE_FLIGHT_RESULTS, clear=True)
+
+
+def _get_versions(fetcher, region="us-east-1", cache_dir=""):
+    return get_ocm_versions(
+        fetch_func=fetcher,
+        ocm_env="stage",
+        channel_group="stable",
+        region=region,
+        hosted_cp=False,
+        cache_dir=str(cache_dir) if cache_dir else "",
+    )
+
+
+def test_ocm_versions_fetched_once_per_run(fetcher):
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [executor.submit(_get_versions, fetcher=fetcher) for _ in range(10)]
+
+    assert all(_future.result() == ROSA_VERSIONS for _future in futures)
+    assert fetcher.calls == 1
+
+
+def test_ocm_version_index_built_once_per_catalog(fetcher):
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [
+            executor.submit(
+                get_ocm_version_index, fetch_func=fetcher, ocm_env="stage", channel_group="stable", region="us-east-1"
+            )
+            for _ in range(10)
+        ]
+
+    assert len({id(_future.result()) for _future in futures}) == 1
+    assert futures[0].result().get_latest(minor="4.15", stream="stable") == "4.15.8"
+    assert fetcher.calls == 1
+
+
+def test_ocm_versions_fetched_per_region(fetcher):
+    _get_versions(fetcher=fetcher, region="us-east-1")
+    _get_versions(fetcher=fetcher, region="us-west-2")
+
+    assert fetcher.calls == 2
+
+
+def test_ocm_versions_persisted_cache(fetcher, tmp_path, mocker):
+    _get_versions(fetcher=fetcher, cache_dir=tmp_path)
+    # New run, catalog is loaded from the cache directory
+    mocker.patch.dict(general._SINGLE_FLIGHT_RESULTS, clear=True)
+
+    assert _get_versions(fetcher=fetcher, cache_dir=tmp_path) == ROSA_VERSIONS
+    assert fetcher.calls == 1
+
+
+def test_ocm_versions_expired_cache(fetcher, tmp_path, mocker):
+    mocker.patch("openshift_cli_installer.utils.cluster_versions.OCM_VERSIONS_CACHE_TTL_SECONDS", 0)
+    _get_versions(fetcher=fetcher, cache_dir=tmp_path)
+    mocker.patch.dict(general._SINGLE_FLIGHT_RESULTS, clear=True)
+    _get_versions(fetcher=fetcher, cache_dir=tmp_path)
+
+    assert fetcher.calls == 2
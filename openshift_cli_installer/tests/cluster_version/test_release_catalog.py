@@ -0,0 +1,145 @@
+import gc
+import json
+import os
+import time
+import tracemalloc
+
+import click
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+from openshift_cli_installer.tests.cluster_version.aws_base_versions import AWS_BASE_VERSIONS
+from openshift_cli_installer.utils.cluster_versions import (
+    ReleaseRow,
+    get_openshift_release_index,
+    get_openshift_release_page,
+)
+
+RELEASE_URL = "https://openshift-release.apps.ci.l2s4.p1.openshiftapps.com"
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+
+@pytest.fixture
+def expired_cache(tmp_path, mocker):
+    mocker.patch("openshift_cli_installer.utils.cluster_versions.RELEASE_CATALOG_CACHE_TTL_SECONDS", 0)
+    return str(tmp_path)
+
+
+def test_release_page_cached_within_ttl(tmp_path, mocker):
+    requests_get = mocker.patch(
+        "openshift_cli_installer.utils.cluster_versions.requests.get",
+        return_value=FakeResponse(text="<html>page</html>", headers={"ETag": '"v1"'}),
+    )
+
+    assert get_openshift_release_page(url=RELEASE_URL, cache_dir=str(tmp_path)) == "<html>page</html>"
+    assert get_openshift_release_page(url=RELEASE_URL, cache_dir=str(tmp_path)) == "<html>page</html>"
+    assert requests_get.call_count == 1
+
+
+def test_release_page_revalidated_with_etag(expired_cache, mocker):
+    requests_get = mocker.patch(
+        "openshift_cli_installer.utils.cluster_versions.requests.get",
+        side_effect=[
+            FakeResponse(text="<html>page</html>", headers={"ETag": '"v1"'}),
+            FakeResponse(status_code=304),
+        ],
+    )
+
+    get_openshift_release_page(url=RELEASE_URL, cache_dir=expired_cache)
+    assert get_openshift_release_page(url=RELEASE_URL, cache_dir=expired_cache) == "<html>page</html>"
+    assert requests_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    with open(os.path.join(expired_cache, "release-page.json")) as fd:
+        assert json.load(fd)["etag"] == '"v1"'
+
+
+def test_release_page_stale_cache_used_when_unreachable(expired_cache, mocker):
+    mocker.patch(
+        "openshift_cli_installer.utils.cluster_versions.requests.get",
+        side_effect=[FakeResponse(text="<html>page</html>"), requests.ConnectionError("unreachable")],
+    )
+
+    get_openshift_release_page(url=RELEASE_URL, cache_dir=expired_cache)
+    assert get_openshift_release_page(url=RELEASE_URL, cache_dir=expired_cache) == "<html>page</html>"
+
+
+def test_release_page_offline(tmp_path, mocker):
+    requests_get = mocker.patch("openshift_cli_installer.utils.cluster_versions.requests.get")
+
+    with pytest.raises(click.Abort):
+        get_openshift_release_page(url=RELEASE_URL, cache_dir=str(tmp_path), offline=True)
+
+    requests_get.return_value = FakeResponse(text="<html>page</html>")
+    get_openshift_release_page(url=RELEASE_URL, cache_dir=str(tmp_path))
+    assert get_openshift_release_page(url=RELEASE_URL, cache_dir=str(tmp_path), offline=True) == "<html>page</html>"
+    assert requests_get.call_count == 1
+
+
+def _release_page(versions):
+    rows = "\n".join(
+        f'<tr>\n<td><a class="text-success" href="/releasestream/4-stable/release/{_version}">{_version}</a></td>\n'
+        f'<td class="text-success">Accepted</td>\n<td title="2024-04-16T19:56:22Z">3 days ago</td>\n</tr>'
+        for _version in versions
+    )
+    return f"<html><body><table>\n<tr><th>Name</th><th>Phase</th></tr>\n{rows}\n</table></body></html>"
+
+
+@pytest.fixture(scope="module")
+def release_page_versions():
+    return [
+        _version.strip()
+        for _versions in AWS_BASE_VERSIONS["openshift-release.apps.ci.l2s4.p1.openshiftapps.com"].values()
+        for _version in _versions
+    ]
+
+
+def test_release_index(release_page_versions):
+    release_index = get_openshift_release_index(page=_release_page(versions=release_page_versions))
+
+    assert list(release_index) == release_page_versions
+    assert release_index["4.15.8"] == ReleaseRow(status="Accepted", href="/releasestream/4-stable/release/4.15.8")
+    with pytest.raises(TypeError):
+        release_index["4.15.8"] = ReleaseRow(status="Rejected", href="")
+
+
+def test_release_index_memory_and_lookup_benchmark(release_page_versions):
+    page = _release_page(versions=release_page_versions)
+    wanted_versions = release_page_versions[-20:]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        memory_before = tracemalloc.get_traced_memory()[0]
+        dom_rows = BeautifulSoup(page, "html.parser").find_all("tr")
+        gc.collect()
+        dom_rows_memory = tracemalloc.get_traced_memory()[0] - memory_before
+
+        memory_before = tracemalloc.get_traced_memory()[0]
+        release_index = get_openshift_release_index(page=page)
+        gc.collect()
+        release_index_memory = tracemalloc.get_traced_memory()[0] - memory_before
+    finally:
+        tracemalloc.stop()
+
+    start_time = time.perf_counter()
+    for wanted_version in wanted_versions:
+        [tr for tr in dom_rows if any(_tr for _tr in tr.text.splitlines() if wanted_version == _tr)]
+    dom_rows_lookup_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for wanted_version in wanted_versions:
+        release_index.get(wanted_version)
+    release_index_lookup_time = time.perf_counter() - start_time
+
+    assert release_index_memory * 5 < dom_rows_memory
+    assert release_index_lookup_time < dom_rows_lookup_time
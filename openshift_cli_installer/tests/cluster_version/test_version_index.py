@@ -0,0 +1,100 @@
+import pytest
+
+from openshift_cli_installer.tests.cluster_version.aws_base_versions import AWS_BASE_VERSIONS
+from openshift_cli_installer.tests.cluster_version.rosa_osd_base_versions import ROSA_OSD_BASE_VERSIONS
+from openshift_cli_installer.utils.cluster_versions import VersionIndex, get_cluster_version_to_install
+
+SCALE = 100
+
+
+def _scale_base_versions(base_versions_dict):
+    """
+    Scale a versions catalog up by adding `SCALE` times its minors as fake majors (4.15 -> 104.15, 204.15, ...).
+    """
+    scaled_base_versions = {}
+    for _source, versions in base_versions_dict.items():
+        scaled_base_versions[_source] = {}
+        for _scale in range(SCALE):
+            for _minor, _versions in versions.items():
+                _prefix = f"{_scale * 100 + 4}." if _scale else "4."
+                scaled_base_versions[_source][_minor.replace("4.", _prefix, 1)] = [
+                    _version.replace("4.", _prefix, 1) for _version in _versions
+                ]
+
+    return scaled_base_versions
+
+
+SCALED_AWS_BASE_VERSIONS = _scale_base_versions(base_versions_dict=AWS_BASE_VERSIONS)
+SCALED_ROSA_OSD_BASE_VERSIONS = _scale_base_versions(base_versions_dict=ROSA_OSD_BASE_VERSIONS)
+
+AWS_QUERIES = [
+    ("4.15", "stable"),
+    ("4.16", "nightly"),
+    ("4.16", "ec"),
+    ("4.15", "rc"),
+    ("4.16", "ci"),
+    ("4.15.8", "stable"),
+    ("9904.16.0-0.nightly-2024-04-16-195622", "nightly"),
+]
+
+ROSA_QUERIES = [
+    ("4.15", "stable"),
+    ("4.16", "nightly"),
+    ("4.15", "candidate"),
+    ("4.15.8", "stable"),
+    ("9904.14.0", "stable"),
+]
+
+
+def _resolve_versions(version_index, platform, queries):
+    return [
+        get_cluster_version_to_install(
+            wanted_version=_version,
+            base_versions_dict=version_index,
+            platform=platform,
+            stream=_stream,
+            log_prefix="test-version-index",
+        )
+        for _version, _stream in queries
+    ]
+
+
+def test_version_index_picks_semver_latest():
+    version_index = VersionIndex(base_versions_dict=ROSA_OSD_BASE_VERSIONS)
+
+    # 4.14 versions are not ordered in the catalog (4.14.9 is listed before 4.14.20)
+    assert version_index.get_latest(minor="4.14", stream="stable") == "4.14.20"
+
+
+def test_version_index_ipi_stable_is_ga_only():
+    version_index = VersionIndex(base_versions_dict=AWS_BASE_VERSIONS, ipi=True)
+
+    assert version_index.get_latest(minor="4.16", stream="stable") is None
+    assert version_index.get_latest(minor="4.16", stream="ec") == "4.16.0-ec.5"
+
+
+@pytest.mark.parametrize(
+    "base_versions_dict, platform, queries",
+    [
+        pytest.param(SCALED_AWS_BASE_VERSIONS, "aws", AWS_QUERIES, id="aws"),
+        pytest.param(SCALED_ROSA_OSD_BASE_VERSIONS, "rosa", ROSA_QUERIES, id="rosa"),
+    ],
+)
+def test_version_index_build_benchmark(benchmark, base_versions_dict, platform, queries):
+    version_index = benchmark(VersionIndex, base_versions_dict=base_versions_dict, ipi=platform == "aws")
+
+    assert _resolve_versions(version_index=version_index, platform=platform, queries=queries)
+
+
+@pytest.mark.parametrize(
+    "base_versions_dict, platform, queries",
+    [
+        pytest.param(SCALED_AWS_BASE_VERSIONS, "aws", AWS_QUERIES, id="aws"),
+        pytest.param(SCALED_ROSA_OSD_BASE_VERSIONS, "rosa", ROSA_QUERIES, id="rosa"),
+    ],
+)
+def test_version_index_lookup_benchmark(benchmark, base_versions_dict, platform, queries):
+    version_index = VersionIndex(base_versions_dict=base_versions_dict, ipi=platform == "aws")
+    expected = _resolve_versions(version_index=version_index, platform=platform, queries=queries)
+
+    assert benchmark(_resolve_versions, version_index=version_index, platform=platform, queries=queries) == expected
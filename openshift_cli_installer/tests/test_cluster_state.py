@@ -0,0 +1,42 @@
+import os
+import pathlib
+
+import yaml
+
+from openshift_cli_installer.utils.cluster_state import ClusterStateStore
+
+
+def test_cluster_state_store_writes_only_changes(tmp_path):
+    state_file = str(tmp_path / "cluster_data.yaml")
+    store = ClusterStateStore(state_file=state_file)
+    state = {"cluster_info": {"name": "test-cl", "acm-clusters": ("managed-1",)}, "s3_bucket_name": "bucket"}
+
+    assert store.save(state=state)
+    _inode = os.stat(state_file).st_ino
+    assert not store.save(state=state)
+    assert os.stat(state_file).st_ino == _inode
+
+    state["cluster_info"]["cluster-id"] = "123"
+    assert store.save(state=state)
+
+    with open(state_file) as fd:
+        assert yaml.safe_load(fd) == {
+            "cluster_info": {"name": "test-cl", "acm-clusters": ["managed-1"], "cluster-id": "123"},
+            "s3_bucket_name": "bucket",
+        }
+
+    # Atomic writes leave no temporary files behind
+    assert os.listdir(tmp_path) == ["cluster_data.yaml"]
+
+
+def test_cluster_state_store_compares_written_content(tmp_path):
+    state_file = str(tmp_path / "cluster_data.yaml")
+    store = ClusterStateStore(state_file=state_file)
+
+    assert store.save(state={"cluster_info": {"name": "test-cl"}, "workers": {3: "m5.xlarge"}})
+    # Same JSON, different YAML
+    assert store.save(state={"cluster_info": {"name": "test-cl"}, "workers": {"3": "m5.xlarge"}})
+    assert store.save(state={"cluster_info": {"name": "test-cl", "cluster-dir": pathlib.Path("/tmp/test-cl")}})
+
+    with open(state_file) as fd:
+        assert yaml.safe_load(fd) == {"cluster_info": {"name": "test-cl", "cluster-dir": "/tmp/test-cl"}}
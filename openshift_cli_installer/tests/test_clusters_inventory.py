@@ -0,0 +1,134 @@
+import datetime
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from openshift_cli_installer.utils.clusters import (
+    clusters_from_directories,
+    clusters_from_install_data_directory,
+    get_clusters_inventory,
+    list_clusters_from_install_data_directory,
+)
+from openshift_cli_installer.utils.clusters_inventory import ClustersInventory
+
+
+def _write_cluster_data(cluster_dir, name, platform, region, expiration_time=None):
+    cluster_dir.mkdir(parents=True)
+    cluster_info = {"name": name, "platform": platform, "region": region, "ocm-env": "stage"}
+    if expiration_time:
+        cluster_info["expiration-time"] = expiration_time
+
+    (cluster_dir / "cluster_data.yaml").write_text(
+        yaml.dump({"cluster": {"name": name}, "cluster_info": cluster_info, "s3_bucket_name": "bucket"})
+    )
+    return cluster_info
+
+
+@pytest.fixture
+def clusters_install_data_directory(tmp_path):
+    data_dir = tmp_path / "clusters-install-data"
+    expired = (datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(hours=1)).isoformat()
+    _write_cluster_data(cluster_dir=data_dir / "rosa" / "rosa-cl", name="rosa-cl", platform="rosa", region="us-east-2")
+    _write_cluster_data(
+        cluster_dir=data_dir / "aws" / "ipi-cl",
+        name="ipi-cl",
+        platform="aws",
+        region="us-west-2",
+        expiration_time=expired,
+    )
+    # Heavy directories are not scanned
+    _write_cluster_data(
+        cluster_dir=data_dir / "aws" / "ipi-cl" / ".terraform" / "modules",
+        name="not-a-cl",
+        platform="aws",
+        region="us-west-2",
+    )
+    _write_cluster_data(
+        cluster_dir=data_dir / "must-gather" / "aws" / "other", name="not-a-cl-2", platform="aws", region="us-west-2"
+    )
+    return str(data_dir)
+
+
+def test_clusters_from_directories_prunes_heavy_directories(clusters_install_data_directory):
+    clusters = clusters_from_directories(directories=[clusters_install_data_directory])
+
+    assert sorted(_cluster["cluster_info"]["name"] for _cluster in clusters) == ["ipi-cl", "rosa-cl"]
+    assert all(_cluster["cluster_info"]["s3_bucket_name"] == "bucket" for _cluster in clusters)
+
+
+def test_clusters_inventory_built_and_maintained(clusters_install_data_directory):
+    inventory = ClustersInventory(clusters_install_data_directory=clusters_install_data_directory)
+    assert not inventory.exists
+
+    assert (
+        len(clusters_from_install_data_directory(clusters_install_data_directory=clusters_install_data_directory)) == 2
+    )
+    assert inventory.exists
+
+    # Create and destroy update the inventory, the install data directory is not scanned again
+    new_cluster_dir = Path(clusters_install_data_directory, "hypershift", "hcp-cl")
+    cluster_info = _write_cluster_data(
+        cluster_dir=new_cluster_dir,
+        name="hcp-cl",
+        platform="hypershift",
+        region="us-east-2",
+    )
+    get_clusters_inventory(clusters_install_data_directory=clusters_install_data_directory).add(
+        cluster_dir=str(new_cluster_dir), cluster_info=cluster_info
+    )
+    inventory.remove(cluster_dir=os.path.join(clusters_install_data_directory, "rosa", "rosa-cl"))
+
+    assert sorted(
+        _cluster["cluster_info"]["name"]
+        for _cluster in clusters_from_install_data_directory(
+            clusters_install_data_directory=clusters_install_data_directory
+        )
+    ) == ["hcp-cl", "ipi-cl"]
+
+
+def test_clusters_from_install_data_directory_cluster_missing_from_inventory(clusters_install_data_directory):
+    inventory = get_clusters_inventory(clusters_install_data_directory=clusters_install_data_directory)
+    inventory.remove(cluster_dir=os.path.join(clusters_install_data_directory, "rosa", "rosa-cl"))
+    # Copied in by hand after the inventory was built
+    copied_cluster_dir = Path(clusters_install_data_directory, "aws", "copied-cl")
+    _write_cluster_data(cluster_dir=copied_cluster_dir, name="copied-cl", platform="aws", region="us-east-1")
+
+    assert sorted(
+        _cluster["cluster_info"]["name"]
+        for _cluster in clusters_from_install_data_directory(
+            clusters_install_data_directory=clusters_install_data_directory
+        )
+    ) == ["copied-cl", "ipi-cl"]
+    assert str(copied_cluster_dir) in inventory.cluster_dirs()
+
+
+@pytest.mark.parametrize(
+    "filters, expected_names",
+    [
+        pytest.param(None, ["ipi-cl", "rosa-cl"], id="no-filters"),
+        pytest.param({"platform": "rosa"}, ["rosa-cl"], id="platform"),
+        pytest.param({"region": "us-west-2"}, ["ipi-cl"], id="region"),
+        pytest.param({"expired": "true"}, ["ipi-cl"], id="expired"),
+        pytest.param({"expired": "false", "platform": "aws"}, [], id="not-expired-platform"),
+        pytest.param({"older-than": "1h"}, [], id="older-than"),
+    ],
+)
+def test_list_clusters(clusters_install_data_directory, capsys, filters, expected_names):
+    clusters = list_clusters_from_install_data_directory(
+        clusters_install_data_directory=clusters_install_data_directory, filters=filters
+    )
+
+    assert sorted(_cluster["name"] for _cluster in clusters) == expected_names
+    output = capsys.readouterr().out.splitlines()
+    assert output[0].split() == [
+        "name",
+        "platform",
+        "region",
+        "ocm-env",
+        "created-at",
+        "expiration-time",
+        "cluster-dir",
+    ]
+    assert len(output) == len(expected_names) + 1
@@ -0,0 +1,206 @@
+import threading
+import time
+
+import pytest
+
+from openshift_cli_installer.utils.dag_scheduler import DagTask, run_dag
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def task(self, name, duration=0.0, fail=False):
+        def _run():
+            with self.lock:
+                self.events.append(f"start:{name}")
+
+            time.sleep(duration)
+            if fail:
+                raise RuntimeError(f"{name} failed")
+
+            with self.lock:
+                self.events.append(f"end:{name}")
+
+        return _run
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+def test_run_dag_starts_tasks_when_dependencies_are_done(recorder):
+    tasks = [
+        DagTask(name="create:hub", func=recorder.task(name="create:hub", duration=0.1)),
+        DagTask(name="create:slow", func=recorder.task(name="create:slow", duration=0.4)),
+        DagTask(name="install-acm:hub", func=recorder.task(name="install-acm:hub"), dependencies=("create:hub",)),
+        DagTask(
+            name="attach:hub:slow",
+            func=recorder.task(name="attach:hub:slow"),
+            dependencies=("install-acm:hub", "create:slow"),
+        ),
+    ]
+
+    result = run_dag(tasks=tasks)
+
+    assert not result.failed and not result.skipped
+    # ACM is installed on the hub without waiting for all clusters to be created
+    assert recorder.events.index("end:install-acm:hub") < recorder.events.index("end:create:slow")
+    assert recorder.events.index("start:attach:hub:slow") > recorder.events.index("end:create:slow")
+
+
+def test_run_dag_critical_path_duration(recorder):
+    tasks = []
+    for idx in range(5):
+        tasks.extend([
+            DagTask(name=f"create:{idx}", func=recorder.task(name=f"create:{idx}", duration=0.2)),
+            DagTask(
+                name=f"install-acm:{idx}",
+                func=recorder.task(name=f"install-acm:{idx}", duration=0.2),
+                dependencies=(f"create:{idx}",),
+            ),
+        ])
+
+    start_time = time.time()
+    run_dag(tasks=tasks, max_workers=10)
+
+    assert time.time() - start_time < 0.2 * 2 * 2
+
+
+def test_run_dag_skips_dependents_of_failed_tasks(recorder):
+    tasks = [
+        DagTask(name="create:hub", func=recorder.task(name="create:hub", fail=True)),
+        DagTask(name="create:managed", func=recorder.task(name="create:managed")),
+        DagTask(name="install-acm:hub", func=recorder.task(name="install-acm:hub"), dependencies=("create:hub",)),
+        DagTask(
+            name="enable-observability:hub",
+            func=recorder.task(name="enable-observability:hub"),
+            dependencies=("install-acm:hub",),
+        ),
+    ]
+
+    result = run_dag(tasks=tasks)
+
+    assert list(result.failed) == ["create:hub"]
+    assert result.succeeded == ["create:managed"]
+    assert sorted(result.skipped) == ["enable-observability:hub", "install-acm:hub"]
+
+
+def test_run_dag_serial(recorder):
+    tasks = [
+        DagTask(name="create:1", func=recorder.task(name="create:1", duration=0.05)),
+        DagTask(name="create:2", func=recorder.task(name="create:2")),
+    ]
+
+    run_dag(tasks=tasks, max_workers=1)
+
+    assert recorder.events == ["start:create:1", "end:create:1", "start:create:2", "end:create:2"]
+
+
+@pytest.mark.parametrize(
+    "tasks",
+    [
+        pytest.param(
+            [
+                DagTask(name="a", func=lambda: None, dependencies=("b",)),
+                DagTask(name="b", func=lambda: None, dependencies=("a",)),
+            ],
+            id="cycle",
+        ),
+        pytest.param([DagTask(name="a", func=lambda: None, dependencies=("missing",))], id="unknown-dependency"),
+        pytest.param([DagTask(name="a", func=lambda: None), DagTask(name="a", func=lambda: None)], id="duplicate"),
+    ],
+)
+def test_run_dag_invalid_graph(tasks):
+    with pytest.raises(ValueError):
+        run_dag(tasks=tasks)
+
+
+def test_run_dag_limits():
+    running = {"us-east-2": 0, "us-west-2": 0}
+    max_running = {"us-east-2": 0, "us-west-2": 0}
+    lock = threading.Lock()
+
+    def _create(region):
+        def _run():
+            with lock:
+                running[region] += 1
+                max_running[region] = max(max_running[region], running[region])
+
+            time.sleep(0.05)
+            with lock:
+                running[region] -= 1
+
+        return _run
+
+    tasks = [
+        DagTask(name=f"create:{region}-{idx}", func=_create(region=region), limits=(f"region:{region}",))
+        for region in running
+        for idx in range(4)
+    ]
+
+    result = run_dag(tasks=tasks, limits={"region:us-east-2": 1})
+
+    assert len(result.succeeded) == 8
+    assert max_running == {"us-east-2": 1, "us-west-2": 4}
+
+
+def test_run_dag_fail_fast_cancels_queued_tasks(recorder):
+    cancel_event = threading.Event()
+    tasks = [
+        DagTask(name="create:1", func=recorder.task(name="create:1", fail=True)),
+        DagTask(name="create:2", func=recorder.task(name="create:2", duration=0.05)),
+        DagTask(name="create:3", func=recorder.task(name="create:3")),
+        DagTask(name="install-acm:2", func=recorder.task(name="install-acm:2"), dependencies=("create:2",)),
+    ]
+
+    result = run_dag(tasks=tasks, max_workers=2, cancel_event=cancel_event)
+
+    assert cancel_event.is_set()
+    assert list(result.failed) == ["create:1"]
+    # Running tasks are not interrupted
+    assert result.succeeded == ["create:2"]
+    assert sorted(result.cancelled) == ["create:3", "install-acm:2"]
+    assert "start:create:3" not in recorder.events
+
+
+def test_run_dag_cancel_event_set_by_caller(recorder):
+    cancel_event = threading.Event()
+
+    def _create_fail():
+        cancel_event.set()
+        raise RuntimeError("create:1 failed")
+
+    tasks = [
+        DagTask(name="create:1", func=_create_fail, cancellable=False),
+        DagTask(name="create:2", func=recorder.task(name="create:2"), cancellable=False),
+        DagTask(name="install-acm:2", func=recorder.task(name="install-acm:2"), dependencies=("create:2",)),
+        DagTask(name="install-acm:3", func=recorder.task(name="install-acm:3"), dependencies=("install-acm:2",)),
+        DagTask(name="create:3", func=recorder.task(name="create:3"), cancellable=False),
+        DagTask(
+            name="attach:3", func=recorder.task(name="attach:3"), dependencies=("install-acm:2",), cancellable=False
+        ),
+    ]
+
+    result = run_dag(tasks=tasks, max_workers=1, cancel_event=cancel_event, cancel_on_failure=False)
+
+    assert list(result.failed) == ["create:1"]
+    # Not cancellable tasks are still started
+    assert result.succeeded == ["create:2", "create:3"]
+    assert sorted(result.cancelled) == ["install-acm:2", "install-acm:3"]
+    assert result.skipped == ["attach:3"]
+
+
+def test_run_dag_cancel_on_failure_disabled(recorder):
+    cancel_event = threading.Event()
+    tasks = [
+        DagTask(name="create:1", func=recorder.task(name="create:1", fail=True)),
+        DagTask(name="create:2", func=recorder.task(name="create:2")),
+    ]
+
+    result = run_dag(tasks=tasks, max_workers=1, cancel_event=cancel_event, cancel_on_failure=False)
+
+    assert not cancel_event.is_set()
+    assert result.succeeded == ["create:2"]
@@ -0,0 +1,69 @@
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from openshift_cli_installer.utils.general import file_lock, run_single_flight, write_file_atomically
+
+
+def test_run_single_flight_concurrent_callers_share_result():
+    calls = []
+    calls_lock = threading.Lock()
+
+    def _extract():
+        with calls_lock:
+            calls.append(1)
+
+        time.sleep(0.1)
+        return "/cache/openshift-install"
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(run_single_flight, key="test-single-flight-shared", func=_extract) for _ in range(5)]
+
+    assert {_future.result() for _future in futures} == {"/cache/openshift-install"}
+    assert len(calls) == 1
+
+
+def test_run_single_flight_failure_is_not_cached():
+    def _fail():
+        raise RuntimeError("extract failed")
+
+    with pytest.raises(RuntimeError):
+        run_single_flight(key="test-single-flight-failure", func=_fail)
+
+    assert run_single_flight(key="test-single-flight-failure", func=lambda: "ok") == "ok"
+
+
+def test_write_file_atomically_keeps_file_mode(tmp_path):
+    umask = os.umask(0o022)
+    os.umask(umask)
+    new_file = tmp_path / "cluster_data.yaml"
+    write_file_atomically(file_path=str(new_file), content="name: test-cl\n")
+    assert stat.S_IMODE(new_file.stat().st_mode) == 0o666 & ~umask
+
+    new_file.chmod(0o640)
+    write_file_atomically(file_path=str(new_file), content="name: test-cl-2\n")
+    assert stat.S_IMODE(new_file.stat().st_mode) == 0o640
+    assert new_file.read_text() == "name: test-cl-2\n"
+
+
+def test_file_lock_removed_by_holder(tmp_path):
+    lock_file = tmp_path / "entry.lock"
+    waiter_lock_files = []
+
+    def _waiter():
+        with file_lock(lock_file_path=str(lock_file)):
+            waiter_lock_files.append(lock_file.exists())
+
+    with file_lock(lock_file_path=str(lock_file)):
+        waiter = threading.Thread(target=_waiter)
+        waiter.start()
+        time.sleep(0.1)
+        lock_file.unlink()
+
+    waiter.join()
+    # The waiter locked a new lock file, not the removed one
+    assert waiter_lock_files == [True]
@@ -0,0 +1,56 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget of the CLI startup modules, without the cloud / OCM / Kubernetes SDKs it is ~100ms
+IMPORT_TIME_BUDGET_MICROSECONDS = 500_000
+# Loaded only when a cluster of the matching platform is processed
+HEAVY_PACKAGES = (
+    "boto3",
+    "botocore",
+    "bs4",
+    "clouds",
+    "google",
+    "jinja2",
+    "kubernetes",
+    "ocm_python_client",
+    "ocm_python_wrapper",
+    "ocp_resources",
+    "python_terraform",
+    "rosa",
+)
+
+
+def _get_imports_times(module):
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # import time: self [us] | cumulative | imported package
+    return {
+        _match.group("module").strip(): int(_match.group("cumulative"))
+        for _match in re.finditer(r"import time:\s+\d+ \|\s+(?P<cumulative>\d+) \|(?P<module>.+)", res.stderr)
+    }
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        # `--help` and shell completion
+        pytest.param("openshift_cli_installer.cli", id="cli"),
+        # `--dry-run` (user input validation) and `--list-clusters`
+        pytest.param("openshift_cli_installer.cli_entrypoint", id="cli-entrypoint"),
+        pytest.param("openshift_cli_installer.utils.clusters", id="utils-clusters"),
+        # Platform modules are imported per cluster
+        pytest.param("openshift_cli_installer.libs.clusters.ocp_clusters", id="ocp-clusters"),
+    ],
+)
+def test_import_time(module):
+    imports_times = _get_imports_times(module=module)
+
+    assert not sorted({_module.split(".")[0] for _module in imports_times} & set(HEAVY_PACKAGES))
+    assert imports_times[module] < IMPORT_TIME_BUDGET_MICROSECONDS
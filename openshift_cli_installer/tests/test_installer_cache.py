@@ -0,0 +1,127 @@
+import fcntl
+import os
+
+import pytest
+
+from openshift_cli_installer.utils import installer_cache
+from openshift_cli_installer.utils.installer_cache import (
+    get_cached_openshift_install_binary,
+    get_installer_cache_entry_in_use_lock_file,
+    release_installer_cache_entries,
+)
+
+OPENSHIFT_INSTALL_BINARY = "openshift-install"
+
+
+class FakeExtractor:
+    def __init__(self, size=10):
+        self.calls = 0
+        self.size = size
+
+    def __call__(self, binary_dir):
+        self.calls += 1
+        os.makedirs(binary_dir, exist_ok=True)
+        with open(os.path.join(binary_dir, OPENSHIFT_INSTALL_BINARY), "wb") as fd:
+            fd.write(b"0" * self.size)
+
+
+@pytest.fixture(autouse=True)
+def release_entries():
+    yield
+    release_installer_cache_entries()
+
+
+@pytest.fixture
+def extractor():
+    return FakeExtractor()
+
+
+def _get_binary(cache_dir, version_url, extractor, max_size_bytes=1024):
+    return get_cached_openshift_install_binary(
+        cache_dir=str(cache_dir),
+        version_url=version_url,
+        openshift_install_binary=OPENSHIFT_INSTALL_BINARY,
+        extract_func=extractor,
+        max_size_bytes=max_size_bytes,
+    )
+
+
+def test_installer_cache_hit(tmp_path, extractor, mocker):
+    first_path = _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.15.8", extractor=extractor)
+    # Size and mtime did not change, the binary is not hashed again
+    sha256_spy = mocker.spy(installer_cache, "get_file_sha256")
+    second_path = _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.15.8", extractor=extractor)
+
+    assert first_path == second_path
+    assert os.path.isfile(first_path)
+    assert extractor.calls == 1
+    assert sha256_spy.call_count == 0
+
+
+def test_installer_cache_same_size_modified_binary_is_extracted_again(tmp_path, extractor):
+    binary_path = _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.15.8", extractor=extractor)
+    with open(binary_path, "r+b") as fd:
+        fd.write(b"1")
+    os.utime(binary_path, ns=(0, 0))
+
+    _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.15.8", extractor=extractor)
+
+    assert extractor.calls == 2
+
+
+def test_installer_cache_corrupted_binary_is_extracted_again(tmp_path, extractor):
+    binary_path = _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.15.8", extractor=extractor)
+    with open(binary_path, "ab") as fd:
+        fd.write(b"corrupted")
+
+    _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.15.8", extractor=extractor)
+
+    assert extractor.calls == 2
+
+
+def test_installer_cache_evicts_least_recently_used(tmp_path):
+    extractor = FakeExtractor(size=400)
+    oldest_path = _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.14.1", extractor=extractor)
+    recent_path = _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.14.2", extractor=extractor)
+    # Mark the first entry as least recently used
+    os.utime(os.path.join(os.path.dirname(oldest_path), "metadata.json"), (0, 0))
+    # Not used anymore by this run
+    release_installer_cache_entries()
+    newest_path = _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.15.8", extractor=extractor)
+
+    assert not os.path.exists(oldest_path)
+    assert os.path.isfile(recent_path)
+    assert os.path.isfile(newest_path)
+    # Evicted entry lock files are removed
+    oldest_cache_key = os.path.basename(os.path.dirname(oldest_path))
+    assert not [_file for _file in os.listdir(tmp_path) if _file.startswith(oldest_cache_key)]
+
+
+def test_installer_cache_does_not_evict_entries_in_use(tmp_path):
+    extractor = FakeExtractor(size=400)
+    in_use_path = _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.14.1", extractor=extractor)
+    os.utime(os.path.join(os.path.dirname(in_use_path), "metadata.json"), (0, 0))
+    release_installer_cache_entries()
+
+    # Another run still uses the binary
+    with open(
+        get_installer_cache_entry_in_use_lock_file(
+            cache_dir=str(tmp_path), cache_key=os.path.basename(os.path.dirname(in_use_path))
+        ),
+        "a",
+    ) as fd:
+        fcntl.flock(fd, fcntl.LOCK_SH)
+        _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.14.2", extractor=extractor)
+        _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.15.8", extractor=extractor)
+
+    assert os.path.isfile(in_use_path)
+
+
+def test_installer_cache_failed_extraction_leaves_no_entry(tmp_path):
+    def _failed_extract(binary_dir):
+        raise RuntimeError("extract failed")
+
+    with pytest.raises(RuntimeError):
+        _get_binary(cache_dir=tmp_path, version_url="quay.io/release:4.15.8", extractor=_failed_extract)
+
+    assert not [_entry for _entry in os.listdir(tmp_path) if not _entry.endswith(".lock")]
@@ -0,0 +1,99 @@
+import base64
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from ocm_python_client.exceptions import UnauthorizedException
+
+from openshift_cli_installer.utils import general
+from openshift_cli_installer.utils.ocm_client_pool import PooledOCMClient, get_pooled_ocm_client
+
+
+class FakeSSO:
+    def __init__(self):
+        self.calls = 0
+        self.expires_in = 3600
+        self.calls_lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self.calls_lock:
+            self.calls += 1
+            calls = self.calls
+
+        time.sleep(0.05)
+        # JWT with `exp`, unique per exchange
+        payload = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + self.expires_in}).encode()).decode()
+        return FakeResponse(access_token=f"header.{payload.rstrip('=')}.signature-{calls}")
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, access_token):
+        self.access_token = access_token
+
+    def json(self):
+        return {"access_token": self.access_token}
+
+
+@pytest.fixture(autouse=True)
+def new_run(mocker):
+    mocker.patch.dict(general._SINGLE_FLIGHT_RESULTS, clear=True)
+
+
+@pytest.fixture
+def fake_sso(mocker):
+    fake_sso = FakeSSO()
+    mocker.patch("ocm_python_wrapper.ocm_client.requests.post", fake_sso)
+    return fake_sso
+
+
+def test_pooled_ocm_client_single_token_exchange_per_env(fake_sso):
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [
+            executor.submit(get_pooled_ocm_client, ocm_token="offline-token", ocm_env="stage") for _ in range(10)
+        ]
+
+    assert len({id(_future.result().api_client) for _future in futures}) == 1
+    assert fake_sso.calls == 1
+
+    get_pooled_ocm_client(ocm_token="offline-token", ocm_env="production")
+    assert fake_sso.calls == 2
+
+
+def test_pooled_ocm_client_refreshes_before_expiry(fake_sso, mocker):
+    fake_sso.expires_in = 10
+    ocm_client = PooledOCMClient(token="offline-token", api_host="stage")
+    fake_sso.expires_in = 3600
+    api_call = mocker.patch("ocm_python_client.api_client.ApiClient.call_api", return_value="ok")
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [executor.submit(ocm_client.call_api, "/api/clusters_mgmt/v1/clusters", "GET") for _ in range(10)]
+
+    assert {_future.result() for _future in futures} == {"ok"}
+    assert api_call.call_count == 10
+    # Initial token exchange + a single refresh
+    assert fake_sso.calls == 2
+
+
+def test_pooled_ocm_client_refreshes_once_on_concurrent_unauthorized(fake_sso, mocker):
+    ocm_client = get_pooled_ocm_client(ocm_token="offline-token", ocm_env="stage").api_client
+    expired_access_token = ocm_client.client_config.access_token
+
+    def _call_api(api_client, *args, **kwargs):
+        if api_client.client_config.access_token == expired_access_token:
+            time.sleep(0.05)
+            raise UnauthorizedException(status=401, reason="Unauthorized")
+
+        return "ok"
+
+    mocker.patch("ocm_python_client.api_client.ApiClient.call_api", side_effect=_call_api)
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [executor.submit(ocm_client.call_api, "/api/clusters_mgmt/v1/clusters", "GET") for _ in range(10)]
+
+    assert {_future.result() for _future in futures} == {"ok"}
+    # Initial token exchange + a single refresh
+    assert fake_sso.calls == 2
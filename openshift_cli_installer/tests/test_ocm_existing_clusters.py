@@ -0,0 +1,119 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from ocm_python_client.api.default_api import DefaultApi
+from ocm_python_client.api_client import ApiClient
+from ocm_python_client.configuration import Configuration
+
+from openshift_cli_installer.utils.clusters import get_existing_ocm_clusters_names
+
+OCM_CLUSTERS = [f"existing-cluster-{idx}" for idx in range(120)]
+
+
+class FakeOCMHandler(BaseHTTPRequestHandler):
+    requests_log: ClassVar[list[dict]] = []
+    reject_batched_search = False
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode())
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {_key: _value[0] for _key, _value in parse_qs(url.query).items()}
+        self.requests_log.append(query)
+        search = query.get("search", "")
+
+        if search.startswith("name in") and self.reject_batched_search:
+            self._send(status=400, body={"kind": "Error", "reason": "Unsupported search"})
+            return
+
+        if url.path == "/api/clusters_mgmt/v1/clusters":
+            names = re.findall(r"'([^']+)'", search)
+            matches = [_name for _name in OCM_CLUSTERS if _name in names]
+            page, size = int(query.get("page", 1)), int(query.get("size", 100))
+            items = matches[(page - 1) * size : page * size]
+            self._send(
+                status=200,
+                body={
+                    "kind": "ClusterList",
+                    "page": page,
+                    "size": len(items),
+                    "total": len(matches),
+                    "items": [{"kind": "Cluster", "id": _name, "name": _name} for _name in items],
+                },
+            )
+            return
+
+        cluster_id = url.path.rsplit("/", 1)[-1]
+        self._send(status=200, body={"kind": "Cluster", "id": cluster_id, "name": cluster_id})
+
+
+@pytest.fixture
+def fake_ocm_server():
+    FakeOCMHandler.requests_log = []
+    FakeOCMHandler.reject_batched_search = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOCMHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def ocm_client(fake_ocm_server):
+    return DefaultApi(
+        api_client=ApiClient(
+            configuration=Configuration(
+                host=f"http://127.0.0.1:{fake_ocm_server.server_address[1]}", discard_unknown_keys=True
+            )
+        )
+    )
+
+
+def test_existing_ocm_clusters_batched_search(ocm_client):
+    names = OCM_CLUSTERS[:3] + ["new-cluster-1", "new-cluster-2"]
+
+    assert get_existing_ocm_clusters_names(ocm_client=ocm_client, names=names) == set(OCM_CLUSTERS[:3])
+    assert len(FakeOCMHandler.requests_log) == 1
+
+
+def test_existing_ocm_clusters_batched_search_pagination(ocm_client, mocker):
+    mocker.patch("openshift_cli_installer.utils.clusters.OCM_CLUSTERS_SEARCH_PAGE_SIZE", 20)
+    names = OCM_CLUSTERS[:45] + ["new-cluster-1"]
+
+    assert get_existing_ocm_clusters_names(ocm_client=ocm_client, names=names) == set(OCM_CLUSTERS[:45])
+    # 45 existing clusters, 20 per page
+    assert [_request["page"] for _request in FakeOCMHandler.requests_log] == ["1", "2", "3"]
+
+
+def test_existing_ocm_clusters_batched_search_max_names(ocm_client):
+    names = OCM_CLUSTERS[:110]
+
+    assert get_existing_ocm_clusters_names(ocm_client=ocm_client, names=names) == set(names)
+    # 50 names per search
+    assert len(FakeOCMHandler.requests_log) == 3
+
+
+def test_existing_ocm_clusters_fallback(ocm_client):
+    FakeOCMHandler.reject_batched_search = True
+    names = OCM_CLUSTERS[:2] + ["new-cluster-1"]
+
+    assert get_existing_ocm_clusters_names(ocm_client=ocm_client, names=names) == set(OCM_CLUSTERS[:2])
+    # Rejected batched search, then per cluster checks
+    assert {
+        _request["search"]
+        for _request in FakeOCMHandler.requests_log
+        if _request.get("search", "").startswith("name like")
+    } == {f"name like '{_name}'" for _name in names}
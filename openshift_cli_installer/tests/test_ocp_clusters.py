@@ -0,0 +1,506 @@
+import copy
+import threading
+import time
+from types import SimpleNamespace
+
+import click
+import pytest
+
+from openshift_cli_installer.libs.clusters.ocm_cluster import OcmCluster
+from openshift_cli_installer.libs.clusters.ocp_clusters import OCPClusters
+from openshift_cli_installer.utils.const import (
+    AWS_STR,
+    DESTROY_CLUSTER_ATTEMPTS,
+    DESTROY_PARTIAL_FAILURE_EXIT_CODE,
+    HYPERSHIFT_STR,
+    ON_FAILURE_DESTROY_ALL_STR,
+    ON_FAILURE_FAIL_FAST_STR,
+    ON_FAILURE_KEEP_SUCCESSFUL_STR,
+    ROSA_STR,
+)
+from openshift_cli_installer.utils.run_manifest import (
+    get_cluster_user_input,
+    get_run_result_manifest_path,
+    read_run_result_manifest,
+)
+
+PREFLIGHT_CHECKS = (
+    "check_ocm_managed_existing_clusters",
+    "is_region_support_hypershift",
+    "is_region_support_aws",
+    "is_region_support_gcp",
+)
+
+
+class FakeCluster:
+    def __init__(self, ocp_cluster):
+        self.cluster = ocp_cluster
+        self.user_input_cluster = copy.deepcopy(ocp_cluster)
+        self.cluster_info = {
+            "name": ocp_cluster["name"],
+            "platform": ocp_cluster["platform"],
+            "acm": ocp_cluster.get("acm", False),
+            "acm-observability": ocp_cluster.get("acm-observability", False),
+            "acm-clusters": ocp_cluster.get("acm-clusters"),
+            "region": ocp_cluster.get("region", "us-east-2"),
+            "ocm-env": ocp_cluster.get("ocm-env", "stage"),
+            "cluster-dir": ocp_cluster.get("cluster_dir", f"/tmp/{ocp_cluster['name']}"),
+            "shortuuid": ocp_cluster.get("shortuuid", "abc"),
+        }
+
+    def create_cluster(self):
+        pass
+
+    def load_created_cluster(self):
+        pass
+
+    @property
+    def resumed(self):
+        return False
+
+    def run_phase(self, phase, func, restore_keys=(), resume_func=None):
+        func()
+
+    def install_acm(self):
+        pass
+
+    def enable_observability(self):
+        pass
+
+
+class FakeUserInput:
+    def __init__(
+        self,
+        clusters,
+        create=False,
+        max_parallel=None,
+        concurrency_limits=None,
+        on_failure=ON_FAILURE_DESTROY_ALL_STR,
+        clusters_install_data_directory="/tmp/clusters-install-data",
+        run_result_manifest=None,
+    ):
+        self.clusters = clusters
+        self.create = create
+        self.action = "create" if create else "destroy"
+        self.parallel = True
+        self.max_parallel = max_parallel
+        self.concurrency_limits = concurrency_limits or {}
+        self.on_failure = on_failure
+        self.clusters_install_data_directory = clusters_install_data_directory
+        self.run_result_manifest = run_result_manifest or {}
+
+
+def _get_cluster_object(self, ocp_cluster):
+    if ocp_cluster["name"].startswith("bad"):
+        raise click.Abort()
+
+    return FakeCluster(ocp_cluster=ocp_cluster)
+
+
+@pytest.fixture
+def fake_cluster_objects(mocker):
+    mocker.patch.object(OCPClusters, "get_cluster_object", _get_cluster_object)
+
+
+def test_prepare_clusters_keeps_user_input_order(fake_cluster_objects):
+    clusters = [
+        {"name": "rosa-1", "platform": ROSA_STR},
+        {"name": "aws-1", "platform": AWS_STR},
+        {"name": "rosa-2", "platform": ROSA_STR},
+    ]
+    ocp_clusters = OCPClusters(user_input=FakeUserInput(clusters=clusters))
+
+    assert [_cluster.cluster_info["name"] for _cluster in ocp_clusters.rosa_clusters] == ["rosa-1", "rosa-2"]
+    assert [_cluster.cluster_info["name"] for _cluster in ocp_clusters.aws_ipi_clusters] == ["aws-1"]
+
+
+def test_prepare_clusters_reports_all_failures(fake_cluster_objects, mocker):
+    clusters = [
+        {"name": "bad-1", "platform": ROSA_STR},
+        {"name": "aws-1", "platform": AWS_STR},
+        {"name": "bad-2", "platform": AWS_STR},
+    ]
+    error_logger = mocker.patch("simple_logger.logger.logging.Logger.error")
+
+    with pytest.raises(click.Abort):
+        OCPClusters(user_input=FakeUserInput(clusters=clusters))
+
+    error_message = error_logger.call_args.args[0]
+    assert "bad-1" in error_message and "bad-2" in error_message
+    assert "aws-1" not in error_message
+
+
+def test_prepare_clusters_unsupported_platform(mocker):
+    error_logger = mocker.patch("simple_logger.logger.logging.Logger.error")
+    # Destroy from S3 / install data directory clusters have no `name` in user input
+    clusters = [{"platform": "unknown", "cluster_info": {"name": "destroyed-1"}}]
+
+    with pytest.raises(click.Abort):
+        OCPClusters(user_input=FakeUserInput(clusters=clusters))
+
+    assert error_logger.call_args_list[0].args[0] == "Unsupported platform unknown"
+    assert "destroyed-1: Abort" in error_logger.call_args.args[0]
+
+
+def _slow_check(failures):
+    def _check(self):
+        time.sleep(0.3)
+        return failures
+
+    return _check
+
+
+def _failed_check(self):
+    raise RuntimeError("OCM error")
+
+
+def test_preflight_checks_run_concurrently(fake_cluster_objects, mocker):
+    for _check in PREFLIGHT_CHECKS:
+        mocker.patch.object(OCPClusters, _check, _slow_check(failures=[]))
+
+    start_time = time.time()
+    OCPClusters(user_input=FakeUserInput(clusters=[{"name": "aws-1", "platform": AWS_STR}], create=True))
+
+    assert time.time() - start_time < 0.3 * len(PREFLIGHT_CHECKS)
+
+
+def test_preflight_checks_report_all_failures(fake_cluster_objects, mocker):
+    mocker.patch.object(OCPClusters, "is_region_support_aws", _slow_check(failures=["aws region: us-east-7"]))
+    mocker.patch.object(OCPClusters, "is_region_support_gcp", _slow_check(failures=["gcp region: us-east-7"]))
+    mocker.patch.object(OCPClusters, "is_region_support_hypershift", _slow_check(failures=[]))
+    mocker.patch.object(OCPClusters, "check_ocm_managed_existing_clusters", _failed_check)
+    error_logger = mocker.patch("simple_logger.logger.logging.Logger.error")
+
+    with pytest.raises(click.Abort):
+        OCPClusters(user_input=FakeUserInput(clusters=[{"name": "aws-1", "platform": AWS_STR}], create=True))
+
+    error_message = error_logger.call_args.args[0]
+    assert "aws region: us-east-7" in error_message
+    assert "gcp region: us-east-7" in error_message
+    assert "OCM error" in error_message
+
+
+def test_create_clusters_tasks_graph(fake_cluster_objects):
+    clusters = [
+        {"name": "hub", "platform": AWS_STR, "acm": True, "acm-observability": True, "acm-clusters": ["managed"]},
+        {"name": "managed", "platform": ROSA_STR},
+    ]
+    ocp_clusters = OCPClusters(user_input=FakeUserInput(clusters=clusters))
+
+    assert {_task.name: _task.dependencies for _task in ocp_clusters.get_create_clusters_tasks()} == {
+        "create:hub": (),
+        "create:managed": (),
+        "install-acm:hub": ("create:hub",),
+        "enable-observability:hub": ("install-acm:hub",),
+        "attach:hub:managed": ("install-acm:hub", "create:managed"),
+    }
+
+
+def test_concurrency_limits(fake_cluster_objects):
+    clusters = [
+        {"name": "hyper-1", "platform": HYPERSHIFT_STR, "region": "us-west-2"},
+        {"name": "hyper-2", "platform": HYPERSHIFT_STR, "region": "us-east-2"},
+        {"name": "aws-1", "platform": AWS_STR, "region": "us-east-2"},
+    ]
+    ocp_clusters = OCPClusters(
+        user_input=FakeUserInput(
+            clusters=clusters,
+            concurrency_limits={"platform-per-region": {HYPERSHIFT_STR: 3}, "ocm-env": {"stage": 5}},
+        )
+    )
+
+    assert ocp_clusters.get_concurrency_limits() == {
+        f"platform-per-region:{HYPERSHIFT_STR}:us-west-2": 3,
+        f"platform-per-region:{HYPERSHIFT_STR}:us-east-2": 3,
+        "ocm-env:stage": 5,
+    }
+
+
+def test_run_destroy_clusters_respects_max_parallel(fake_cluster_objects, mocker):
+    running = []
+    max_running = []
+    running_lock = threading.Lock()
+
+    def _destroy_cluster(self):
+        with running_lock:
+            running.append(self)
+            max_running.append(len(running))
+
+        time.sleep(0.05)
+        with running_lock:
+            running.remove(self)
+
+    mocker.patch.object(FakeCluster, "destroy_cluster", _destroy_cluster, create=True)
+    clusters = [{"name": f"aws-{idx}", "platform": AWS_STR} for idx in range(6)]
+    OCPClusters(user_input=FakeUserInput(clusters=clusters, max_parallel=2)).run_destroy_clusters()
+
+    assert max(max_running) == 2
+
+
+@pytest.mark.parametrize(
+    "on_failure, expected_destroyed",
+    [
+        pytest.param(ON_FAILURE_DESTROY_ALL_STR, ["aws-0", "aws-1", "aws-2", "aws-3"], id="destroy-all"),
+        pytest.param(ON_FAILURE_FAIL_FAST_STR, ["aws-0"], id="fail-fast"),
+    ],
+)
+def test_run_create_clusters_workflow_rollback(fake_cluster_objects, mocker, tmp_path, on_failure, expected_destroyed):
+    destroyed = []
+
+    def _create_cluster(self):
+        if self.cluster_info["name"] == "aws-1":
+            time.sleep(0.05)
+            raise click.Abort()
+
+        if self.cluster_info["name"] != "aws-0":
+            # Still running when aws-1 fails, stops at the cancellation checkpoint
+            time.sleep(0.1)
+            if self.cancel_event.is_set():
+                raise click.Abort()
+
+    mocker.patch.object(FakeCluster, "create_cluster", _create_cluster)
+    mocker.patch.object(
+        FakeCluster, "destroy_cluster", lambda self: destroyed.append(self.cluster_info["name"]), create=True
+    )
+    mocker.patch.object(OCPClusters, "run_preflight_checks")
+    clusters = [{"name": f"aws-{idx}", "platform": AWS_STR} for idx in range(4)]
+    ocp_clusters = OCPClusters(
+        user_input=FakeUserInput(
+            clusters=clusters,
+            create=True,
+            max_parallel=3,
+            on_failure=on_failure,
+            clusters_install_data_directory=str(tmp_path / "clusters-install-data"),
+        )
+    )
+
+    with pytest.raises(click.Abort):
+        ocp_clusters.run_create_clusters_workflow()
+
+    assert sorted(destroyed) == expected_destroyed
+
+
+def test_run_create_clusters_workflow_rollback_destroy_failure(fake_cluster_objects, mocker, tmp_path):
+    def _create_cluster(self):
+        if self.cluster_info["name"] == "aws-1":
+            raise click.Abort()
+
+    def _destroy_cluster(self):
+        if self.cluster_info["name"] == "aws-2":
+            raise click.Abort()
+
+    mocker.patch.object(FakeCluster, "create_cluster", _create_cluster)
+    mocker.patch.object(FakeCluster, "destroy_cluster", _destroy_cluster, create=True)
+    mocker.patch("openshift_cli_installer.libs.clusters.ocp_clusters.time.sleep")
+    mocker.patch.object(OCPClusters, "run_preflight_checks")
+    clusters_install_data_directory = str(tmp_path / "clusters-install-data")
+
+    with pytest.raises(click.Abort):
+        OCPClusters(
+            user_input=FakeUserInput(
+                clusters=[{"name": f"aws-{idx}", "platform": AWS_STR} for idx in range(3)],
+                create=True,
+                on_failure=ON_FAILURE_DESTROY_ALL_STR,
+                clusters_install_data_directory=clusters_install_data_directory,
+            )
+        ).run_create_clusters_workflow()
+
+    manifest = read_run_result_manifest(
+        manifest_path=get_run_result_manifest_path(clusters_install_data_directory=clusters_install_data_directory)
+    )
+    # aws-2 is still live, created again by `--retry-failed`
+    assert {_cluster["name"]: _cluster["status"] for _cluster in manifest["clusters"]} == {
+        "aws-0": "destroyed",
+        "aws-1": "destroyed",
+        "aws-2": "failed",
+    }
+
+
+def test_run_create_clusters_workflow_destroy_all_cancels_acm_tasks(fake_cluster_objects, mocker, tmp_path):
+    calls = []
+
+    def _create_cluster(self):
+        if self.cluster_info["name"] == "aws-1":
+            raise click.Abort()
+
+        # Still running when aws-1 fails, not interrupted
+        time.sleep(0.1)
+        calls.append(f"create:{self.cluster_info['name']}")
+
+    mocker.patch.object(FakeCluster, "create_cluster", _create_cluster)
+    mocker.patch.object(
+        FakeCluster, "install_acm", lambda self: calls.append(f"install-acm:{self.cluster_info['name']}")
+    )
+    mocker.patch.object(
+        OCPClusters,
+        "attach_cluster_to_acm_hub",
+        side_effect=lambda hub, managed_cluster: calls.append(f"attach:{managed_cluster.cluster_info['name']}"),
+    )
+    mocker.patch.object(
+        FakeCluster, "destroy_cluster", lambda self: calls.append(f"destroy:{self.cluster_info['name']}"), create=True
+    )
+    mocker.patch.object(OCPClusters, "run_preflight_checks")
+    clusters = [
+        {"name": "aws-0", "platform": AWS_STR, "acm": True, "acm-clusters": ["aws-2"]},
+        {"name": "aws-1", "platform": AWS_STR},
+        {"name": "aws-2", "platform": AWS_STR},
+    ]
+    ocp_clusters = OCPClusters(
+        user_input=FakeUserInput(
+            clusters=clusters,
+            create=True,
+            on_failure=ON_FAILURE_DESTROY_ALL_STR,
+            clusters_install_data_directory=str(tmp_path / "clusters-install-data"),
+        )
+    )
+
+    with pytest.raises(click.Abort):
+        ocp_clusters.run_create_clusters_workflow()
+
+    assert not ocp_clusters.cancel_event.is_set()
+    assert sorted(calls) == ["create:aws-0", "create:aws-2", "destroy:aws-0", "destroy:aws-1", "destroy:aws-2"]
+
+
+def test_run_create_clusters_workflow_keep_successful_and_retry_failed(fake_cluster_objects, mocker, tmp_path):
+    calls = []
+    failed_clusters = {"aws-1"}
+
+    def _create_cluster(self):
+        calls.append(f"create:{self.cluster_info['name']}")
+        if self.cluster_info["name"] in failed_clusters:
+            raise click.Abort()
+
+    mocker.patch.object(FakeCluster, "create_cluster", _create_cluster)
+    mocker.patch.object(
+        FakeCluster, "load_created_cluster", lambda self: calls.append(f"load:{self.cluster_info['name']}")
+    )
+    mocker.patch.object(
+        FakeCluster, "install_acm", lambda self: calls.append(f"install-acm:{self.cluster_info['name']}")
+    )
+    mocker.patch.object(
+        OCPClusters,
+        "attach_cluster_to_acm_hub",
+        side_effect=lambda hub, managed_cluster: calls.append(f"attach:{managed_cluster.cluster_info['name']}"),
+    )
+    mocker.patch.object(FakeCluster, "destroy_cluster", side_effect=lambda: calls.append("destroy"), create=True)
+    mocker.patch.object(OCPClusters, "run_preflight_checks")
+    clusters_install_data_directory = str(tmp_path / "clusters-install-data")
+    clusters = [
+        {"name": "aws-0", "platform": AWS_STR, "acm": True, "acm-clusters": ["aws-1", "aws-2"]},
+        {"name": "aws-1", "platform": AWS_STR, "aws-access-key-id": "secret"},
+        {"name": "aws-2", "platform": AWS_STR},
+    ]
+
+    with pytest.raises(click.Abort):
+        OCPClusters(
+            user_input=FakeUserInput(
+                clusters=clusters,
+                create=True,
+                on_failure=ON_FAILURE_KEEP_SUCCESSFUL_STR,
+                clusters_install_data_directory=clusters_install_data_directory,
+            )
+        ).run_create_clusters_workflow()
+
+    assert "destroy" not in calls
+    manifest_path = get_run_result_manifest_path(clusters_install_data_directory=clusters_install_data_directory)
+    manifest = read_run_result_manifest(manifest_path=manifest_path)
+    assert {_cluster["name"]: _cluster["status"] for _cluster in manifest["clusters"]} == {
+        "aws-0": "created",
+        "aws-1": "failed",
+        "aws-2": "created",
+    }
+    assert manifest["tasks"]["skipped"] == ["attach:aws-0:aws-1"]
+    assert "aws-access-key-id" not in manifest["clusters"][1]["user-input"]
+
+    calls.clear()
+    failed_clusters.clear()
+    OCPClusters(
+        user_input=FakeUserInput(
+            clusters=[_cluster["user-input"] for _cluster in manifest["clusters"]],
+            create=True,
+            on_failure=ON_FAILURE_KEEP_SUCCESSFUL_STR,
+            clusters_install_data_directory=clusters_install_data_directory,
+            run_result_manifest=manifest,
+        )
+    ).run_create_clusters_workflow()
+
+    assert sorted(calls) == ["attach:aws-1", "create:aws-1", "load:aws-0", "load:aws-2"]
+    assert {_cluster["status"] for _cluster in read_run_result_manifest(manifest_path=manifest_path)["clusters"]} == {
+        "created"
+    }
+
+
+def test_run_destroy_clusters_continues_on_error(fake_cluster_objects, mocker):
+    attempts = {}
+
+    def _destroy_cluster(self):
+        _name = self.cluster_info["name"]
+        attempts[_name] = attempts.get(_name, 0) + 1
+        # flaky-1 fails transiently, stuck-1 always fails
+        if _name == "stuck-1" or (_name == "flaky-1" and attempts[_name] < 3):
+            raise click.Abort()
+
+    mocker.patch.object(FakeCluster, "destroy_cluster", _destroy_cluster, create=True)
+    sleep_mock = mocker.patch("openshift_cli_installer.libs.clusters.ocp_clusters.time.sleep")
+    error_logger = mocker.patch("simple_logger.logger.logging.Logger.error")
+    clusters = [{"name": _name, "platform": AWS_STR} for _name in ("aws-1", "stuck-1", "flaky-1", "aws-2")]
+
+    with pytest.raises(click.exceptions.Exit) as exc_info:
+        OCPClusters(user_input=FakeUserInput(clusters=clusters)).run_destroy_clusters()
+
+    assert exc_info.value.exit_code == DESTROY_PARTIAL_FAILURE_EXIT_CODE
+    assert attempts == {"aws-1": 1, "stuck-1": DESTROY_CLUSTER_ATTEMPTS, "flaky-1": 3, "aws-2": 1}
+    assert sleep_mock.call_count == 4
+    summary = error_logger.call_args.args[0]
+    assert "1 of 4 cluster(s) failed to destroy" in summary
+    assert "stuck-1: failed" in summary
+    assert "flaky-1: destroyed" in summary
+
+
+def test_run_destroy_clusters_all_failed(fake_cluster_objects, mocker):
+    mocker.patch.object(FakeCluster, "destroy_cluster", side_effect=click.Abort, create=True)
+    mocker.patch("openshift_cli_installer.libs.clusters.ocp_clusters.time.sleep")
+    clusters = [{"name": f"aws-{idx}", "platform": AWS_STR} for idx in range(2)]
+
+    with pytest.raises(click.Abort):
+        OCPClusters(user_input=FakeUserInput(clusters=clusters)).run_destroy_clusters()
+
+
+def test_ocm_cluster_retry_user_input(mocker, tmp_path):
+    mocker.patch.object(OcmCluster, "get_ocm_client")
+    mocker.patch("openshift_cli_installer.libs.clusters.ocm_cluster.Cluster")
+    user_input = SimpleNamespace(
+        create=True,
+        resume=False,
+        destroy_from_s3_bucket_or_local_directory=False,
+        s3_bucket_name="",
+        s3_bucket_path="",
+        s3_bucket_path_uuid="",
+        cache_dir="",
+        ocm_token="123",
+        clusters_install_data_directory=str(tmp_path / "clusters-install-data"),
+    )
+    cluster = OcmCluster(
+        ocp_cluster={
+            "name-prefix": "rosa",
+            "platform": ROSA_STR,
+            "region": "us-east-2",
+            "version": "4.15",
+            "channel-group": "stable",
+            "expiration-time": "4h",
+        },
+        user_input=user_input,
+    )
+    # Created by the run, deleted by its rollback
+    cluster.cluster.update({"oidc-config-id": "oidc-1", "subnet-ids": '"subnet-1,subnet-2"'})
+
+    cluster_user_input = get_cluster_user_input(cluster=cluster)
+
+    assert cluster_user_input["expiration-time"] == "4h"
+    assert "oidc-config-id" not in cluster_user_input
+    assert "subnet-ids" not in cluster_user_input
+
+    retry_cluster = OcmCluster(ocp_cluster=cluster_user_input, user_input=user_input)
+
+    for _key in ("name", "region", "cluster-dir", "shortuuid"):
+        assert retry_cluster.cluster_info[_key] == cluster.cluster_info[_key]
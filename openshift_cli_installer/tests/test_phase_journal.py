@@ -0,0 +1,65 @@
+import logging
+
+import pytest
+
+from openshift_cli_installer.libs.clusters.ocp_cluster import OCPCluster
+from openshift_cli_installer.utils.phase_journal import PHASE_COMPLETED_STR, PHASE_STARTED_STR, PhaseJournal
+
+
+@pytest.fixture
+def phase_journal(tmp_path):
+    return PhaseJournal(journal_file=str(tmp_path / "phases.jsonl"))
+
+
+def _get_cluster(phase_journal, resume):
+    # Only the attributes used by `run_phase`
+    cluster = OCPCluster.__new__(OCPCluster)
+    cluster.logger = logging.getLogger(__name__)
+    cluster.log_prefix = "[C:test-cl]"
+    cluster.cluster = {}
+    cluster.cluster_info = {}
+    cluster.phase_journal = phase_journal
+    cluster.completed_phases, cluster.interrupted_phases = phase_journal.load() if resume else ({}, set())
+    return cluster
+
+
+def test_phase_journal_load(phase_journal):
+    phase_journal.record(phase="oidc", event=PHASE_STARTED_STR)
+    phase_journal.record(phase="oidc", event=PHASE_COMPLETED_STR, data={"oidc-config-id": "123"})
+    phase_journal.record(phase="rosa-create", event=PHASE_STARTED_STR)
+    # Process killed while writing
+    with open(phase_journal.journal_file, "a") as fd:
+        fd.write('{"phase": "rosa-cr')
+
+    assert phase_journal.load() == ({"oidc": {"oidc-config-id": "123"}}, {"rosa-create"})
+
+
+def test_phase_journal_reset(phase_journal):
+    phase_journal.record(phase="oidc", event=PHASE_STARTED_STR)
+    phase_journal.reset()
+
+    assert phase_journal.load() == ({}, set())
+
+
+def test_run_phase_resume(phase_journal):
+    calls = []
+
+    def _create_oidc():
+        calls.append("oidc")
+        cluster.cluster_info["oidc-config-id"] = "123"
+
+    cluster = _get_cluster(phase_journal=phase_journal, resume=False)
+    cluster.run_phase(phase="oidc", func=_create_oidc, restore_keys=("oidc-config-id",))
+    phase_journal.record(phase="rosa-create", event=PHASE_STARTED_STR)
+
+    cluster = _get_cluster(phase_journal=phase_journal, resume=True)
+    cluster.run_phase(phase="oidc", func=_create_oidc, restore_keys=("oidc-config-id",))
+    cluster.run_phase(
+        phase="rosa-create", func=lambda: calls.append("rosa-create"), resume_func=lambda: calls.append("resume")
+    )
+    cluster.run_phase(phase="install-acm", func=lambda: calls.append("install-acm"))
+
+    assert cluster.cluster_info["oidc-config-id"] == cluster.cluster["oidc-config-id"] == "123"
+    # `resume_func` returns None, the interrupted phase runs again
+    assert calls == ["oidc", "resume", "rosa-create", "install-acm"]
+    assert set(phase_journal.load()[0]) == {"oidc", "rosa-create", "install-acm"}
@@ -0,0 +1,196 @@
+import io
+import os
+import shutil
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from openshift_cli_installer.utils.s3_backup import stream_zip_to_s3
+
+PART_SIZE = 5 * 1024 * 1024
+# Simulated network time to upload one MiB
+UPLOAD_SECONDS_PER_MIB = 0.01
+
+
+class FakeS3Client:
+    """
+    In-memory S3 stand-in, implements the multipart upload and `upload_file` calls used by the backups.
+    """
+
+    def __init__(self, fail_part_number=None):
+        self.fail_part_number = fail_part_number
+        self.lock = threading.Lock()
+        self.uploads = {}
+        self.objects = {}
+        self.aborted = []
+        self.max_in_flight_parts = 0
+        self._in_flight_parts = 0
+
+    @staticmethod
+    def _simulate_upload(body_size):
+        time.sleep(body_size / 1024 / 1024 * UPLOAD_SECONDS_PER_MIB)
+
+    def create_multipart_upload(self, Bucket, Key):
+        upload_id = f"{Bucket}/{Key}/{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        with self.lock:
+            self._in_flight_parts += 1
+            self.max_in_flight_parts = max(self.max_in_flight_parts, self._in_flight_parts)
+
+        try:
+            if PartNumber == self.fail_part_number:
+                raise ConnectionError(f"Failed to upload part {PartNumber}")
+
+            self._simulate_upload(body_size=len(Body))
+            self.uploads[UploadId][PartNumber] = Body
+            return {"ETag": f"etag-{PartNumber}"}
+        finally:
+            with self.lock:
+                self._in_flight_parts -= 1
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        part_numbers = [_part["PartNumber"] for _part in MultipartUpload["Parts"]]
+        assert part_numbers == sorted(parts)
+        # S3 rejects parts smaller than 5 MiB, except for the last one
+        assert all(len(parts[_part_number]) >= PART_SIZE for _part_number in part_numbers[:-1])
+        self.objects[(Bucket, Key)] = b"".join(parts[_part_number] for _part_number in part_numbers)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+
+    def upload_file(self, Filename, Bucket, Key):
+        body = Path(Filename).read_bytes()
+        self._simulate_upload(body_size=len(body))
+        self.objects[(Bucket, Key)] = body
+
+
+def _create_install_dir(install_dir, large_files_count=1):
+    # Mimic an IPI install dir: small text files, a large log and large, poorly compressible, binary files
+    (install_dir / "auth").mkdir(parents=True)
+    (install_dir / "auth" / "kubeconfig").write_text("apiVersion: v1\nkind: Config\n" * 100)
+    (install_dir / "auth" / "kubeadmin-password").write_text("password")
+    (install_dir / "metadata.json").write_text('{"clusterName": "test-cl"}')
+    (install_dir / ".openshift_install.log").write_text('level=info msg="Waiting for the cluster"\n' * 200_000)
+    (install_dir / "terraform").mkdir()
+    for _idx in range(large_files_count):
+        (install_dir / "terraform" / f"terraform-{_idx}.tfstate").write_bytes(os.urandom(6 * 1024 * 1024))
+
+    return install_dir
+
+
+def _zip_entries(zip_data):
+    with zipfile.ZipFile(io.BytesIO(zip_data)) as zip_file:
+        return {_info.filename: zip_file.read(_info) for _info in zip_file.infolist()}
+
+
+def _make_archive_and_upload(client, install_dir, s3_bucket_name, s3_bucket_object_name):
+    # Previous implementation: zip file written next to the install dir, uploaded once compressed
+    zip_file = shutil.make_archive(
+        base_name=os.path.join(Path(install_dir).parent, Path(s3_bucket_object_name).stem),
+        format="zip",
+        root_dir=install_dir,
+    )
+    client.upload_file(Filename=zip_file, Bucket=s3_bucket_name, Key=s3_bucket_object_name)
+    return os.path.getsize(zip_file)
+
+
+def _stream_zip_to_s3(client, install_dir, s3_bucket_name, s3_bucket_object_name):
+    stream_zip_to_s3(
+        client=client,
+        install_dir=install_dir,
+        s3_bucket_name=s3_bucket_name,
+        s3_bucket_object_name=s3_bucket_object_name,
+        part_size=PART_SIZE,
+    )
+    return 0
+
+
+def test_stream_zip_to_s3(tmp_path):
+    install_dir = _create_install_dir(install_dir=tmp_path / "test-cl")
+    client = FakeS3Client()
+
+    stream_zip_to_s3(
+        client=client,
+        install_dir=str(install_dir),
+        s3_bucket_name="bucket",
+        s3_bucket_object_name="test-cl.zip",
+        part_size=PART_SIZE,
+        max_concurrency=2,
+    )
+
+    # Same archive entries as `shutil.make_archive`
+    _make_archive_and_upload(
+        client=client, install_dir=str(install_dir), s3_bucket_name="bucket", s3_bucket_object_name="expected.zip"
+    )
+    assert _zip_entries(zip_data=client.objects[("bucket", "test-cl.zip")]) == _zip_entries(
+        zip_data=client.objects[("bucket", "expected.zip")]
+    )
+    assert client.max_in_flight_parts <= 2
+    assert not client.uploads
+
+
+def test_stream_zip_to_s3_empty_dir(tmp_path):
+    client = FakeS3Client()
+    (tmp_path / "test-cl").mkdir()
+
+    stream_zip_to_s3(
+        client=client, install_dir=str(tmp_path / "test-cl"), s3_bucket_name="bucket", s3_bucket_object_name="cl.zip"
+    )
+
+    assert _zip_entries(zip_data=client.objects[("bucket", "cl.zip")]) == {}
+
+
+def test_stream_zip_to_s3_part_failure_aborts_upload(tmp_path):
+    install_dir = _create_install_dir(install_dir=tmp_path / "test-cl", large_files_count=3)
+    client = FakeS3Client(fail_part_number=2)
+
+    with pytest.raises(ConnectionError):
+        stream_zip_to_s3(
+            client=client,
+            install_dir=str(install_dir),
+            s3_bucket_name="bucket",
+            s3_bucket_object_name="test-cl.zip",
+            part_size=PART_SIZE,
+        )
+
+    assert len(client.aborted) == 1
+    assert not client.uploads
+    assert not client.objects
+
+
+@pytest.mark.parametrize(
+    "backup_func",
+    [
+        pytest.param(_make_archive_and_upload, id="make-archive-and-upload"),
+        pytest.param(_stream_zip_to_s3, id="stream-zip-to-s3"),
+    ],
+)
+def test_install_dir_backup_benchmark(benchmark, tmp_path, backup_func):
+    install_dir = _create_install_dir(install_dir=tmp_path / "test-cl", large_files_count=4)
+    client = FakeS3Client()
+
+    archive_disk_bytes = benchmark.pedantic(
+        backup_func,
+        kwargs={
+            "client": client,
+            "install_dir": str(install_dir),
+            "s3_bucket_name": "bucket",
+            "s3_bucket_object_name": "test-cl.zip",
+        },
+        rounds=3,
+    )
+    benchmark.extra_info["archive_disk_bytes"] = archive_disk_bytes
+
+    assert "auth/kubeconfig" in _zip_entries(zip_data=client.objects[("bucket", "test-cl.zip")])
+    if backup_func is _stream_zip_to_s3:
+        # Nothing written next to the install dir
+        assert archive_disk_bytes == 0
+        assert sorted(os.listdir(tmp_path)) == ["test-cl"]
@@ -0,0 +1,151 @@
+import datetime
+import hashlib
+import io
+import os
+import time
+import zipfile
+
+import botocore.exceptions
+import pytest
+
+from openshift_cli_installer.utils import clusters as clusters_utils
+from openshift_cli_installer.utils.clusters import get_all_zip_files_from_s3_bucket
+from openshift_cli_installer.utils.const import S3_RANGED_GET_BLOCK_SIZE_BYTES
+from openshift_cli_installer.utils.s3_backup import extract_destroy_files_from_s3_zip
+
+DOWNLOAD_SECONDS = 0.2
+LIST_OBJECTS_V2_PAGE_SIZE = 1000
+LAST_MODIFIED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class FakePaginator:
+    def __init__(self, client):
+        self.client = client
+
+    def paginate(self, Bucket, Prefix):
+        keys = sorted(_key for _bucket, _key in self.client.objects if _bucket == Bucket and _key.startswith(Prefix))
+        for _idx in range(0, len(keys), LIST_OBJECTS_V2_PAGE_SIZE):
+            self.client.listed_pages += 1
+            yield {
+                "Contents": [
+                    {"Key": _key, "LastModified": LAST_MODIFIED}
+                    for _key in keys[_idx : _idx + LIST_OBJECTS_V2_PAGE_SIZE]
+                ]
+            }
+
+
+class FakeS3Client:
+    """
+    In-memory S3 stand-in, `list_objects_v2` pages are limited to 1000 keys like S3, `get_object` supports ranges and
+    `put_object` conditional writes.
+    """
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.listed_pages = 0
+        self.ranges = []
+
+    def get_paginator(self, operation_name):
+        assert operation_name == "list_objects_v2"
+        return FakePaginator(client=self)
+
+    def head_object(self, Bucket, Key):
+        # Latency of the first request of each zip file
+        time.sleep(DOWNLOAD_SECONDS)
+        return {"ContentLength": len(self.objects[(Bucket, Key)])}
+
+    def get_object(self, Bucket, Key, Range=None):
+        if (Bucket, Key) not in self.objects:
+            raise botocore.exceptions.ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+
+        body = self.objects[(Bucket, Key)]
+        if Range:
+            start, end = (int(_byte) for _byte in Range.removeprefix("bytes=").split("-"))
+            self.ranges.append((Key, start, end))
+            body = body[start : end + 1]
+
+        return {"Body": io.BytesIO(body), "ETag": self._etag(key=(Bucket, Key))}
+
+    def put_object(self, Bucket, Key, Body, ContentType, IfMatch=None, IfNoneMatch=None):
+        current_etag = self._etag(key=(Bucket, Key))
+        if (IfNoneMatch == "*" and current_etag) or (IfMatch and IfMatch != current_etag):
+            raise botocore.exceptions.ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+
+        self.objects[(Bucket, Key)] = Body.encode()
+
+    def _etag(self, key):
+        return hashlib.md5(self.objects[key]).hexdigest() if key in self.objects else None
+
+
+def _cluster_zip(cluster_name, install_log_size=0):
+    zip_data = io.BytesIO()
+    with zipfile.ZipFile(zip_data, mode="w") as zip_file:
+        zip_file.writestr(".openshift_install.log", os.urandom(install_log_size))
+        zip_file.writestr("auth/", "")
+        zip_file.writestr("auth/kubeconfig", "apiVersion: v1")
+        zip_file.writestr("cluster_data.yaml", f"cluster:\n  name: {cluster_name}\n")
+        zip_file.writestr("metadata.json", '{"clusterName": "test-cl"}')
+        zip_file.writestr(".openshift_install_state.json", os.urandom(install_log_size))
+        zip_file.writestr("terraform/terraform.tfstate", "{}")
+    return zip_data.getvalue()
+
+
+@pytest.fixture
+def destroy_data_directory(tmp_path, mocker):
+    mocker.patch.object(clusters_utils, "DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY", str(tmp_path))
+    return tmp_path
+
+
+def test_get_all_zip_files_from_s3_bucket_pagination():
+    objects = {("bucket", f"ci/cl-{_idx:04}.zip"): b"" for _idx in range(2500)}
+    objects["bucket", "ci/cl-0001.log"] = b""
+    client = FakeS3Client(objects=objects)
+
+    zip_files = list(get_all_zip_files_from_s3_bucket(client=client, s3_bucket_name="bucket", s3_bucket_path="ci"))
+
+    assert client.listed_pages == 3
+    assert len(zip_files) == 2500
+    assert zip_files[0] == "cl-0000.zip"
+
+
+def test_prepare_clusters_directory_from_s3_bucket(destroy_data_directory, mocker):
+    clusters_count = 300
+    objects = {
+        ("bucket", f"ci/cl-{_idx}.zip"): _cluster_zip(cluster_name=f"cl-{_idx}") for _idx in range(clusters_count)
+    }
+    objects["bucket", "ci/broken.zip"] = b"not a zip"
+    mocker.patch.object(clusters_utils, "get_s3_download_client", return_value=FakeS3Client(objects=objects))
+
+    start_time = time.monotonic()
+    clusters_utils.prepare_clusters_directory_from_s3_bucket(s3_bucket_name="bucket", s3_bucket_path="ci")
+    elapsed_time = time.monotonic() - start_time
+
+    # Downloads run concurrently (serial downloads take clusters_count * DOWNLOAD_SECONDS)
+    waves = -(-(clusters_count + 1) // clusters_utils.S3_DOWNLOAD_MAX_WORKERS)
+    assert elapsed_time < waves * DOWNLOAD_SECONDS * 3
+    for _idx in range(clusters_count):
+        assert (destroy_data_directory / f"cl-{_idx}" / "cluster_data.yaml").read_text() == (
+            f"cluster:\n  name: cl-{_idx}\n"
+        )
+
+    # No zip file written to disk, a broken zip file does not fail the other clusters
+    assert not list(destroy_data_directory.glob("**/*.zip"))
+    assert not (destroy_data_directory / "broken" / "cluster_data.yaml").exists()
+
+
+def test_extract_destroy_files_from_s3_zip(tmp_path):
+    install_log_size = 20 * 1024 * 1024
+    zip_data = _cluster_zip(cluster_name="test-cl", install_log_size=install_log_size)
+    client = FakeS3Client(objects={("bucket", "ci/test-cl.zip"): zip_data})
+
+    extract_destroy_files_from_s3_zip(
+        client=client, s3_bucket_name="bucket", s3_bucket_object_name="ci/test-cl.zip", extract_dir=str(tmp_path)
+    )
+
+    assert sorted(
+        os.path.relpath(os.path.join(_root, _file), tmp_path)
+        for _root, _, _files in os.walk(tmp_path)
+        for _file in _files
+    ) == ["auth/kubeconfig", "cluster_data.yaml", "metadata.json", "terraform/terraform.tfstate"]
+    # Installer logs and state (2 * 20 MiB) are not downloaded, at most one block of read-ahead per read
+    assert sum(_end - _start + 1 for _, _start, _end in client.ranges) <= 2 * S3_RANGED_GET_BLOCK_SIZE_BYTES
@@ -0,0 +1,152 @@
+import json
+
+from openshift_cli_installer.tests.test_s3_destroy_download import LAST_MODIFIED, FakeS3Client
+from openshift_cli_installer.utils.clusters import get_zip_files_to_download
+from openshift_cli_installer.utils.s3_index import (
+    get_s3_backup_index_entry,
+    get_s3_backup_index_zip_files,
+    read_s3_backup_index,
+    update_s3_backup_index,
+)
+
+
+def _index_entry(name):
+    return get_s3_backup_index_entry(
+        cluster_info={
+            "name": name,
+            "platform": "rosa",
+            "region": "us-east-2",
+            "ocm-env": "stage",
+            "s3-object-name": f"ci/{name}-abc.zip",
+        }
+    )
+
+
+def test_update_s3_backup_index():
+    client = FakeS3Client(objects={})
+
+    assert get_s3_backup_index_zip_files(client=client, s3_bucket_name="bucket", s3_bucket_path="ci") is None
+
+    for _name in ("cl-1", "cl-2", "other-cl"):
+        update_s3_backup_index(
+            client=client, s3_bucket_name="bucket", s3_bucket_path="ci", entry=_index_entry(name=_name)
+        )
+    update_s3_backup_index(
+        client=client, s3_bucket_name="bucket", s3_bucket_path="ci", remove_object_key="ci/cl-2-abc.zip"
+    )
+
+    entries = read_s3_backup_index(client=client, s3_bucket_name="bucket", s3_bucket_path="ci").entries
+    assert entries["ci/cl-1-abc.zip"]["ocm-env"] == "stage"
+    # Not used before it is reconciled with a bucket listing
+    assert get_s3_backup_index_zip_files(client=client, s3_bucket_name="bucket", s3_bucket_path="ci") is None
+
+    update_s3_backup_index(client=client, s3_bucket_name="bucket", s3_bucket_path="ci", listed_objects=[])
+    assert get_s3_backup_index_zip_files(client=client, s3_bucket_name="bucket", s3_bucket_path="ci", query="cl-") == [
+        "ci/cl-1-abc.zip",
+        "ci/other-cl-abc.zip",
+    ]
+
+
+def test_update_s3_backup_index_concurrent_update(mocker):
+    client = FakeS3Client(objects={})
+    update_s3_backup_index(client=client, s3_bucket_name="bucket", s3_bucket_path="ci", entry=_index_entry(name="cl-1"))
+    put_object = client.put_object
+
+    def _put_object_after_other_run(**kwargs):
+        # Another process updates the index between our read and write
+        index = json.loads(client.objects["bucket", "ci/openshift-cli-installer-index.json"])
+        index["clusters"]["ci/cl-2-abc.zip"] = _index_entry(name="cl-2")
+        client.objects["bucket", "ci/openshift-cli-installer-index.json"] = json.dumps(index).encode()
+        client.put_object = put_object
+        return put_object(**kwargs)
+
+    client.put_object = mocker.MagicMock(side_effect=_put_object_after_other_run)
+    update_s3_backup_index(client=client, s3_bucket_name="bucket", s3_bucket_path="ci", entry=_index_entry(name="cl-3"))
+
+    index = json.loads(client.objects["bucket", "ci/openshift-cli-installer-index.json"])
+    assert sorted(index["clusters"]) == ["ci/cl-1-abc.zip", "ci/cl-2-abc.zip", "ci/cl-3-abc.zip"]
+
+
+def test_get_zip_files_to_download_from_index():
+    objects = {("bucket", f"ci/cl-{_idx}-abc.zip"): b"" for _idx in range(3000)}
+    client = FakeS3Client(objects=objects)
+    update_s3_backup_index(
+        client=client, s3_bucket_name="bucket", s3_bucket_path="ci", entry=_index_entry(name="cl-2999")
+    )
+
+    # Backups uploaded before the index existed are not indexed, the bucket is listed once
+    assert list(
+        get_zip_files_to_download(client=client, s3_bucket_name="bucket", s3_bucket_path="ci", query="cl-17-")
+    ) == [("bucket", "ci/cl-17-abc.zip")]
+    # 3000 zip files and the index
+    assert client.listed_pages == 4
+
+    # The listing completed the index
+    assert list(
+        get_zip_files_to_download(client=client, s3_bucket_name="bucket", s3_bucket_path="ci", query="cl-2999")
+    ) == [("bucket", "ci/cl-2999-abc.zip")]
+    assert list(
+        get_zip_files_to_download(client=client, s3_bucket_name="bucket", s3_bucket_path="ci", query="cl-18-")
+    ) == [("bucket", "ci/cl-18-abc.zip")]
+    assert client.listed_pages == 4
+
+
+def test_get_zip_files_to_download_indexed_and_not_indexed_backups():
+    client = FakeS3Client(objects={("bucket", "ci/cl-old-abc.zip"): b"", ("bucket", "ci/cl-new-abc.zip"): b""})
+    update_s3_backup_index(
+        client=client, s3_bucket_name="bucket", s3_bucket_path="ci", entry=_index_entry(name="cl-new")
+    )
+
+    assert sorted(
+        get_zip_files_to_download(client=client, s3_bucket_name="bucket", s3_bucket_path="ci", query="cl-")
+    ) == [("bucket", "ci/cl-new-abc.zip"), ("bucket", "ci/cl-old-abc.zip")]
+
+    index = read_s3_backup_index(client=client, s3_bucket_name="bucket", s3_bucket_path="ci")
+    assert index.complete
+    # Indexed entries are kept as is
+    assert index.entries["ci/cl-new-abc.zip"]["ocm-env"] == "stage"
+    assert "partial" not in index.entries["ci/cl-new-abc.zip"]
+    assert index.entries["ci/cl-old-abc.zip"]["partial"]
+
+
+def test_update_s3_backup_index_listed_objects():
+    client = FakeS3Client(objects={})
+    update_s3_backup_index(
+        client=client,
+        s3_bucket_name="bucket",
+        s3_bucket_path="ci",
+        listed_objects=[
+            {"Key": "ci/my-cluster-4jvb2vbssqzcb3bxmhfrd8.zip", "LastModified": LAST_MODIFIED},
+            {"Key": "ci/custom-object-name.zip", "LastModified": LAST_MODIFIED},
+        ],
+    )
+
+    entries = read_s3_backup_index(client=client, s3_bucket_name="bucket", s3_bucket_path="ci").entries
+    assert entries["ci/my-cluster-4jvb2vbssqzcb3bxmhfrd8.zip"] == {
+        "name": "my-cluster",
+        "platform": None,
+        "region": None,
+        "ocm-env": None,
+        "creation-time": "2024-01-01T00:00:00+00:00",
+        "expiration-time": None,
+        "object-key": "ci/my-cluster-4jvb2vbssqzcb3bxmhfrd8.zip",
+        "partial": True,
+    }
+    assert entries["ci/custom-object-name.zip"]["name"] == "custom-object-name"
+
+    # A backup uploaded by a later run replaces the partial entry
+    update_s3_backup_index(
+        client=client,
+        s3_bucket_name="bucket",
+        s3_bucket_path="ci",
+        entry=get_s3_backup_index_entry(
+            cluster_info={
+                "name": "custom-object-name",
+                "platform": "aws",
+                "s3-object-name": "ci/custom-object-name.zip",
+            }
+        ),
+    )
+    entries = read_s3_backup_index(client=client, s3_bucket_name="bucket", s3_bucket_path="ci").entries
+    assert entries["ci/custom-object-name.zip"]["platform"] == "aws"
+    assert "partial" not in entries["ci/custom-object-name.zip"]
@@ -0,0 +1,114 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+import pytest
+
+from openshift_cli_installer.utils.terraform_cache import get_terraform_template_dir, prepare_terraform_working_dir
+
+TERRAFORM_FILE_NAME = "setup-vpc.tf"
+
+
+@pytest.fixture()
+def terraform_file(tmp_path):
+    _terraform_file = tmp_path / TERRAFORM_FILE_NAME
+    _terraform_file.write_text('provider "aws" {}\n')
+    return str(_terraform_file)
+
+
+@pytest.fixture()
+def terraform_init(mocker):
+    def _init(command, cwd, **kwargs):
+        # What `terraform init` creates in the working directory
+        for _dir in ("modules/vpc", "providers/registry.terraform.io/hashicorp/aws/5.0.0/linux_amd64"):
+            os.makedirs(os.path.join(cwd, ".terraform", _dir))
+        with open(os.path.join(cwd, ".terraform.lock.hcl"), "w") as fd:
+            fd.write('provider "registry.terraform.io/hashicorp/aws" {}\n')
+
+        return True, "", ""
+
+    mocker.patch.dict(os.environ)
+    os.environ.pop("TF_PLUGIN_CACHE_DIR", None)
+    return mocker.patch("pyhelper_utils.shell.run_command", side_effect=_init)
+
+
+def test_get_terraform_template_dir_parallel_clusters(tmp_path, terraform_file, terraform_init):
+    terraform_cache_dir = str(tmp_path / "terraform")
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        template_dirs = set(
+            executor.map(
+                lambda _: get_terraform_template_dir(
+                    terraform_cache_dir=terraform_cache_dir, terraform_file=terraform_file
+                ),
+                range(10),
+            )
+        )
+
+    assert terraform_init.call_count == 1
+    assert terraform_init.call_args.kwargs["command"] == ["terraform", "init", "-input=false"]
+    assert terraform_init.call_args.kwargs["env"]["TF_PLUGIN_CACHE_DIR"] == os.path.join(terraform_cache_dir, "plugins")
+    assert "TF_PLUGIN_CACHE_DIR" not in os.environ
+
+    template_dir = template_dirs.pop()
+    assert not template_dirs
+    assert os.path.isfile(os.path.join(template_dir, TERRAFORM_FILE_NAME))
+
+    # Terraform file changed, new template
+    with open(terraform_file, "a") as fd:
+        fd.write('provider "random" {}\n')
+
+    assert get_terraform_template_dir(terraform_cache_dir=terraform_cache_dir, terraform_file=terraform_file) != (
+        template_dir
+    )
+    assert terraform_init.call_count == 2
+
+
+def test_get_terraform_template_dir_provider_mirror(tmp_path, terraform_file, terraform_init):
+    get_terraform_template_dir(
+        terraform_cache_dir=str(tmp_path / "terraform"), terraform_file=terraform_file, provider_mirror_dir="/mirror"
+    )
+
+    assert terraform_init.call_args.kwargs["command"] == ["terraform", "init", "-input=false", "-plugin-dir=/mirror"]
+    assert "TF_PLUGIN_CACHE_DIR" not in terraform_init.call_args.kwargs["env"]
+
+
+def test_get_terraform_template_dir_init_failure(tmp_path, terraform_file, terraform_init):
+    terraform_cache_dir = str(tmp_path / "terraform")
+    init = terraform_init.side_effect
+
+    def _init_fail_first(command, cwd, **kwargs):
+        if terraform_init.call_count == 1:
+            os.makedirs(os.path.join(cwd, ".terraform", "modules"))
+            return False, "", "network is unreachable"
+
+        return init(command=command, cwd=cwd, **kwargs)
+
+    terraform_init.side_effect = _init_fail_first
+
+    with pytest.raises(click.Abort):
+        get_terraform_template_dir(terraform_cache_dir=terraform_cache_dir, terraform_file=terraform_file)
+
+    # The partially initialized template is not used
+    template_dir = get_terraform_template_dir(terraform_cache_dir=terraform_cache_dir, terraform_file=terraform_file)
+    assert terraform_init.call_count == 2
+    assert os.path.isdir(os.path.join(template_dir, ".terraform", "modules"))
+
+
+def test_prepare_terraform_working_dir(tmp_path, terraform_file, terraform_init):
+    template_dir = get_terraform_template_dir(
+        terraform_cache_dir=str(tmp_path / "terraform"), terraform_file=terraform_file
+    )
+    cluster_dir = tmp_path / "cluster"
+    # Left from a previous init
+    os.makedirs(cluster_dir / ".terraform" / "providers")
+
+    providers_dir = prepare_terraform_working_dir(
+        template_dir=template_dir, working_dir=str(cluster_dir), terraform_file_name=TERRAFORM_FILE_NAME
+    )
+
+    assert providers_dir == os.path.join(template_dir, ".terraform", "providers")
+    assert sorted(os.listdir(cluster_dir)) == [".terraform", ".terraform.lock.hcl", TERRAFORM_FILE_NAME]
+    assert os.listdir(cluster_dir / ".terraform") == ["modules"]
+    assert os.path.realpath(cluster_dir / ".terraform" / "modules") == os.path.join(
+        template_dir, ".terraform", "modules"
+    )
@@ -1,9 +1,10 @@
 import re
 
 import pytest
+import yaml
 
 from openshift_cli_installer.libs.user_input import UserInput, UserInputError
-from openshift_cli_installer.utils.const import AWS_OSD_STR, AWS_STR, GCP_STR, HYPERSHIFT_STR, S3_STR
+from openshift_cli_installer.utils.const import AWS_OSD_STR, AWS_STR, GCP_STR, HYPERSHIFT_STR, ROSA_STR, S3_STR
 
 TEST_CL = {"name": "test-cl", "platform": AWS_STR}
 CLUSTER_DATA_DIR = "/tmp/cinstall"
@@ -296,6 +297,67 @@ CLUSTER_DATA_DIR = "/tmp/cinstall"
             },
             "rosa platform does not support channel-group bad-stream, supported channels are ('stable', 'candidate', 'nightly')",
         ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "registry_config_file": "reg.json",
+                "docker_config_file": "dok.json",
+                "ssh_key_file": "ssh.key",
+                "offline_catalog": True,
+                "cache_dir": "",
+                "clusters": [{"name": "test-cl", "platform": "aws", "stream": "stable", "region": "reg1"}],
+            },
+            "`--offline-catalog` requires `--cache-dir` with a cached release catalog",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "registry_config_file": "reg.json",
+                "docker_config_file": "dok.json",
+                "ssh_key_file": "ssh.key",
+                "concurrency_limits": {"hypershift-per-region": {"hypershift": 3}},
+                "clusters": [{"name": "test-cl", "platform": "aws", "stream": "stable", "region": "reg1"}],
+            },
+            "Concurrency limit 'hypershift-per-region' is not supported",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "registry_config_file": "reg.json",
+                "docker_config_file": "dok.json",
+                "ssh_key_file": "ssh.key",
+                "concurrency_limits": {"platform": {"aws": True}},
+                "clusters": [{"name": "test-cl", "platform": "aws", "stream": "stable", "region": "reg1"}],
+            },
+            "Concurrency limit 'platform' must map names to positive integers, got {'aws': True}",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "registry_config_file": "reg.json",
+                "docker_config_file": "dok.json",
+                "ssh_key_file": "ssh.key",
+                "max_parallel": True,
+                "clusters": [{"name": "test-cl", "platform": "aws", "stream": "stable", "region": "reg1"}],
+            },
+            "`--max-parallel` must be a positive integer, got True",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "ocm_token": "123",
+                "retry_failed": "/tmp/cinstall-missing-run-result.json",
+            },
+            "Run result manifest /tmp/cinstall-missing-run-result.json not found",
+        ),
     ],
 )
 def test_user_input(command, expected):
@@ -303,3 +365,67 @@ def test_user_input(command, expected):
 
     with pytest.raises(UserInputError, match=re.escape(expected)):
         UserInput(**command)
+
+
+def test_user_input_reports_all_violations():
+    command = {
+        "clusters_install_data_directory": CLUSTER_DATA_DIR,
+        "action": "create",
+        "ocm_token": "123",
+        "registry_config_file": "reg.json",
+        "docker_config_file": "dok.json",
+        "ssh_key_file": "ssh.key",
+        "dry_run": True,
+        "clusters": [
+            {"name": "test-cl", "platform": AWS_STR, "region": "reg1", "acm-clusters": "missing-cl"},
+            {"name": "test-cl-2", "platform": "unsupported", "region": "reg1"},
+            {"name": "test-cl-3", "platform": AWS_STR},
+        ],
+    }
+
+    with pytest.raises(UserInputError) as exc_info:
+        UserInput(**command)
+
+    assert str(exc_info.value).splitlines() == [
+        "Cluster test-cl-2 platform 'unsupported' is not supported.",
+        "Managed ACM clusters: Cluster not found missing-cl",
+        "Cluster region must be provided for the following clusters: ['test-cl-3']",
+    ]
+
+
+def test_user_input_large_clusters_yaml_benchmark(benchmark, tmp_path):
+    clusters_yaml_config_file = tmp_path / "clusters.yaml"
+    clusters = []
+    for _idx in range(10_000):
+        _cluster = {"name": f"cl-{_idx}", "platform": AWS_STR if _idx % 2 else ROSA_STR, "region": "us-east-2"}
+        # Every 10th cluster is an ACM hub of the next 9 clusters
+        if _idx % 10 == 0:
+            _cluster.update({
+                "platform": AWS_STR,
+                "acm": True,
+                "acm-clusters": [f"cl-{_managed_idx}" for _managed_idx in range(_idx + 1, _idx + 10)],
+            })
+        clusters.append(_cluster)
+
+    clusters_yaml_config_file.write_text(
+        yaml.safe_dump({
+            "action": "create",
+            "ocm_token": "123",
+            "registry_config_file": "reg.json",
+            "docker_config_file": "dok.json",
+            "ssh_key_file": "ssh.key",
+            "clusters": clusters,
+        })
+    )
+
+    user_input = benchmark.pedantic(
+        UserInput,
+        kwargs={
+            "clusters_yaml_config_file": str(clusters_yaml_config_file),
+            "clusters_install_data_directory": CLUSTER_DATA_DIR,
+            "dry_run": True,
+        },
+        rounds=3,
+    )
+
+    assert len(user_input.clusters) == 10_000
@@ -18,14 +18,6 @@ def get_managed_acm_clusters_from_user_input(
     return [_cluster for _cluster in managed_acm_clusters if _cluster]
 
 
-def get_cluster_data_by_name_from_clusters(name: str, clusters: list[dict[str, Any]]) -> dict[str, Any]:
-    for cluster in clusters:
-        if cluster["name"] == name:
-            return cluster
-
-    return {}
-
-
 def get_aws_credentials_for_acm_observability(
     cluster: dict[str, Any], aws_access_key_id: str, aws_secret_access_key: str
 ) -> tuple[str, str]:
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Any
+
+import yaml
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.general import write_file_atomically
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+
+LOGGER = get_logger(name=__name__)
+
+
+class _ClusterStateDumper(YamlDumper):
+    """
+    Dump tuples as lists and values which are not plain YAML types as strings.
+    """
+
+
+_ClusterStateDumper.add_representer(tuple, _ClusterStateDumper.represent_list)
+_ClusterStateDumper.add_multi_representer(dict, _ClusterStateDumper.represent_dict)
+_ClusterStateDumper.add_multi_representer(object, lambda dumper, data: dumper.represent_str(str(data)))
+
+
+class ClusterStateStore:
+    """
+    Persisted cluster state (`cluster_data.yaml`), used to destroy the cluster later.
+
+    The state file is rewritten atomically (temporary file and rename) and only when the state changed since the
+    last write, readers (including concurrent runs) never see a partially written file.
+    """
+
+    def __init__(self, state_file: str) -> None:
+        self.state_file = state_file
+        self.lock = threading.Lock()
+        self._last_fingerprint = ""
+
+    def save(self, state: dict[str, Any]) -> bool:
+        """
+        Save the cluster state.
+
+        Args:
+            state (dict): Cluster state, values which are not plain YAML types are saved as strings.
+
+        Returns:
+            bool: True if the state file was written, False if the state did not change.
+        """
+        content = yaml.dump(state, Dumper=_ClusterStateDumper)
+        # Fingerprint of the written content, the state file is rewritten only if it would change
+        fingerprint = hashlib.sha256(content.encode()).hexdigest()
+        with self.lock:
+            if fingerprint == self._last_fingerprint:
+                return False
+
+            write_file_atomically(file_path=self.state_file, content=content)
+            self._last_fingerprint = fingerprint
+
+        return True
@@ -1,19 +1,27 @@
+import hashlib
+import json
+import os
 import re
 import sys
-from typing import Any
+import time
+from collections.abc import Callable, Mapping
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 import click
 import requests
+import semver
 from bs4 import BeautifulSoup
 from simple_logger.logger import get_logger
 
 from openshift_cli_installer.utils.const import (
-    AWS_OSD_STR,
-    GCP_OSD_STR,
-    HYPERSHIFT_STR,
     IPI_BASED_PLATFORMS,
-    ROSA_STR,
+    OCM_VERSIONS_CACHE_TTL_SECONDS,
+    RELEASE_CATALOG_CACHE_TTL_SECONDS,
 )
+from openshift_cli_installer.utils.general import file_lock, run_single_flight, write_file_atomically
 
 version = sys.version_info
 if version[0] == 3 and version[1] < 9:
@@ -25,9 +33,83 @@ else:
 LOGGER = get_logger(name=__name__)
 
 
+class VersionIndex:
+    """
+    Versions catalog index, built once per catalog and queried per cluster.
+
+    Versions are bucketed by source, stream and minor (x.y) and sorted semver-aware (latest first).
+    IPI catalogs have a single source with all streams mixed, the stream is derived from the version pre-release
+    (`4.16.0-ec.5` -> `ec`, `4.16.0-0.nightly-...` -> `nightly`, `4.15.8` -> `stable`).
+    OCM catalogs (ROSA, Hypershift, OSD) are keyed by channel group, which is used as the stream.
+    """
+
+    __slots__ = ("_latest", "_versions", "_versions_by_source", "ipi")
+
+    def __init__(self, base_versions_dict: dict[str, dict[str, list[str]]], ipi: bool = False) -> None:
+        self.ipi = ipi
+        buckets: dict[tuple[str, str, str], list[str]] = {}
+        self._versions: set[str] = set()
+        self._versions_by_source: set[tuple[str, str]] = set()
+
+        for _source, versions in base_versions_dict.items():
+            for _minor, _versions in versions.items():
+                for _version in _versions:
+                    _version = _version.strip()
+                    self._versions.add(_version)
+                    self._versions_by_source.add((_source, _version))
+                    if ipi:
+                        buckets.setdefault(("", self.get_version_stream(version=_version), _minor), []).append(_version)
+                    else:
+                        buckets.setdefault((_source, "", _minor), []).append(_version)
+
+        self._latest: dict[tuple[str, str, str], str] = {
+            _key: max(_versions, key=self.get_version_sort_key) for _key, _versions in buckets.items()
+        }
+
+    @staticmethod
+    def get_version_stream(version: str) -> str:
+        try:
+            _prerelease = parse_version(version=version).prerelease
+        except ValueError:
+            return ""
+
+        if _prerelease:
+            if _stream := re.match(r"^(?:0\.)?([a-z]+)", _prerelease):
+                return _stream.group(1)
+
+            return _prerelease
+
+        return "stable"
+
+    @staticmethod
+    def get_version_sort_key(version: str) -> tuple[int, semver.Version]:
+        try:
+            return 1, parse_version(version=version)
+        except ValueError:
+            # Unparsable versions are never picked over valid ones
+            return 0, semver.Version(0)
+
+    def get_latest(self, minor: str, stream: str) -> str | None:
+        if self.ipi:
+            return self._latest.get(("", stream, minor))
+
+        return self._latest.get((stream, "", minor))
+
+    def exists(self, version: str, stream: str) -> bool:
+        if self.ipi:
+            return version in self._versions
+
+        return (stream, version) in self._versions_by_source
+
+
+@cache
+def parse_version(version: str) -> semver.Version:
+    return semver.Version.parse(version, optional_minor_and_patch=True)
+
+
 def get_cluster_version_to_install(
     wanted_version: str,
-    base_versions_dict: dict[str, dict[str, list[str]]],
+    base_versions_dict: dict[str, dict[str, list[str]]] | VersionIndex,
     platform: str,
     stream: str,
     log_prefix: str,
@@ -37,24 +119,17 @@ def get_cluster_version_to_install(
         LOGGER.error(f"{log_prefix}: Version must be at least x.y (4.3), got {wanted_version}")
         raise click.Abort()
 
-    match = None
-
-    for _source, versions in base_versions_dict.items():
-        if platform in (HYPERSHIFT_STR, ROSA_STR, AWS_OSD_STR, GCP_OSD_STR) and stream != _source:
-            continue
+    if isinstance(base_versions_dict, VersionIndex):
+        version_index = base_versions_dict
+    else:
+        version_index = VersionIndex(base_versions_dict=base_versions_dict, ipi=platform in IPI_BASED_PLATFORMS)
 
-        if wanted_version_len == 2:
-            if _match := versions.get(wanted_version):
-                if stream != "stable" and platform in IPI_BASED_PLATFORMS:
-                    _match = [_ver for _ver in _match if stream in _ver]
-                match = _match[0]
-                break
+    match = None
+    if wanted_version_len == 2:
+        match = version_index.get_latest(minor=wanted_version, stream=stream)
 
-        else:
-            _version_key = re.findall(r"^\d+.\d+", wanted_version)[0]
-            if _match := [_version for _version in versions.get(_version_key, []) if _version == wanted_version]:
-                match = _match[0]
-                break
+    elif version_index.exists(version=wanted_version, stream=stream):
+        match = wanted_version
 
     if not match:
         LOGGER.error(f"{log_prefix}: Cluster version {wanted_version} not found for stream {stream}")
@@ -69,13 +144,17 @@ def get_cluster_stream(cluster_data: dict[str, Any]) -> str:
     return cluster_data["stream"] if _platform in IPI_BASED_PLATFORMS else cluster_data["channel-group"]
 
 
+class ReleaseRow(NamedTuple):
+    status: str
+    href: str
+
+
 @cache
-def get_ipi_cluster_versions() -> dict[str, dict[str, list[str]]]:
+def get_ipi_cluster_versions(cache_dir: str = "", offline: bool = False) -> dict[str, dict[str, list[str]]]:
     _source = "openshift-release.apps.ci.l2s4.p1.openshiftapps.com"
     _accepted_version_dict: dict[str, dict[str, list[str]]] = {_source: {}}
-    for tr in parse_openshift_release_url():
-        _version, status = [_tr for _tr in tr.text.splitlines() if _tr][:2]
-        if status == "Accepted":
+    for _version, release_row in parse_openshift_release_url(cache_dir=cache_dir, offline=offline).items():
+        if release_row.status == "Accepted":
             _version_key = re.findall(r"^\d+.\d+", _version)[0]
             _accepted_version_dict[_source].setdefault(_version_key, []).append(_version)
 
@@ -83,9 +162,213 @@ def get_ipi_cluster_versions() -> dict[str, dict[str, list[str]]]:
 
 
 @cache
-def parse_openshift_release_url() -> list[BeautifulSoup]:
+def get_ipi_cluster_version_index(cache_dir: str = "", offline: bool = False) -> VersionIndex:
+    return VersionIndex(
+        base_versions_dict=get_ipi_cluster_versions(cache_dir=cache_dir, offline=offline),
+        ipi=True,
+    )
+
+
+@cache
+def parse_openshift_release_url(cache_dir: str = "", offline: bool = False) -> Mapping[str, ReleaseRow]:
     url = "https://openshift-release.apps.ci.l2s4.p1.openshiftapps.com"
     LOGGER.info(f"Parsing {url}")
-    req = requests.get(url)
-    soup = BeautifulSoup(req.text, "html.parser")
-    return soup.find_all("tr")
+    return get_openshift_release_index(page=get_openshift_release_page(url=url, cache_dir=cache_dir, offline=offline))
+
+
+def get_openshift_release_index(page: str) -> Mapping[str, ReleaseRow]:
+    """
+    Parse the release controller page into an immutable version index.
+
+    Only plain strings are kept, the parsed DOM is released once the index is built.
+
+    Args:
+        page (str): Release controller page HTML.
+
+    Returns:
+        Mapping: version to ReleaseRow (status, release details href), in page order.
+    """
+    release_index: dict[str, ReleaseRow] = {}
+    for tr in BeautifulSoup(page, "html.parser").find_all("tr"):
+        _tr_lines = [_tr for _tr in tr.text.splitlines() if _tr]
+        if len(_tr_lines) < 2 or not re.match(r"^\d+\.\d+", _tr_lines[0]):
+            continue
+
+        _version, status = _tr_lines[:2]
+        href_tag = tr.find(name="a", attrs={"class": "text-success"})
+        release_index[str(_version)] = ReleaseRow(status=str(status), href=str(href_tag["href"]) if href_tag else "")
+
+    return MappingProxyType(release_index)
+
+
+def get_openshift_release_page(url: str, cache_dir: str = "", offline: bool = False) -> str:
+    """
+    Get the release controller page, using an on-disk cache when `cache_dir` is set.
+
+    A cached page younger than RELEASE_CATALOG_CACHE_TTL_SECONDS is used as is, an older one is revalidated
+    with a conditional GET (ETag / Last-Modified). If the release controller is not reachable, a stale cached
+    page is used.
+
+    Args:
+        url (str): Release controller URL.
+        cache_dir (str): Catalog cache directory, no cache is used if empty.
+        offline (bool): Only use the cached page, never call the release controller.
+
+    Returns:
+        str: Release controller page HTML.
+    """
+    if not cache_dir:
+        if offline:
+            LOGGER.error("Offline release catalog requires a cache directory")
+            raise click.Abort()
+
+        return requests.get(url).text
+
+    page_file = os.path.join(cache_dir, "release-page.html")
+    metadata_file = os.path.join(cache_dir, "release-page.json")
+
+    with file_lock(lock_file_path=os.path.join(cache_dir, "release-page.lock")):
+        metadata: dict[str, Any] = {}
+        if os.path.isfile(page_file) and os.path.isfile(metadata_file):
+            with open(metadata_file) as fd:
+                metadata = json.load(fd)
+
+        if offline:
+            if not metadata:
+                LOGGER.error(f"Offline release catalog requested but no cached catalog found in {cache_dir}")
+                raise click.Abort()
+
+            LOGGER.info(f"Using offline release catalog from {page_file}")
+            return Path(page_file).read_text()
+
+        if metadata and time.time() - metadata["fetched-at"] < RELEASE_CATALOG_CACHE_TTL_SECONDS:
+            LOGGER.info(f"Using cached release catalog from {page_file}")
+            return Path(page_file).read_text()
+
+        headers = {}
+        if etag := metadata.get("etag"):
+            headers["If-None-Match"] = etag
+
+        if last_modified := metadata.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = requests.get(url, headers=headers, timeout=60)
+            response.raise_for_status()
+
+        except requests.RequestException as ex:
+            if not metadata:
+                raise
+
+            LOGGER.warning(f"Failed to get {url}, using stale cached release catalog. error: {ex}")
+            return Path(page_file).read_text()
+
+        if response.status_code == 304:
+            LOGGER.info(f"Release catalog not modified, using cached {page_file}")
+            page = Path(page_file).read_text()
+
+        else:
+            page = response.text
+            write_file_atomically(file_path=page_file, content=page)
+
+        metadata = {
+            "etag": response.headers.get("ETag", metadata.get("etag")),
+            "last-modified": response.headers.get("Last-Modified", metadata.get("last-modified")),
+            "fetched-at": time.time(),
+        }
+        write_file_atomically(file_path=metadata_file, content=json.dumps(metadata))
+
+        return page
+
+
+def get_ocm_versions(
+    fetch_func: Callable[[], dict[str, dict[str, list[str]]]],
+    ocm_env: str,
+    channel_group: str,
+    region: str = "",
+    hosted_cp: bool = False,
+    cache_dir: str = "",
+) -> dict[str, dict[str, list[str]]]:
+    """
+    Get OCM (ROSA, Hypershift, OSD) versions catalog, shared by all clusters in the run.
+
+    The catalog is fetched once per (ocm-env, region, channel-group, hosted-cp), concurrent callers wait for
+    the first fetch. When `cache_dir` is set, the catalog is persisted and reused across runs for
+    OCM_VERSIONS_CACHE_TTL_SECONDS.
+
+    Args:
+        fetch_func (Callable): Fetch the versions catalog from OCM.
+        ocm_env (str): OCM environment.
+        channel_group (str): Versions channel group.
+        region (str): Cluster region, for region scoped catalogs (ROSA).
+        hosted_cp (bool): Hosted control plane (Hypershift) catalog.
+        cache_dir (str): Versions cache directory, the catalog is not persisted if empty.
+
+    Returns:
+        dict: channel to minor (x.y) to versions.
+    """
+    catalog_key = f"ocm-versions|{ocm_env}|{region}|{channel_group}|{hosted_cp}"
+    return run_single_flight(
+        key=catalog_key,
+        func=partial(_get_ocm_versions, catalog_key=catalog_key, fetch_func=fetch_func, cache_dir=cache_dir),
+    )
+
+
+def get_ocm_version_index(
+    fetch_func: Callable[[], dict[str, dict[str, list[str]]]],
+    ocm_env: str,
+    channel_group: str,
+    region: str = "",
+    hosted_cp: bool = False,
+    cache_dir: str = "",
+) -> VersionIndex:
+    """
+    Get the index of an OCM versions catalog (see `get_ocm_versions`), built once per catalog in the run.
+
+    Returns:
+        VersionIndex: OCM versions catalog index.
+    """
+    return run_single_flight(
+        key=f"ocm-version-index|{ocm_env}|{region}|{channel_group}|{hosted_cp}",
+        func=lambda: VersionIndex(
+            base_versions_dict=get_ocm_versions(
+                fetch_func=fetch_func,
+                ocm_env=ocm_env,
+                channel_group=channel_group,
+                region=region,
+                hosted_cp=hosted_cp,
+                cache_dir=cache_dir,
+            )
+        ),
+    )
+
+
+def _get_ocm_versions(
+    catalog_key: str,
+    fetch_func: Callable[[], dict[str, dict[str, list[str]]]],
+    cache_dir: str,
+) -> dict[str, dict[str, list[str]]]:
+    if not cache_dir:
+        return fetch_func()
+
+    catalog_file = os.path.join(cache_dir, f"{hashlib.sha256(catalog_key.encode()).hexdigest()}.json")
+    with file_lock(lock_file_path=f"{catalog_file}.lock"):
+        if os.path.isfile(catalog_file):
+            try:
+                with open(catalog_file) as fd:
+                    catalog = json.load(fd)
+
+                if time.time() - catalog["fetched-at"] < OCM_VERSIONS_CACHE_TTL_SECONDS:
+                    LOGGER.info(f"Using cached OCM versions from {catalog_file}")
+                    return catalog["versions"]
+
+            except (OSError, ValueError, KeyError) as ex:
+                LOGGER.warning(f"Ignoring invalid OCM versions cache {catalog_file}. error: {ex}")
+
+        versions = fetch_func()
+        write_file_atomically(
+            file_path=catalog_file,
+            content=json.dumps({"key": catalog_key, "fetched-at": time.time(), "versions": versions}),
+        )
+
+    return versions
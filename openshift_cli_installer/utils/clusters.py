@@ -1,55 +1,216 @@
 from __future__ import annotations
 
 import os
-import shutil
-from collections.abc import Generator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import botocore
 import click
 import yaml
-from clouds.aws.session_clients import s3_client
-from ocm_python_client.api.default_api import DefaultApi
-from ocm_python_wrapper.ocm_client import OCMPythonClient
+from pyhelper_utils.general import tts
 from simple_logger.logger import get_logger
 
 from openshift_cli_installer.libs.user_input import UserInput
+from openshift_cli_installer.utils.clusters_inventory import ClustersInventory
 from openshift_cli_installer.utils.const import (
     CLUSTER_DATA_YAML_FILENAME,
+    CLUSTERS_SCAN_SKIPPED_DIRECTORIES,
     DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY,
     DESTROY_STR,
+    OCM_CLUSTERS_SEARCH_MAX_NAMES,
+    OCM_CLUSTERS_SEARCH_PAGE_SIZE,
+    PREPARE_CLUSTERS_MAX_WORKERS,
+    S3_DOWNLOAD_MAX_WORKERS,
+    SUPPORTED_LIST_CLUSTERS_FILTERS,
 )
+from openshift_cli_installer.utils.general import run_single_flight
+
+# OCM and AWS SDKs are imported on use, `--list-clusters` does not load them
+if TYPE_CHECKING:
+    import botocore.client
+    from ocm_python_client.api.default_api import DefaultApi
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
 
 LOGGER = get_logger(name=__name__)
 
 
 def get_ocm_client(ocm_token: str, ocm_env: str) -> DefaultApi:
-    return OCMPythonClient(
-        token=ocm_token,
-        endpoint="https://sso.redhat.com/auth/realms/redhat-external/protocol/openid-connect/token",
-        api_host=ocm_env,
-        discard_unknown_keys=True,
-    ).client
+    from openshift_cli_installer.utils.ocm_client_pool import get_pooled_ocm_client
+
+    return get_pooled_ocm_client(ocm_token=ocm_token, ocm_env=ocm_env)
+
+
+def get_existing_ocm_clusters_names(ocm_client: DefaultApi, names: list[str]) -> set[str]:
+    """
+    Get which of `names` already exist in OCM, using paginated `name in (...)` searches.
+
+    Falls back to concurrent per-name checks if the batched search is rejected by OCM.
+
+    Args:
+        ocm_client (DefaultApi): OCM client.
+        names (list): Clusters names.
+
+    Returns:
+        set: Existing clusters names.
+    """
+    from ocm_python_client.exceptions import ApiException
+
+    try:
+        return search_ocm_clusters_names(ocm_client=ocm_client, names=names)
+
+    except ApiException as ex:
+        LOGGER.warning(f"Batched OCM clusters search failed, checking clusters one by one. error: {ex.reason}")
+
+    with ThreadPoolExecutor(max_workers=PREPARE_CLUSTERS_MAX_WORKERS) as executor:
+        futures = {_name: executor.submit(ocm_cluster_exists, ocm_client=ocm_client, name=_name) for _name in names}
+
+    return {_name for _name, _future in futures.items() if _future.result()}
+
+
+def ocm_cluster_exists(ocm_client: DefaultApi, name: str) -> bool:
+    from ocm_python_wrapper.cluster import Cluster
+
+    return bool(Cluster(client=ocm_client, name=name).exists)
+
+
+def search_ocm_clusters_names(ocm_client: DefaultApi, names: list[str]) -> set[str]:
+    existing_names: set[str] = set()
+    for idx in range(0, len(names), OCM_CLUSTERS_SEARCH_MAX_NAMES):
+        _names_str = ", ".join(f"'{_name}'" for _name in names[idx : idx + OCM_CLUSTERS_SEARCH_MAX_NAMES])
+        page = 1
+        while True:
+            clusters_list = ocm_client.api_clusters_mgmt_v1_clusters_get(
+                search=f"name in ({_names_str})", page=page, size=OCM_CLUSTERS_SEARCH_PAGE_SIZE
+            )
+            existing_names.update(_cluster.name for _cluster in clusters_list.items)
+            if not clusters_list.items or page * OCM_CLUSTERS_SEARCH_PAGE_SIZE >= clusters_list.total:
+                break
+
+            page += 1
+
+    return existing_names & set(names)
+
+
+def get_cluster_data_files(directory: str) -> Generator[str, None, None]:
+    """
+    Find cluster data files, without descending into cluster directories and known heavy directories.
+    """
+    for root, dirs, files in os.walk(directory):
+        if CLUSTER_DATA_YAML_FILENAME in files:
+            dirs.clear()
+            yield os.path.join(root, CLUSTER_DATA_YAML_FILENAME)
+        else:
+            dirs[:] = [_dir for _dir in dirs if _dir not in CLUSTERS_SCAN_SKIPPED_DIRECTORIES]
+
+
+def load_cluster_data_file(cluster_data_file: str) -> dict[str, Any]:
+    with open(cluster_data_file) as fd:
+        _data = yaml.load(fd, Loader=YamlLoader)
+
+    _data["cluster_info"]["cluster-dir"] = os.path.dirname(cluster_data_file)
+    _data["cluster_info"]["s3_bucket_name"] = _data.get("s3_bucket_name")
+    _data["cluster_info"]["s3_bucket_path"] = _data.get("s3_bucket_path")
+    return _data
 
 
 def clusters_from_directories(directories: list[str]) -> list[dict[str, Any]]:
-    clusters_data_list = []
-    for directory in directories:
-        for root, dirs, files in os.walk(directory):
-            for _file in files:
-                if _file == CLUSTER_DATA_YAML_FILENAME:
-                    with open(os.path.join(root, _file)) as fd:
-                        _data = yaml.safe_load(fd)
+    return [
+        load_cluster_data_file(cluster_data_file=_cluster_data_file)
+        for directory in directories
+        for _cluster_data_file in get_cluster_data_files(directory=directory)
+    ]
+
+
+def get_clusters_inventory(clusters_install_data_directory: str) -> ClustersInventory:
+    """
+    Get the clusters inventory, built by scanning the install data directory (once per run) if it does not exist.
+    """
+    inventory = ClustersInventory(clusters_install_data_directory=clusters_install_data_directory)
+
+    def _build_inventory() -> None:
+        if not inventory.exists and os.path.isdir(clusters_install_data_directory):
+            LOGGER.info(f"Clusters inventory {inventory.db_file} not found, scanning {clusters_install_data_directory}")
+            inventory.rebuild(
+                clusters_data_list=clusters_from_directories(directories=[clusters_install_data_directory])
+            )
+
+    run_single_flight(key=f"clusters-inventory:{inventory.db_file}", func=_build_inventory)
+    return inventory
+
+
+def clusters_from_install_data_directory(clusters_install_data_directory: str) -> list[dict[str, Any]]:
+    """
+    Get the clusters of the install data directory.
 
-                    _data["cluster_info"]["cluster-dir"] = root
-                    _data["cluster_info"]["s3_bucket_name"] = _data.get("s3_bucket_name")
-                    _data["cluster_info"]["s3_bucket_path"] = _data.get("s3_bucket_path")
+    The inventory is reconciled with the (pruned) install data directory scan: cluster directories missing from the
+    inventory (copied in or created by older versions) are added to it, destroyed clusters are skipped.
+    """
+    inventory = get_clusters_inventory(clusters_install_data_directory=clusters_install_data_directory)
+    if not inventory.exists:
+        return []
 
-                    clusters_data_list.append(_data)
+    inventory_cluster_dirs = {os.path.normpath(_cluster_dir) for _cluster_dir in inventory.cluster_dirs()}
+    destroyed_cluster_dirs = {os.path.normpath(_cluster_dir) for _cluster_dir in inventory.destroyed_cluster_dirs()}
+    clusters_data = []
+    for _cluster_data_file in get_cluster_data_files(directory=clusters_install_data_directory):
+        _cluster_dir = os.path.normpath(os.path.dirname(_cluster_data_file))
+        if _cluster_dir in destroyed_cluster_dirs:
+            continue
 
-    return clusters_data_list
+        _cluster_data = load_cluster_data_file(cluster_data_file=_cluster_data_file)
+        if _cluster_dir not in inventory_cluster_dirs:
+            LOGGER.warning(f"Cluster directory {_cluster_dir} not found in clusters inventory, adding it")
+            inventory.add(cluster_dir=_cluster_dir, cluster_info=_cluster_data["cluster_info"])
+
+        clusters_data.append(_cluster_data)
+
+    return clusters_data
+
+
+def list_clusters_from_install_data_directory(
+    clusters_install_data_directory: str, filters: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """
+    List (print) the clusters of the install data directory inventory.
+
+    Args:
+        clusters_install_data_directory (str): Clusters install data directory.
+        filters (dict): `platform`, `region`, `older-than` (time string, e.g. `12h`) and `expired` (true/false).
+
+    Returns:
+        list: Listed clusters, see `ClustersInventory.list_clusters`.
+    """
+    filters = filters or {}
+    unsupported_filters = set(filters) - set(SUPPORTED_LIST_CLUSTERS_FILTERS)
+    if unsupported_filters:
+        LOGGER.error(
+            f"Unsupported `--list-clusters-filter` filters: {sorted(unsupported_filters)}, "
+            f"supported filters: {SUPPORTED_LIST_CLUSTERS_FILTERS}"
+        )
+        raise click.Abort()
+
+    older_than = filters.get("older-than")
+    expired = filters.get("expired")
+    clusters = get_clusters_inventory(clusters_install_data_directory=clusters_install_data_directory).list_clusters(
+        platform=filters.get("platform", ""),
+        region=filters.get("region", ""),
+        older_than_seconds=None if older_than is None else tts(ts=older_than),
+        expired=None if expired is None else str(expired).lower() == "true",
+    )
+
+    columns = ("name", "platform", "region", "ocm-env", "created-at", "expiration-time", "cluster-dir")
+    rows = [columns] + [tuple(str(_cluster[_column] or "") for _column in columns) for _cluster in clusters]
+    widths = [max(len(_row[_idx]) for _row in rows) for _idx in range(len(columns))]
+    for _row in rows:
+        click.echo("  ".join(_value.ljust(_width) for _value, _width in zip(_row, widths)).rstrip())
+
+    return clusters
 
 
 def get_destroy_clusters_kwargs(clusters_data_list: list[dict[str, Any]], user_input: UserInput) -> UserInput:
@@ -65,59 +226,119 @@ def get_destroy_clusters_kwargs(clusters_data_list: list[dict[str, Any]], user_i
     return user_input
 
 
-def prepare_clusters_directory_from_s3_bucket(s3_bucket_name: str, s3_bucket_path: str = "", query: str = "") -> None:
-    download_futures = []
-    extract_futures = []
-    target_files_paths = []
-    _s3_client = s3_client()
-    for cluster_zip_file in get_all_zip_files_from_s3_bucket(
-        client=_s3_client,
+def get_s3_download_client() -> botocore.client.S3:
+    import botocore.config
+    from clouds.aws.session_clients import aws_session
+
+    # Default connection pool (10) is smaller than the download workers
+    return aws_session().client(
+        service_name="s3", config=botocore.config.Config(max_pool_connections=S3_DOWNLOAD_MAX_WORKERS)
+    )
+
+
+def download_and_extract_zip_file(
+    client: botocore.client.S3, s3_bucket_name: str, s3_bucket_cluster_zip_path: str
+) -> None:
+    from openshift_cli_installer.utils.s3_backup import extract_destroy_files_from_s3_zip
+
+    extracted_zip_filename: str = os.path.split(s3_bucket_cluster_zip_path)[-1]
+    extract_target_dir: str = os.path.join(
+        DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY,
+        extracted_zip_filename.split(".")[0],
+    )
+    Path(extract_target_dir).mkdir(parents=True, exist_ok=True)
+
+    LOGGER.info(f"Extract S3 bucket {s3_bucket_name} {extracted_zip_filename} to {extract_target_dir}")
+    extract_destroy_files_from_s3_zip(
+        client=client,
+        s3_bucket_name=s3_bucket_name,
+        s3_bucket_object_name=s3_bucket_cluster_zip_path,
+        extract_dir=extract_target_dir,
+    )
+
+
+def download_and_extract_zip_files(client: botocore.client.S3, zip_files: Iterable[tuple[str, str]]) -> None:
+    """
+    Extract S3 zip files concurrently, see `extract_destroy_files_from_s3_zip`.
+
+    `zip_files` is consumed lazily (S3 listing pages are fetched while downloads run), at most
+    `S3_DOWNLOAD_MAX_WORKERS` zip files are queued on top of the running downloads.
+
+    Args:
+        client (S3.Client): S3 client.
+        zip_files (Iterable): (S3 bucket name, zip file key) tuples.
+    """
+    queued_downloads = threading.BoundedSemaphore(value=S3_DOWNLOAD_MAX_WORKERS * 2)
+    futures = {}
+    with ThreadPoolExecutor(max_workers=S3_DOWNLOAD_MAX_WORKERS) as executor:
+        for s3_bucket_name, s3_bucket_cluster_zip_path in zip_files:
+            queued_downloads.acquire()
+            future = executor.submit(
+                download_and_extract_zip_file,
+                client=client,
+                s3_bucket_name=s3_bucket_name,
+                s3_bucket_cluster_zip_path=s3_bucket_cluster_zip_path,
+            )
+            future.add_done_callback(lambda _: queued_downloads.release())
+            futures[future] = f"{s3_bucket_name}/{s3_bucket_cluster_zip_path}"
+
+    for _future, _zip_file in futures.items():
+        if _exception := _future.exception():
+            LOGGER.error(f"Failed to download and extract {_zip_file}: {_exception}")
+
+
+def get_zip_files_to_download(
+    client: botocore.client.S3, s3_bucket_name: str, s3_bucket_path: str = "", query: str = ""
+) -> Generator[tuple[str, str], None, None]:
+    from openshift_cli_installer.utils.s3_index import get_s3_backup_index_zip_files, update_s3_backup_index
+
+    index_zip_files = get_s3_backup_index_zip_files(
+        client=client, s3_bucket_name=s3_bucket_name, s3_bucket_path=s3_bucket_path, query=query
+    )
+    if index_zip_files is not None:
+        LOGGER.info(f"Found {len(index_zip_files)} zip files in S3 bucket {s3_bucket_name} backups index")
+        for _object_key in index_zip_files:
+            yield s3_bucket_name, _object_key
+
+        return
+
+    # No index or backups uploaded before the index existed, list the bucket and complete the index
+    listed_objects = []
+    for _s3_object in get_all_zip_objects_from_s3_bucket(
+        client=client,
         s3_bucket_name=s3_bucket_name,
         s3_bucket_path=s3_bucket_path,
-        query=query,
     ):
-        extracted_zip_filename: str = os.path.split(cluster_zip_file)[-1]
-        extract_target_dir: str = os.path.join(
-            DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY,
-            extracted_zip_filename.split(".")[0],
-        )
-        Path(extract_target_dir).mkdir(parents=True, exist_ok=True)
-        target_file_path = os.path.join(extract_target_dir, extracted_zip_filename)
-        s3_bucket_cluster_zip_path = os.path.join(s3_bucket_path, cluster_zip_file)
-        with ThreadPoolExecutor() as download_executor:
-            LOGGER.info(f"Download S3 bucket {s3_bucket_name} to {extracted_zip_filename}")
-            download_futures.append(
-                download_executor.submit(
-                    _s3_client.download_file,
-                    Bucket=s3_bucket_name,
-                    Key=s3_bucket_cluster_zip_path,
-                    Filename=target_file_path,
-                )
-            )
-            target_files_paths.append(target_file_path)
-
-        if download_futures:
-            for _ in as_completed(download_futures):
-                """
-                Place holder to make sure all futures are completed.
-                """
-
-    for zip_file_path in target_files_paths:
-        with ThreadPoolExecutor() as extract_executor:
-            extract_futures.append(
-                extract_executor.submit(
-                    shutil.unpack_archive,
-                    filename=zip_file_path,
-                    extract_dir=os.path.split(zip_file_path)[0],
-                    format="zip",
-                )
-            )
+        listed_objects.append(_s3_object)
+        if query in _s3_object["Key"]:
+            yield s3_bucket_name, _s3_object["Key"]
+
+    update_s3_backup_index(
+        client=client,
+        s3_bucket_name=s3_bucket_name,
+        s3_bucket_path=s3_bucket_path,
+        listed_objects=listed_objects,
+    )
+
+
+def prepare_clusters_directory_from_s3_bucket(s3_bucket_name: str, s3_bucket_path: str = "", query: str = "") -> None:
+    _s3_client = get_s3_download_client()
+    download_and_extract_zip_files(
+        client=_s3_client,
+        zip_files=get_zip_files_to_download(
+            client=_s3_client, s3_bucket_name=s3_bucket_name, s3_bucket_path=s3_bucket_path, query=query
+        ),
+    )
+
 
-        if extract_futures:
-            for _ in as_completed(extract_futures):
-                """
-                Place holder to make sure all futures are completed.
-                """
+def get_all_zip_objects_from_s3_bucket(
+    client: botocore.client.S3, s3_bucket_name: str, s3_bucket_path: str = ""
+) -> Generator[dict[str, Any], None, None]:
+    paginator = client.get_paginator("list_objects_v2")
+    for _page in paginator.paginate(Bucket=s3_bucket_name, Prefix=s3_bucket_path):
+        for _object in _page.get("Contents", []):
+            if _object["Key"].endswith(".zip"):
+                yield _object
 
 
 def get_all_zip_files_from_s3_bucket(
@@ -126,9 +347,11 @@ def get_all_zip_files_from_s3_bucket(
     s3_bucket_path: str = "",
     query: str | None = None,
 ) -> Generator[str, None, None]:
-    for _object in client.list_objects(Bucket=s3_bucket_name, Prefix=s3_bucket_path).get("Contents", []):
+    for _object in get_all_zip_objects_from_s3_bucket(
+        client=client, s3_bucket_name=s3_bucket_name, s3_bucket_path=s3_bucket_path
+    ):
         _object_key = _object["Key"]
-        if _object_key.endswith(".zip") and (query is None or query in _object_key):
+        if query is None or query in _object_key:
             yield os.path.split(_object_key)[-1] if s3_bucket_path else _object_key
 
 
@@ -147,19 +370,22 @@ def destroy_clusters_from_s3_bucket_or_local_directory(user_input: UserInput) ->
         )
 
     if destroy_clusters_from_install_data_directory or s3_from_clusters_data_directory:
-        clusters_from_directory = clusters_from_directories(directories=[user_input.clusters_install_data_directory])
+        clusters_from_directory = clusters_from_install_data_directory(
+            clusters_install_data_directory=user_input.clusters_install_data_directory
+        )
         if destroy_clusters_from_install_data_directory:
             data_directory_clusters_data_list.extend(clusters_from_directory)
 
         elif s3_from_clusters_data_directory:
-            for _cluster in clusters_from_directory:
-                prepare_clusters_directory_from_s3_bucket(
-                    s3_bucket_name=_cluster.get("s3_bucket_name", ""),
-                    s3_bucket_path=_cluster.get("s3_bucket_path", ""),
-                    query=os.path.split(
-                        _cluster["cluster_info"].get("s3-object-name", ""),
-                    )[-1],
-                )
+            # The zip file key is saved in the cluster data, no bucket listing needed
+            download_and_extract_zip_files(
+                client=get_s3_download_client(),
+                zip_files=[
+                    (_cluster["s3_bucket_name"], _cluster["cluster_info"]["s3-object-name"])
+                    for _cluster in clusters_from_directory
+                    if _cluster.get("s3_bucket_name") and _cluster["cluster_info"].get("s3-object-name")
+                ],
+            )
 
     s3_clusters_data_list.extend(clusters_from_directories(directories=[DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY]))
 
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import datetime
+import os
+import sqlite3
+import time
+from collections.abc import Generator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any
+
+from openshift_cli_installer.utils.const import CLUSTERS_INVENTORY_FILENAME
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS clusters (
+    cluster_dir TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    region TEXT,
+    ocm_env TEXT,
+    created_at REAL NOT NULL,
+    expiration_time TEXT
+)
+"""
+# Destroyed cluster directories are kept (logs, must-gather), they are not reconciled back into the inventory
+_CREATE_DESTROYED_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS destroyed_clusters (
+    cluster_dir TEXT PRIMARY KEY
+)
+"""
+_UPSERT_SQL = """
+INSERT INTO clusters (cluster_dir, name, platform, region, ocm_env, created_at, expiration_time)
+VALUES (:cluster_dir, :name, :platform, :region, :ocm_env, :created_at, :expiration_time)
+ON CONFLICT (cluster_dir) DO UPDATE SET
+    name = excluded.name,
+    platform = excluded.platform,
+    region = excluded.region,
+    ocm_env = excluded.ocm_env,
+    expiration_time = excluded.expiration_time
+"""
+
+
+class ClustersInventory:
+    """
+    SQLite index of the clusters of a clusters install data directory.
+
+    A cluster is added when its `cluster_data.yaml` is written and removed (recorded as destroyed) when it is
+    destroyed, clusters are listed without walking the install data directory (installer logs, `.terraform`,
+    must-gather).
+    """
+
+    def __init__(self, clusters_install_data_directory: str) -> None:
+        self.clusters_install_data_directory = clusters_install_data_directory
+        self.db_file = os.path.join(clusters_install_data_directory, CLUSTERS_INVENTORY_FILENAME)
+
+    @property
+    def exists(self) -> bool:
+        return os.path.isfile(self.db_file)
+
+    @contextmanager
+    def connect(self) -> Generator[sqlite3.Connection, None, None]:
+        Path(self.clusters_install_data_directory).mkdir(parents=True, exist_ok=True)
+        # Clusters are created in parallel, writers wait for each other
+        with closing(sqlite3.connect(self.db_file, timeout=30)) as connection, connection:
+            connection.row_factory = sqlite3.Row
+            connection.execute(_CREATE_TABLE_SQL)
+            connection.execute(_CREATE_DESTROYED_TABLE_SQL)
+            yield connection
+
+    @staticmethod
+    def _get_row(cluster_dir: str, cluster_info: dict[str, Any], created_at: float) -> dict[str, Any]:
+        return {
+            "cluster_dir": cluster_dir,
+            "name": cluster_info["name"],
+            "platform": cluster_info["platform"],
+            "region": cluster_info.get("region"),
+            "ocm_env": cluster_info.get("ocm-env"),
+            "created_at": created_at,
+            "expiration_time": cluster_info.get("expiration-time"),
+        }
+
+    def add(self, cluster_dir: str, cluster_info: dict[str, Any]) -> None:
+        with self.connect() as connection:
+            connection.execute(
+                _UPSERT_SQL, self._get_row(cluster_dir=cluster_dir, cluster_info=cluster_info, created_at=time.time())
+            )
+            connection.execute("DELETE FROM destroyed_clusters WHERE cluster_dir = ?", (cluster_dir,))
+
+    def remove(self, cluster_dir: str) -> None:
+        if not self.exists:
+            return
+
+        with self.connect() as connection:
+            connection.execute("DELETE FROM clusters WHERE cluster_dir = ?", (cluster_dir,))
+            connection.execute("INSERT OR IGNORE INTO destroyed_clusters (cluster_dir) VALUES (?)", (cluster_dir,))
+
+    def rebuild(self, clusters_data_list: list[dict[str, Any]]) -> None:
+        """
+        Replace the inventory with clusters found by scanning the install data directory.
+
+        The creation time of scanned clusters is the cluster directory change time.
+        """
+        with self.connect() as connection:
+            connection.execute("DELETE FROM clusters")
+            connection.executemany(
+                _UPSERT_SQL,
+                [
+                    self._get_row(
+                        cluster_dir=_cluster_data["cluster_info"]["cluster-dir"],
+                        cluster_info=_cluster_data["cluster_info"],
+                        created_at=os.path.getctime(_cluster_data["cluster_info"]["cluster-dir"]),
+                    )
+                    for _cluster_data in clusters_data_list
+                ],
+            )
+
+    def list_clusters(
+        self,
+        platform: str = "",
+        region: str = "",
+        older_than_seconds: int | None = None,
+        expired: bool | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List the inventory clusters.
+
+        Args:
+            platform (str): Only clusters of this platform.
+            region (str): Only clusters in this region.
+            older_than_seconds (int): Only clusters created more than `older_than_seconds` ago.
+            expired (bool): Only clusters with a passed (True) or a future / no (False) expiration time.
+
+        Returns:
+            list: Clusters (name, platform, region, ocm-env, created-at, expiration-time, cluster-dir), oldest first.
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        if platform:
+            conditions.append("platform = ?")
+            params.append(platform)
+
+        if region:
+            conditions.append("region = ?")
+            params.append(region)
+
+        if older_than_seconds is not None:
+            conditions.append("created_at < ?")
+            params.append(time.time() - older_than_seconds)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.connect() as connection:
+            rows = connection.execute(f"SELECT * FROM clusters {where} ORDER BY created_at", params).fetchall()
+
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        clusters = []
+        for _row in rows:
+            _expiration_time = _row["expiration_time"]
+            if expired is not None and expired != bool(
+                _expiration_time and datetime.datetime.fromisoformat(_expiration_time) < now
+            ):
+                continue
+
+            clusters.append({
+                "name": _row["name"],
+                "platform": _row["platform"],
+                "region": _row["region"],
+                "ocm-env": _row["ocm_env"],
+                "created-at": datetime.datetime.fromtimestamp(_row["created_at"], tz=datetime.timezone.utc).isoformat(
+                    timespec="seconds"
+                ),
+                "expiration-time": _expiration_time,
+                "cluster-dir": _row["cluster_dir"],
+            })
+
+        return clusters
+
+    def cluster_dirs(self) -> list[str]:
+        with self.connect() as connection:
+            return [_row["cluster_dir"] for _row in connection.execute("SELECT cluster_dir FROM clusters")]
+
+    def destroyed_cluster_dirs(self) -> list[str]:
+        with self.connect() as connection:
+            return [_row["cluster_dir"] for _row in connection.execute("SELECT cluster_dir FROM destroyed_clusters")]
@@ -2,8 +2,34 @@
 import os
 
 CLUSTER_DATA_YAML_FILENAME = "cluster_data.yaml"
+CLUSTERS_INSTALL_DATA_DIRECTORY = "/openshift-cli-installer/clusters-install-data"
+# Clusters inventory, at the clusters install data directory root
+CLUSTERS_INVENTORY_FILENAME = "clusters-inventory.sqlite"
+# Never scanned for cluster data files (without inventory)
+CLUSTERS_SCAN_SKIPPED_DIRECTORIES = (".terraform", "terraform", "auth", "tls", "must-gather")
+SUPPORTED_LIST_CLUSTERS_FILTERS = ("platform", "region", "older-than", "expired")
+# Cluster object attributes saved to CLUSTER_DATA_YAML_FILENAME, read back to destroy the cluster
+CLUSTER_DATA_PERSISTED_KEYS = ("cluster", "cluster_info", "s3_bucket_name", "s3_bucket_path")
+CLUSTER_PHASE_JOURNAL_FILENAME = "phases.jsonl"
 USER_INPUT_CLUSTER_BOOLEAN_KEYS = ("acm", "acm-observability", "auto-region")
 DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY = os.path.join("/", "tmp", "openshift-cli-installer", "s3-extracted")
+CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "openshift-cli-installer")
+INSTALLER_CACHE_METADATA_FILENAME = "metadata.json"
+INSTALLER_CACHE_MAX_SIZE_BYTES = 5 * 1024**3
+RELEASE_CATALOG_CACHE_TTL_SECONDS = 10 * 60
+OCM_VERSIONS_CACHE_TTL_SECONDS = 10 * 60
+# Hypershift VPC terraform working directory, initialized once and reused by clusters directories
+HYPERSHIFT_TERRAFORM_FILENAME = "setup-vpc.tf"
+TERRAFORM_CACHE_DIRNAME = "terraform"
+TERRAFORM_DOT_DIRNAME = ".terraform"
+TERRAFORM_LOCK_FILENAME = ".terraform.lock.hcl"
+TERRAFORM_TEMPLATE_INITIALIZED_FILENAME = ".initialized"
+
+# OCM
+OCM_SSO_TOKEN_ENDPOINT = "https://sso.redhat.com/auth/realms/redhat-external/protocol/openid-connect/token"
+OCM_ACCESS_TOKEN_REFRESH_MARGIN_SECONDS = 60
+OCM_CLUSTERS_SEARCH_PAGE_SIZE = 100
+OCM_CLUSTERS_SEARCH_MAX_NAMES = 50
 
 # Cluster types
 AWS_STR = "aws"
@@ -18,15 +44,57 @@ AWS_BASED_PLATFORMS = (ROSA_STR, HYPERSHIFT_STR, AWS_OSD_STR, AWS_STR)
 OCM_MANAGED_PLATFORMS = (ROSA_STR, HYPERSHIFT_STR, AWS_OSD_STR, GCP_OSD_STR)
 OBSERVABILITY_SUPPORTED_STORAGE_TYPES = (S3_STR,)
 IPI_BASED_PLATFORMS = (AWS_STR, GCP_STR)
+IPI_BASED_PLATFORMS_STREAMS = ("stable", "nightly", "ec", "ci", "rc")
+OSD_SUPPORTED_CHANNELS = ("stable", "candidate", "nightly")
+SUPPORTED_INSTALLER_LOG_LEVELS = ("debug", "info", "warn", "error")
 
 # Cluster actions
 DESTROY_STR = "destroy"
 CREATE_STR = "create"
 SUPPORTED_ACTIONS = (DESTROY_STR, CREATE_STR)
 
+# Create failure policies
+ON_FAILURE_DESTROY_ALL_STR = "destroy-all"
+ON_FAILURE_FAIL_FAST_STR = "fail-fast"
+ON_FAILURE_KEEP_SUCCESSFUL_STR = "keep-successful"
+SUPPORTED_ON_FAILURE_POLICIES = (ON_FAILURE_DESTROY_ALL_STR, ON_FAILURE_FAIL_FAST_STR, ON_FAILURE_KEEP_SUCCESSFUL_STR)
+
+# Run result manifest, written next to the clusters install data directory
+RUN_RESULT_MANIFEST_SUFFIX = "-run-result.json"
+RUN_RESULT_MANIFEST_VERSION = 1
+CLUSTER_STATUS_IN_PROGRESS_STR = "in-progress"
+CLUSTER_STATUS_CREATED_STR = "created"
+CLUSTER_STATUS_FAILED_STR = "failed"
+CLUSTER_STATUS_CANCELLED_STR = "cancelled"
+CLUSTER_STATUS_DESTROYED_STR = "destroyed"
+
 # OCM environments
 PRODUCTION_STR = "production"
 STAGE_STR = "stage"
 
+# Concurrency
+PREPARE_CLUSTERS_MAX_WORKERS = 10
+SUPPORTED_CONCURRENCY_LIMITS = ("platform", "platform-per-region", "region", "ocm-env")
+
+# Destroy
+DESTROY_CLUSTER_ATTEMPTS = 3
+DESTROY_CLUSTER_RETRY_BACKOFF_SECONDS = 30
+# Exit code when some (not all) clusters failed to destroy
+DESTROY_PARTIAL_FAILURE_EXIT_CODE = 3
+
+# Install dir backup, streamed to S3 as a multipart upload (S3 minimum part size is 5 MiB)
+S3_MULTIPART_PART_SIZE_BYTES = 8 * 1024 * 1024
+S3_MULTIPART_MAX_CONCURRENCY = 4
+# Destroy from S3, concurrent backups downloads and extractions
+S3_DOWNLOAD_MAX_WORKERS = 32
+S3_RANGED_GET_BLOCK_SIZE_BYTES = 1024 * 1024
+# Backups index, one per S3 bucket path, updated on backup upload and delete
+S3_BACKUP_INDEX_FILENAME = "openshift-cli-installer-index.json"
+S3_BACKUP_INDEX_VERSION = 2
+S3_BACKUP_INDEX_UPDATE_ATTEMPTS = 5
+# Backup files extracted to destroy a cluster, installer logs and other files are skipped
+DESTROY_REQUIRED_DIRECTORIES = ("auth/",)
+DESTROY_REQUIRED_FILES_PATTERNS = (CLUSTER_DATA_YAML_FILENAME, "metadata.json", "*.tfstate", "*.tfstate.backup")
+
 # Timeouts
 TIMEOUT_60MIN = "60m"
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, NamedTuple
+
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+
+class DagTask(NamedTuple):
+    name: str
+    func: Callable[[], Any]
+    dependencies: tuple[str, ...] = ()
+    # Concurrency limits the task counts against, see `run_dag` `limits`
+    limits: tuple[str, ...] = ()
+    # Not started once `run_dag` `cancel_event` is set
+    cancellable: bool = True
+
+
+class DagResult(NamedTuple):
+    succeeded: list[str]
+    failed: dict[str, BaseException]
+    skipped: list[str]
+    # Tasks never started because `cancel_event` was set
+    cancelled: list[str]
+
+
+def run_dag(
+    tasks: list[DagTask],
+    max_workers: int | None = None,
+    limits: dict[str, int] | None = None,
+    cancel_event: threading.Event | None = None,
+    cancel_on_failure: bool = True,
+) -> DagResult:
+    """
+    Run tasks as soon as all their dependencies succeeded.
+
+    Ready tasks are started in `tasks` order; tasks depending (directly or not) on a failed task are skipped.
+    A ready task only starts when every concurrency limit it counts against has a free slot.
+    With `max_workers=1` tasks are executed one by one.
+
+    If `cancel_event` is given, it is set on the first failure (fail-fast): cancellable tasks not started yet are
+    cancelled, their dependents are skipped and running tasks can check the event to stop early.
+    With `cancel_on_failure=False` the event is only set by the caller.
+
+    Args:
+        tasks (list): Tasks to run, dependencies must be names of other tasks in `tasks`.
+        max_workers (int): Max concurrent tasks, all ready tasks can run concurrently if None.
+        limits (dict): Concurrency limit name to max concurrent tasks, limits missing from `limits` are unbounded.
+        cancel_event (threading.Event): Fail-fast event, set on first failure or by the caller to stop scheduling.
+        cancel_on_failure (bool): Set `cancel_event` on the first failure.
+
+    Returns:
+        DagResult: succeeded, failed (name to exception), skipped and cancelled tasks names.
+    """
+    verify_dag(tasks=tasks)
+
+    semaphores = {_name: threading.BoundedSemaphore(value=_value) for _name, _value in (limits or {}).items()}
+    pending = list(tasks)
+    ready: list[DagTask] = []
+    running: dict[Future[Any], DagTask] = {}
+    result = DagResult(succeeded=[], failed={}, skipped=[], cancelled=[])
+
+    def _update_ready_tasks() -> None:
+        _skipped = True
+        # Skipping a task skips its own dependents, loop until nothing is skipped
+        while _skipped:
+            _skipped = False
+            for _task in list(pending):
+                if any(
+                    _dep in result.failed or _dep in result.skipped or _dep in result.cancelled
+                    for _dep in _task.dependencies
+                ):
+                    LOGGER.warning(f"Skipping {_task.name}, a dependency failed or was cancelled")
+                    result.skipped.append(_task.name)
+                    pending.remove(_task)
+                    _skipped = True
+
+                elif all(_dep in result.succeeded for _dep in _task.dependencies):
+                    ready.append(_task)
+                    pending.remove(_task)
+
+    def _acquire_limits(task: DagTask) -> bool:
+        _acquired: list[threading.BoundedSemaphore] = []
+        for _semaphore in (semaphores[_limit] for _limit in task.limits if _limit in semaphores):
+            if not _semaphore.acquire(blocking=False):
+                for _acquired_semaphore in _acquired:
+                    _acquired_semaphore.release()
+
+                return False
+
+            _acquired.append(_semaphore)
+
+        return True
+
+    def _release_limits(task: DagTask) -> None:
+        for _limit in task.limits:
+            if _limit in semaphores:
+                semaphores[_limit].release()
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(tasks), 1)) as executor:
+        while True:
+            if (
+                cancel_event
+                and cancel_event.is_set()
+                and (_cancelled := [_task for _task in ready + pending if _task.cancellable])
+            ):
+                LOGGER.warning(f"Cancelling {[_task.name for _task in _cancelled]}")
+                result.cancelled.extend(_task.name for _task in _cancelled)
+                ready[:] = [_task for _task in ready if not _task.cancellable]
+                pending[:] = [_task for _task in pending if not _task.cancellable]
+
+            _update_ready_tasks()
+            for _task in list(ready):
+                if max_workers and len(running) >= max_workers:
+                    break
+
+                if _acquire_limits(task=_task):
+                    ready.remove(_task)
+                    running[executor.submit(_task.func)] = _task
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                _task = running.pop(future)
+                _release_limits(task=_task)
+                if _exception := future.exception():
+                    result.failed[_task.name] = _exception
+                    if cancel_event and cancel_on_failure:
+                        cancel_event.set()
+                else:
+                    result.succeeded.append(_task.name)
+
+    return result
+
+
+def verify_dag(tasks: list[DagTask]) -> None:
+    """
+    Verify tasks names are unique and dependencies are known tasks without cycles.
+    """
+    tasks_names = [_task.name for _task in tasks]
+    if len(tasks_names) != len(set(tasks_names)):
+        raise ValueError(
+            f"Duplicate tasks names: {sorted({_name for _name in tasks_names if tasks_names.count(_name) > 1})}"
+        )
+
+    for _task in tasks:
+        if _missing := set(_task.dependencies) - set(tasks_names):
+            raise ValueError(f"Task {_task.name} depends on unknown tasks: {sorted(_missing)}")
+
+    resolved: set[str] = set()
+    unresolved = list(tasks)
+    while unresolved:
+        _resolvable = [_task for _task in unresolved if set(_task.dependencies) <= resolved]
+        if not _resolvable:
+            raise ValueError(f"Tasks dependencies contain a cycle: {[_task.name for _task in unresolved]}")
+
+        resolved.update(_task.name for _task in _resolvable)
+        unresolved = [_task for _task in unresolved if _task.name not in resolved]
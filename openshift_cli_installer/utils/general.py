@@ -1,20 +1,31 @@
 from __future__ import annotations
 
+import fcntl
 import json
 import os
 import shutil
+import stat
+import tempfile
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
 from importlib.util import find_spec
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import click
 import yaml
-from clouds.aws.session_clients import s3_client
-from jinja2 import DebugUndefined, Environment, FileSystemLoader, meta
 from pyhelper_utils.general import ignore_exceptions
 from simple_logger.logger import get_logger
 
 LOGGER = get_logger(name=__name__)
+T = TypeVar("T")
+_SINGLE_FLIGHT_LOCK = threading.Lock()
+_SINGLE_FLIGHT_KEYS_LOCKS: dict[str, threading.Lock] = {}
+_SINGLE_FLIGHT_RESULTS: dict[str, Any] = {}
+# Read once at import, the umask can only be read by setting it, which is not thread safe
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
 
 
 def remove_terraform_folder_from_install_dir(install_dir: str) -> None:
@@ -30,15 +41,33 @@ def remove_terraform_folder_from_install_dir(install_dir: str) -> None:
 
 
 @ignore_exceptions(logger=LOGGER)
-def zip_and_upload_to_s3(install_dir: str, s3_bucket_name: str, s3_bucket_object_name: str) -> None:
+def zip_and_upload_to_s3(
+    install_dir: str, s3_bucket_name: str, s3_bucket_object_name: str, index_entry: dict[str, Any] | None = None
+) -> None:
+    # Imported on use, boto3 is not loaded by the CLI startup (help, dry-run)
+    from clouds.aws.session_clients import s3_client
+
+    from openshift_cli_installer.utils.s3_backup import stream_zip_to_s3
+    from openshift_cli_installer.utils.s3_index import update_s3_backup_index
+
     remove_terraform_folder_from_install_dir(install_dir=install_dir)
 
-    _base_name = os.path.join(Path(install_dir).parent, Path(s3_bucket_object_name).stem)
-    LOGGER.info(f"Writing data from {install_dir} to {_base_name} zip file")
-    zip_file = shutil.make_archive(base_name=_base_name, format="zip", root_dir=install_dir)
+    LOGGER.info(f"Streaming zip of {install_dir} to S3 {s3_bucket_name}, path {s3_bucket_object_name}")
+    _s3_client = s3_client()
+    stream_zip_to_s3(
+        client=_s3_client,
+        install_dir=install_dir,
+        s3_bucket_name=s3_bucket_name,
+        s3_bucket_object_name=s3_bucket_object_name,
+    )
 
-    LOGGER.info(f"Upload {zip_file} file to S3 {s3_bucket_name}, path {s3_bucket_object_name}")
-    s3_client().upload_file(Filename=zip_file, Bucket=s3_bucket_name, Key=s3_bucket_object_name)
+    if index_entry:
+        update_s3_backup_index(
+            client=_s3_client,
+            s3_bucket_name=s3_bucket_name,
+            s3_bucket_path=os.path.dirname(s3_bucket_object_name),
+            entry=index_entry,
+        )
 
 
 def get_manifests_path() -> str:
@@ -52,6 +81,8 @@ def get_manifests_path() -> str:
 
 
 def get_install_config_j2_template(jinja_dict: dict[str, str], platform: str) -> dict[str, Any]:
+    from jinja2 import DebugUndefined, Environment, FileSystemLoader, meta
+
     env = Environment(
         loader=FileSystemLoader(get_manifests_path()),
         trim_blocks=True,
@@ -90,3 +121,81 @@ def get_local_ssh_key(ssh_key_file: str) -> str:
 def get_dict_from_json(gcp_service_account_file: str) -> dict[str, Any]:
     with open(gcp_service_account_file) as fd:
         return json.loads(fd.read())
+
+
+@contextmanager
+def file_lock(lock_file_path: str) -> Generator[None, None, None]:
+    """
+    Exclusive advisory lock, shared between threads and processes on the same host.
+
+    Lock files can be removed by their lock holder (installers cache eviction), a lock acquired on a removed file
+    is retried on the new file.
+
+    Args:
+        lock_file_path (str): Path to the lock file, created if missing.
+    """
+    Path(lock_file_path).parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        with open(lock_file_path, "a") as fd:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if not os.path.samestat(os.fstat(fd.fileno()), os.stat(lock_file_path)):
+                    continue
+            except FileNotFoundError:
+                continue
+
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+            return
+
+
+def run_single_flight(key: str, func: Callable[[], T]) -> T:
+    """
+    Run `func` once per `key` for the whole run.
+
+    Concurrent callers with the same key wait for the first call and reuse its result.
+    Failures are not cached, the next caller runs `func` again.
+
+    Args:
+        key (str): Deduplication key.
+        func (Callable): Function to call.
+
+    Returns:
+        Any: `func` result.
+    """
+    with _SINGLE_FLIGHT_LOCK:
+        key_lock = _SINGLE_FLIGHT_KEYS_LOCKS.setdefault(key, threading.Lock())
+
+    with key_lock:
+        if key not in _SINGLE_FLIGHT_RESULTS:
+            _SINGLE_FLIGHT_RESULTS[key] = func()
+
+        return _SINGLE_FLIGHT_RESULTS[key]
+
+
+def write_file_atomically(file_path: str, content: str) -> None:
+    """
+    Write `content` to a temporary file in the same directory and rename it over `file_path`.
+
+    Readers never see a partially written file. The file keeps its mode, new files get the default mode (umask
+    applied) rather than the temporary file 0600 mode.
+    """
+    try:
+        _mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        _mode = 0o666 & ~_UMASK
+
+    _fd, _tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), prefix=f".{os.path.basename(file_path)}-")
+    try:
+        with os.fdopen(_fd, "w") as fd:
+            os.fchmod(fd.fileno(), _mode)
+            fd.write(content)
+
+        os.replace(_tmp_path, file_path)
+
+    except BaseException:
+        Path(_tmp_path).unlink(missing_ok=True)
+        raise
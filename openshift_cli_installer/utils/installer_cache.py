@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import INSTALLER_CACHE_MAX_SIZE_BYTES, INSTALLER_CACHE_METADATA_FILENAME
+from openshift_cli_installer.utils.general import file_lock
+
+LOGGER = get_logger(name=__name__)
+# Shared locks of the entries whose binary is used by this run, eviction skips them
+_IN_USE_ENTRIES_LOCK = threading.Lock()
+_IN_USE_ENTRIES_FDS: dict[str, int] = {}
+
+
+def get_installer_cache_key(version_url: str, openshift_install_binary: str) -> str:
+    """
+    Cache key is derived from the release image (version url) and the binary variant (FIPS or not).
+    """
+    return hashlib.sha256(f"{version_url}|{openshift_install_binary}".encode()).hexdigest()
+
+
+def get_file_sha256(file_path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as fd:
+        for chunk in iter(lambda: fd.read(1024 * 1024), b""):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+def get_installer_cache_entry_metadata(entry_dir: str) -> dict[str, Any]:
+    try:
+        with open(os.path.join(entry_dir, INSTALLER_CACHE_METADATA_FILENAME)) as fd:
+            return json.load(fd)
+
+    except (OSError, ValueError):
+        return {}
+
+
+def is_installer_cache_entry_valid(entry_dir: str, openshift_install_binary: str) -> bool:
+    """
+    The binary is hashed only if its size or mtime changed since it was cached.
+    """
+    metadata = get_installer_cache_entry_metadata(entry_dir=entry_dir)
+    binary_path = os.path.join(entry_dir, openshift_install_binary)
+    if not metadata or not os.path.isfile(binary_path):
+        return False
+
+    binary_stat = os.stat(binary_path)
+    if binary_stat.st_size == metadata.get("size") and binary_stat.st_mtime_ns == metadata.get("mtime-ns"):
+        return True
+
+    return get_file_sha256(file_path=binary_path) == metadata.get("sha256")
+
+
+def get_installer_cache_entry_in_use_lock_file(cache_dir: str, cache_key: str) -> str:
+    return os.path.join(cache_dir, f"{cache_key}.in-use.lock")
+
+
+def hold_installer_cache_entry(cache_dir: str, cache_key: str) -> None:
+    """
+    Hold a shared lock on a cache entry until the process exits (or `release_installer_cache_entries`).
+
+    The binary is used until the end of the run (create, `wait-for`, rollback destroy), other processes do not
+    evict the entry meanwhile.
+    """
+    with _IN_USE_ENTRIES_LOCK:
+        if cache_key in _IN_USE_ENTRIES_FDS:
+            return
+
+        fd = os.open(
+            get_installer_cache_entry_in_use_lock_file(cache_dir=cache_dir, cache_key=cache_key),
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+        )
+        fcntl.flock(fd, fcntl.LOCK_SH)
+        _IN_USE_ENTRIES_FDS[cache_key] = fd
+
+
+def release_installer_cache_entries() -> None:
+    """
+    Release the cache entries held by this run, called once the clusters are processed.
+    """
+    with _IN_USE_ENTRIES_LOCK:
+        for _fd in _IN_USE_ENTRIES_FDS.values():
+            os.close(_fd)
+
+        _IN_USE_ENTRIES_FDS.clear()
+
+
+def get_cached_openshift_install_binary(
+    cache_dir: str,
+    version_url: str,
+    openshift_install_binary: str,
+    extract_func: Callable[[str], None],
+    max_size_bytes: int = INSTALLER_CACHE_MAX_SIZE_BYTES,
+) -> str:
+    """
+    Get openshift-install binary path from the installers cache, extract it on cache miss.
+
+    The cache is shared between processes on the same host; each entry is protected by a file lock,
+    verified against its stored sha256 checksum and least recently used entries are evicted when the
+    cache grows above `max_size_bytes`. The returned entry is held by this process, see `hold_installer_cache_entry`.
+
+    Args:
+        cache_dir (str): Installers cache directory.
+        version_url (str): Release image the binary is extracted from.
+        openshift_install_binary (str): Binary name, `openshift-install` or `openshift-install-fips`.
+        extract_func (Callable): Called with a target directory to extract the binary into.
+        max_size_bytes (int): Max cache size.
+
+    Returns:
+        str: openshift-install binary path.
+    """
+    cache_key = get_installer_cache_key(version_url=version_url, openshift_install_binary=openshift_install_binary)
+    entry_dir = os.path.join(cache_dir, cache_key)
+    binary_path = os.path.join(entry_dir, openshift_install_binary)
+
+    with file_lock(lock_file_path=os.path.join(cache_dir, f"{cache_key}.lock")):
+        if is_installer_cache_entry_valid(entry_dir=entry_dir, openshift_install_binary=openshift_install_binary):
+            LOGGER.info(f"Using cached {openshift_install_binary} for {version_url} from {entry_dir}")
+            os.utime(os.path.join(entry_dir, INSTALLER_CACHE_METADATA_FILENAME))
+            hold_installer_cache_entry(cache_dir=cache_dir, cache_key=cache_key)
+            return binary_path
+
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        extract_dir = tempfile.mkdtemp(prefix=f".{cache_key}-", dir=cache_dir)
+        try:
+            extract_func(extract_dir)
+            extracted_binary_path = os.path.join(extract_dir, openshift_install_binary)
+            with open(os.path.join(extract_dir, INSTALLER_CACHE_METADATA_FILENAME), "w") as fd:
+                json.dump(
+                    {
+                        "version-url": version_url,
+                        "binary": openshift_install_binary,
+                        "sha256": get_file_sha256(file_path=extracted_binary_path),
+                        "size": os.path.getsize(extracted_binary_path),
+                        "mtime-ns": os.stat(extracted_binary_path).st_mtime_ns,
+                    },
+                    fd,
+                )
+
+            os.rename(extract_dir, entry_dir)
+
+        except BaseException:
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            raise
+
+        hold_installer_cache_entry(cache_dir=cache_dir, cache_key=cache_key)
+
+    LOGGER.info(f"Cached {openshift_install_binary} for {version_url} in {entry_dir}")
+    evict_installers_cache(cache_dir=cache_dir, max_size_bytes=max_size_bytes, keep_cache_key=cache_key)
+    return binary_path
+
+
+def evict_installers_cache(cache_dir: str, max_size_bytes: int, keep_cache_key: str = "") -> None:
+    """
+    Remove least recently used entries until the cache size is below `max_size_bytes`.
+
+    Entries locked by another process (being extracted or verified) or in use by any run are skipped.
+    Evicted entries lock files are removed with the entry.
+    """
+    with file_lock(lock_file_path=os.path.join(cache_dir, ".evict.lock")):
+        entries = []
+        for _entry in os.scandir(cache_dir):
+            if not _entry.is_dir() or _entry.name.startswith("."):
+                continue
+
+            metadata_file = os.path.join(_entry.path, INSTALLER_CACHE_METADATA_FILENAME)
+            metadata = get_installer_cache_entry_metadata(entry_dir=_entry.path)
+            entries.append((os.path.getmtime(metadata_file) if metadata else 0, metadata.get("size", 0), _entry))
+
+        cache_size = sum(_size for _, _size, _ in entries)
+        for _, _size, _entry in sorted(entries, key=lambda _cache_entry: _cache_entry[0]):
+            if cache_size <= max_size_bytes:
+                break
+
+            if _entry.name == keep_cache_key:
+                continue
+
+            lock_file = os.path.join(cache_dir, f"{_entry.name}.lock")
+            in_use_lock_file = get_installer_cache_entry_in_use_lock_file(cache_dir=cache_dir, cache_key=_entry.name)
+            with open(lock_file, "a") as fd, open(in_use_lock_file, "a") as in_use_fd:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    fcntl.flock(in_use_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+
+                LOGGER.info(f"Evicting installers cache entry {_entry.path}")
+                shutil.rmtree(_entry.path, ignore_errors=True)
+                # Removed while locked, `file_lock` waiters retry on a new lock file
+                Path(in_use_lock_file).unlink(missing_ok=True)
+                Path(lock_file).unlink(missing_ok=True)
+                cache_size -= _size
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from typing import Any
+
+from ocm_python_client.api.default_api import DefaultApi
+from ocm_python_client.api_client import ApiClient
+from ocm_python_client.exceptions import UnauthorizedException
+from ocm_python_wrapper.ocm_client import OCMPythonClient
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import OCM_ACCESS_TOKEN_REFRESH_MARGIN_SECONDS, OCM_SSO_TOKEN_ENDPOINT
+from openshift_cli_installer.utils.general import run_single_flight
+
+LOGGER = get_logger(name=__name__)
+
+
+def get_access_token_expiration(access_token: str) -> float:
+    """
+    Get access token (JWT) expiration time, 0 if the token expiration cannot be read.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        return float(json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["exp"])
+
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0
+
+
+class PooledOCMClient(OCMPythonClient):
+    """
+    OCM client shared by all clusters of the same OCM environment.
+
+    The access token is refreshed once, by a single thread, shortly before it expires (or on Unauthorized),
+    concurrent API calls wait for the refresh and reuse the new token.
+    `OCMPythonClient.call_api` refreshes the token in every thread which gets Unauthorized, API calls go to
+    `ApiClient.call_api` and Unauthorized is handled here instead.
+    """
+
+    def __init__(self, token: str, api_host: str) -> None:
+        super().__init__(token=token, endpoint=OCM_SSO_TOKEN_ENDPOINT, api_host=api_host, discard_unknown_keys=True)
+        self.api_host = api_host
+        self.refresh_lock = threading.Lock()
+        self.access_token_expiration = get_access_token_expiration(access_token=self.client_config.access_token)
+
+    def refresh_access_token(self, expired_access_token: str) -> None:
+        with self.refresh_lock:
+            # Another thread already refreshed the token
+            if self.client_config.access_token != expired_access_token:
+                return
+
+            LOGGER.info(f"Refreshing OCM {self.api_host} access token")
+            # The token exchange is done by a new wrapper client
+            access_token = OCMPythonClient(
+                token=self.token, endpoint=self.endpoint, api_host=self.api_host
+            ).client_config.access_token
+            self.access_token_expiration = get_access_token_expiration(access_token=access_token)
+            self.client_config.access_token = access_token
+
+    def call_api(self, *args: Any, **kwargs: Any) -> Any:
+        access_token = self.client_config.access_token
+        if (
+            self.access_token_expiration
+            and self.access_token_expiration - time.time() < OCM_ACCESS_TOKEN_REFRESH_MARGIN_SECONDS
+        ):
+            self.refresh_access_token(expired_access_token=access_token)
+            access_token = self.client_config.access_token
+
+        try:
+            return ApiClient.call_api(self, *args, **kwargs)
+
+        except UnauthorizedException:
+            self.refresh_access_token(expired_access_token=access_token)
+            return ApiClient.call_api(self, *args, **kwargs)
+
+
+def get_pooled_ocm_client(ocm_token: str, ocm_env: str) -> DefaultApi:
+    """
+    Get the OCM client for `ocm_env`, one client (token exchange and HTTP connections pool) is created per
+    (token, OCM environment) for the whole run and shared by all clusters.
+
+    Args:
+        ocm_token (str): OCM offline token.
+        ocm_env (str): OCM environment.
+
+    Returns:
+        DefaultApi: OCM API client.
+    """
+    pool_key = f"ocm-client|{hashlib.sha256(ocm_token.encode()).hexdigest()}|{ocm_env}"
+    return run_single_flight(key=pool_key, func=lambda: PooledOCMClient(token=ocm_token, api_host=ocm_env).client)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+PHASE_STARTED_STR = "started"
+PHASE_COMPLETED_STR = "completed"
+
+
+class PhaseJournal:
+    """
+    Append-only JSON lines journal of a cluster create phases.
+
+    Each phase appends a `started` and a `completed` event, every line is flushed to disk before the phase
+    continues. A truncated last line (process killed while writing) is ignored when the journal is loaded.
+    """
+
+    def __init__(self, journal_file: str) -> None:
+        self.journal_file = journal_file
+        self.lock = threading.Lock()
+
+    def record(self, phase: str, event: str, data: dict[str, Any] | None = None) -> None:
+        line = json.dumps({"phase": phase, "event": event, "time": time.time(), "data": data or {}}, default=str)
+        with self.lock, open(self.journal_file, "a") as fd:
+            fd.write(f"{line}\n")
+            fd.flush()
+            os.fsync(fd.fileno())
+
+    def load(self) -> tuple[dict[str, dict[str, Any]], set[str]]:
+        """
+        Load the journal.
+
+        Returns:
+            tuple: completed phases (phase to recorded data) and interrupted phases (started, never completed).
+        """
+        completed_phases: dict[str, dict[str, Any]] = {}
+        started_phases: set[str] = set()
+        if not os.path.isfile(self.journal_file):
+            return completed_phases, started_phases
+
+        with open(self.journal_file) as fd:
+            for _line in fd:
+                try:
+                    _entry = json.loads(_line)
+                except ValueError:
+                    LOGGER.warning(f"Ignoring invalid phase journal line in {self.journal_file}: {_line!r}")
+                    continue
+
+                if _entry["event"] == PHASE_COMPLETED_STR:
+                    completed_phases[_entry["phase"]] = _entry["data"]
+                else:
+                    started_phases.add(_entry["phase"])
+
+        return completed_phases, started_phases - set(completed_phases)
+
+    def reset(self) -> None:
+        Path(self.journal_file).unlink(missing_ok=True)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import copy
+import datetime
+import json
+import os
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import (
+    CLUSTER_STATUS_CREATED_STR,
+    RUN_RESULT_MANIFEST_SUFFIX,
+    RUN_RESULT_MANIFEST_VERSION,
+)
+from openshift_cli_installer.utils.dag_scheduler import DagResult
+from openshift_cli_installer.utils.general import write_file_atomically
+
+LOGGER = get_logger(name=__name__)
+
+# Credentials are passed again on retry (CLI / environment), never written to the manifest
+CLUSTER_USER_INPUT_KEYS_TO_SKIP = (
+    "aws-access-key-id",
+    "aws-secret-access-key",
+    "gcp-service-account-file",
+    "name-prefix",
+    "auto-region",
+)
+
+
+def get_run_result_manifest_path(clusters_install_data_directory: str) -> str:
+    return f"{clusters_install_data_directory.rstrip('/')}{RUN_RESULT_MANIFEST_SUFFIX}"
+
+
+def get_cluster_user_input(cluster: Any) -> dict[str, Any]:
+    """
+    Get the cluster user input needed to create the same cluster again.
+
+    The user input is taken as given, values set during the run (expiration time, OIDC config ID, VPC subnets)
+    are created again. Only the name (from `name-prefix`), region (from `auto-region`), cluster directory and
+    short UUID are pinned so a retry targets the same cluster.
+    """
+    cluster_user_input = {
+        _key: _value
+        for _key, _value in copy.deepcopy(cluster.user_input_cluster).items()
+        if _key not in CLUSTER_USER_INPUT_KEYS_TO_SKIP
+    }
+    cluster_user_input.update({
+        "name": cluster.cluster_info["name"],
+        "region": cluster.cluster_info.get("region"),
+        "cluster_dir": cluster.cluster_info["cluster-dir"],
+        "shortuuid": cluster.cluster_info["shortuuid"],
+    })
+    return cluster_user_input
+
+
+def write_run_result_manifest(
+    manifest_path: str,
+    clusters: list[Any],
+    clusters_statuses: dict[str, str],
+    result: DagResult,
+    on_failure: str,
+) -> None:
+    """
+    Write the create run result manifest.
+
+    Args:
+        manifest_path (str): Manifest file path.
+        clusters (list): Cluster objects.
+        clusters_statuses (dict): Cluster name to status (created, failed, cancelled, destroyed).
+        result (DagResult): Create workflow result.
+        on_failure (str): Create failure policy.
+    """
+    manifest = {
+        "version": RUN_RESULT_MANIFEST_VERSION,
+        "finished-at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "on-failure": on_failure,
+        "clusters": [
+            {
+                "name": _cluster.cluster_info["name"],
+                "platform": _cluster.cluster_info["platform"],
+                "status": clusters_statuses[_cluster.cluster_info["name"]],
+                "cluster-dir": _cluster.cluster_info["cluster-dir"],
+                "user-input": get_cluster_user_input(cluster=_cluster),
+            }
+            for _cluster in clusters
+        ],
+        "tasks": {
+            "succeeded": result.succeeded,
+            "failed": {
+                _task_name: f"{_exception.__class__.__name__} {_exception}".strip()
+                for _task_name, _exception in result.failed.items()
+            },
+            "skipped": result.skipped,
+            "cancelled": result.cancelled,
+        },
+    }
+    LOGGER.info(f"Writing run result manifest to {manifest_path}")
+    write_file_atomically(file_path=manifest_path, content=json.dumps(manifest, indent=2, default=str))
+
+
+def read_run_result_manifest(manifest_path: str) -> dict[str, Any]:
+    if not os.path.isfile(manifest_path):
+        raise FileNotFoundError(f"Run result manifest {manifest_path} not found")
+
+    with open(manifest_path) as fd:
+        manifest = json.load(fd)
+
+    if manifest.get("version") != RUN_RESULT_MANIFEST_VERSION:
+        raise ValueError(
+            f"Run result manifest {manifest_path} version {manifest.get('version')} is not supported, "
+            f"supported version: {RUN_RESULT_MANIFEST_VERSION}"
+        )
+
+    return manifest
+
+
+def get_retry_completed_tasks(manifest: dict[str, Any]) -> set[str]:
+    """
+    Get the tasks of a previous run which do not need to run again.
+
+    A task is completed if it succeeded and all clusters it targets are still created (`create:<name>`,
+    `install-acm:<name>`, `attach:<hub>:<managed>`).
+    """
+    created_clusters_names = {
+        _cluster["name"] for _cluster in manifest["clusters"] if _cluster["status"] == CLUSTER_STATUS_CREATED_STR
+    }
+    return {
+        _task_name
+        for _task_name in manifest["tasks"]["succeeded"]
+        if set(_task_name.split(":")[1:]) <= created_clusters_names
+    }
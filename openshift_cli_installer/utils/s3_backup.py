@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import fnmatch
+import io
+import os
+import threading
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import (
+    DESTROY_REQUIRED_DIRECTORIES,
+    DESTROY_REQUIRED_FILES_PATTERNS,
+    S3_MULTIPART_MAX_CONCURRENCY,
+    S3_MULTIPART_PART_SIZE_BYTES,
+    S3_RANGED_GET_BLOCK_SIZE_BYTES,
+)
+
+LOGGER = get_logger(name=__name__)
+
+
+class S3MultipartUploadWriter(io.RawIOBase):
+    """
+    Write-only, non-seekable stream uploaded to S3 as a multipart upload.
+
+    Written data is cut into `part_size` parts, uploaded concurrently while writing continues. At most
+    `max_concurrency` parts are in flight, writes block until a part is uploaded, memory use is bounded to
+    (`max_concurrency` + 1) * `part_size`.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        part_size: int = S3_MULTIPART_PART_SIZE_BYTES,
+        max_concurrency: int = S3_MULTIPART_MAX_CONCURRENCY,
+    ) -> None:
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.buffer = bytearray()
+        self.parts: dict[int, Future[Any]] = {}
+        self.in_flight_parts = threading.BoundedSemaphore(value=max_concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self.upload_id = client.create_multipart_upload(Bucket=bucket, Key=key)["UploadId"]
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self.buffer.extend(data)
+        while len(self.buffer) >= self.part_size:
+            self._upload_part(data=bytes(self.buffer[: self.part_size]))
+            del self.buffer[: self.part_size]
+
+        return len(data)
+
+    def _upload_part(self, data: bytes) -> None:
+        # Fail the stream as soon as a part failed, not after the whole archive is written
+        for _future in self.parts.values():
+            if _future.done() and _future.exception():
+                raise _future.exception()  # type: ignore[misc]
+
+        self.in_flight_parts.acquire()
+        part_number = len(self.parts) + 1
+        future = self.executor.submit(
+            self.client.upload_part,
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        future.add_done_callback(lambda _: self.in_flight_parts.release())
+        self.parts[part_number] = future
+
+    def complete(self) -> None:
+        """
+        Upload the last part and complete the multipart upload.
+        """
+        if self.buffer or not self.parts:
+            self._upload_part(data=bytes(self.buffer))
+            self.buffer.clear()
+
+        try:
+            parts = [
+                {"PartNumber": _part_number, "ETag": _future.result()["ETag"]}
+                for _part_number, _future in self.parts.items()
+            ]
+        finally:
+            self.executor.shutdown()
+
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    def abort(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+        self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+
+
+def stream_zip_to_s3(
+    client: Any,
+    install_dir: str,
+    s3_bucket_name: str,
+    s3_bucket_object_name: str,
+    part_size: int = S3_MULTIPART_PART_SIZE_BYTES,
+    max_concurrency: int = S3_MULTIPART_MAX_CONCURRENCY,
+) -> None:
+    """
+    Zip `install_dir` straight into an S3 multipart upload, the archive is never written to disk.
+
+    Archive entries are relative to `install_dir`, like `shutil.make_archive(root_dir=install_dir)`.
+
+    Args:
+        client (S3.Client): S3 client.
+        install_dir (str): Directory to back up.
+        s3_bucket_name (str): S3 bucket name.
+        s3_bucket_object_name (str): S3 object key.
+        part_size (int): Multipart part size, at least 5 MiB (S3 minimum, except for the last part).
+        max_concurrency (int): Max parts uploaded concurrently.
+    """
+    writer = S3MultipartUploadWriter(
+        client=client,
+        bucket=s3_bucket_name,
+        key=s3_bucket_object_name,
+        part_size=part_size,
+        max_concurrency=max_concurrency,
+    )
+    try:
+        with zipfile.ZipFile(writer, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            for root, dirs, files in os.walk(install_dir):
+                dirs.sort()
+                for _name in [*dirs, *sorted(files)]:
+                    _path = os.path.join(root, _name)
+                    zip_file.write(filename=_path, arcname=os.path.relpath(_path, install_dir))
+
+        writer.complete()
+
+    except BaseException:
+        LOGGER.error(f"Failed to upload {install_dir} to S3 {s3_bucket_name}, path {s3_bucket_object_name}")
+        writer.abort()
+        raise
+
+
+class S3ObjectReader(io.RawIOBase):
+    """
+    Read-only, seekable stream over an S3 object, data is fetched with ranged GETs.
+
+    Each GET fetches at least `block_size` bytes and the last fetched block is cached, small reads (zip headers)
+    do not cost a request each.
+    """
+
+    def __init__(self, client: Any, bucket: str, key: str, block_size: int = S3_RANGED_GET_BLOCK_SIZE_BYTES) -> None:
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.block_size = block_size
+        self.size: int = client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        self.position = 0
+        self.block_start = 0
+        self.block = b""
+        self.requests_count = 0
+        self.bytes_fetched = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+
+        self.position = max(offset, 0)
+        return self.position
+
+    def readinto(self, buffer: Any) -> int:
+        size = min(len(buffer), self.size - self.position)
+        if size <= 0:
+            return 0
+
+        block_offset = self.position - self.block_start
+        if block_offset < 0 or block_offset + size > len(self.block):
+            self._fetch_block(size=size)
+            block_offset = 0
+
+        buffer[:size] = self.block[block_offset : block_offset + size]
+        self.position += size
+        return size
+
+    def _fetch_block(self, size: int) -> None:
+        end = min(self.position + max(size, self.block_size), self.size) - 1
+        self.block = self.client.get_object(Bucket=self.bucket, Key=self.key, Range=f"bytes={self.position}-{end}")[
+            "Body"
+        ].read()
+        self.block_start = self.position
+        self.requests_count += 1
+        self.bytes_fetched += len(self.block)
+
+
+def is_destroy_required_file(filename: str) -> bool:
+    return filename.startswith(DESTROY_REQUIRED_DIRECTORIES) or any(
+        fnmatch.fnmatch(os.path.basename(filename), _pattern) for _pattern in DESTROY_REQUIRED_FILES_PATTERNS
+    )
+
+
+def extract_destroy_files_from_s3_zip(
+    client: Any, s3_bucket_name: str, s3_bucket_object_name: str, extract_dir: str
+) -> None:
+    """
+    Extract the files needed to destroy a cluster from a zip backup in S3, without downloading the zip file.
+
+    The zip central directory and the needed files are read with ranged GETs, other files (installer logs, etc.)
+    are not downloaded.
+
+    Args:
+        client (S3.Client): S3 client.
+        s3_bucket_name (str): S3 bucket name.
+        s3_bucket_object_name (str): S3 zip file key.
+        extract_dir (str): Directory to extract the files to.
+    """
+    reader = S3ObjectReader(client=client, bucket=s3_bucket_name, key=s3_bucket_object_name)
+    with zipfile.ZipFile(reader) as zip_file:
+        for _member in zip_file.infolist():
+            if not _member.is_dir() and is_destroy_required_file(filename=_member.filename):
+                zip_file.extract(member=_member, path=extract_dir)
+
+    LOGGER.info(
+        f"Extracted {s3_bucket_name}/{s3_bucket_object_name} to {extract_dir}, fetched {reader.bytes_fetched} of"
+        f" {reader.size} bytes in {reader.requests_count} requests"
+    )
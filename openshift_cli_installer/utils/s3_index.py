@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import re
+import threading
+from typing import Any, NamedTuple
+
+import botocore.exceptions
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import (
+    S3_BACKUP_INDEX_FILENAME,
+    S3_BACKUP_INDEX_UPDATE_ATTEMPTS,
+    S3_BACKUP_INDEX_VERSION,
+)
+
+LOGGER = get_logger(name=__name__)
+# Serialize index updates of this process, updates from other processes are detected with conditional writes
+_S3_BACKUP_INDEX_LOCK = threading.Lock()
+_CONDITIONAL_WRITE_FAILED_CODES = ("PreconditionFailed", "ConditionalRequestConflict")
+# Backups are uploaded as `<cluster name>-<lowercase shortuuid>.zip`
+_OBJECT_KEY_SHORTUUID_SUFFIX_RE = re.compile(r"-[0-9a-z]{22}$")
+
+
+class S3BackupIndex(NamedTuple):
+    # Object key to cluster backup entry
+    entries: dict[str, dict[str, Any]]
+    # None if the index does not exist
+    etag: str | None
+    # All backups of the S3 bucket path are indexed, set once the index is reconciled with a bucket listing
+    complete: bool = False
+
+
+def get_s3_backup_index_key(s3_bucket_path: str) -> str:
+    return os.path.join(s3_bucket_path, S3_BACKUP_INDEX_FILENAME)
+
+
+def get_s3_backup_index_entry(cluster_info: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "name": cluster_info["name"],
+        "platform": cluster_info["platform"],
+        "region": cluster_info.get("region"),
+        "ocm-env": cluster_info.get("ocm-env"),
+        "creation-time": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "expiration-time": cluster_info.get("expiration-time"),
+        "object-key": cluster_info["s3-object-name"],
+    }
+
+
+def get_s3_backup_index_listed_entry(s3_object: dict[str, Any]) -> dict[str, Any]:
+    """
+    Get the entry of a backup found by a bucket listing (uploaded before the index existed).
+
+    Only the cluster name (parsed from the object key) and the upload time are known, the entry is marked
+    `partial`; the platform, region, OCM environment and expiration time are in the backup itself and are None.
+
+    Args:
+        s3_object (dict): `list_objects_v2` object of the zip file.
+
+    Returns:
+        dict: Backup index entry.
+    """
+    object_key = s3_object["Key"]
+    return {
+        "name": _OBJECT_KEY_SHORTUUID_SUFFIX_RE.sub("", os.path.splitext(os.path.basename(object_key))[0]),
+        "platform": None,
+        "region": None,
+        "ocm-env": None,
+        "creation-time": s3_object["LastModified"].isoformat(),
+        "expiration-time": None,
+        "object-key": object_key,
+        "partial": True,
+    }
+
+
+def read_s3_backup_index(client: Any, s3_bucket_name: str, s3_bucket_path: str = "") -> S3BackupIndex:
+    index_key = get_s3_backup_index_key(s3_bucket_path=s3_bucket_path)
+    try:
+        response = client.get_object(Bucket=s3_bucket_name, Key=index_key)
+    except botocore.exceptions.ClientError as ex:
+        if ex.response["Error"]["Code"] == "NoSuchKey":
+            return S3BackupIndex(entries={}, etag=None)
+        raise
+
+    index = json.loads(response["Body"].read())
+    if index.get("version") != S3_BACKUP_INDEX_VERSION:
+        LOGGER.warning(
+            f"S3 backup index {s3_bucket_name}/{index_key} version {index.get('version')} is not supported,"
+            f" supported version: {S3_BACKUP_INDEX_VERSION}, rebuilding it"
+        )
+        return S3BackupIndex(entries={}, etag=response["ETag"])
+
+    return S3BackupIndex(entries=index["clusters"], etag=response["ETag"], complete=index.get("complete", False))
+
+
+def update_s3_backup_index(
+    client: Any,
+    s3_bucket_name: str,
+    s3_bucket_path: str = "",
+    entry: dict[str, Any] | None = None,
+    remove_object_key: str = "",
+    listed_objects: list[dict[str, Any]] | None = None,
+) -> None:
+    """
+    Add and/or remove an entry of the backups index of an S3 bucket path.
+
+    The index is written with a conditional write (the index was not changed since it was read), and read and
+    updated again if another run changed it meanwhile.
+    With `listed_objects`, backups missing from the index (uploaded before it existed) are added as partial entries
+    (see `get_s3_backup_index_listed_entry`) and the index is marked complete, destroy from S3 then uses it without
+    listing the bucket.
+
+    Args:
+        client (S3.Client): S3 client.
+        s3_bucket_name (str): S3 bucket name.
+        s3_bucket_path (str): S3 bucket path of the backups.
+        entry (dict): Entry to add, see `get_s3_backup_index_entry`.
+        remove_object_key (str): Object key of the entry to remove.
+        listed_objects (list): Zip files objects of a full `list_objects_v2` listing of the S3 bucket path.
+    """
+    index_key = get_s3_backup_index_key(s3_bucket_path=s3_bucket_path)
+    with _S3_BACKUP_INDEX_LOCK:
+        for _ in range(S3_BACKUP_INDEX_UPDATE_ATTEMPTS):
+            try:
+                index = read_s3_backup_index(
+                    client=client, s3_bucket_name=s3_bucket_name, s3_bucket_path=s3_bucket_path
+                )
+                if entry:
+                    index.entries[entry["object-key"]] = entry
+
+                index.entries.pop(remove_object_key, None)
+                complete = index.complete
+                if listed_objects is not None:
+                    for _s3_object in listed_objects:
+                        if _s3_object["Key"] not in index.entries:
+                            index.entries[_s3_object["Key"]] = get_s3_backup_index_listed_entry(s3_object=_s3_object)
+                    complete = True
+
+                client.put_object(
+                    Bucket=s3_bucket_name,
+                    Key=index_key,
+                    Body=json.dumps(
+                        {"version": S3_BACKUP_INDEX_VERSION, "complete": complete, "clusters": index.entries},
+                        sort_keys=True,
+                    ),
+                    ContentType="application/json",
+                    **({"IfMatch": index.etag} if index.etag else {"IfNoneMatch": "*"}),
+                )
+                return
+
+            except botocore.exceptions.ClientError as ex:
+                # The index is an optimization, failing to update it does not fail the backup or the destroy
+                if ex.response["Error"]["Code"] not in _CONDITIONAL_WRITE_FAILED_CODES:
+                    LOGGER.error(f"Failed to update S3 backup index {s3_bucket_name}/{index_key}: {ex}")
+                    return
+
+                LOGGER.info(f"S3 backup index {s3_bucket_name}/{index_key} was changed by another run, retrying")
+
+    LOGGER.error(
+        f"Failed to update S3 backup index {s3_bucket_name}/{index_key} after {S3_BACKUP_INDEX_UPDATE_ATTEMPTS}"
+        " attempts, destroy from S3 will list the bucket"
+    )
+
+
+def get_s3_backup_index_zip_files(
+    client: Any, s3_bucket_name: str, s3_bucket_path: str = "", query: str = ""
+) -> list[str] | None:
+    """
+    Get the zip files keys matching `query` (sub-string of the key, like the bucket listing) from the backups index.
+
+    Only the object key is matched, partial entries (backups found by a bucket listing) are matched like the others.
+
+    Returns:
+        list | None: Matching zip files keys, None if the S3 bucket path has no complete index.
+    """
+    index = read_s3_backup_index(client=client, s3_bucket_name=s3_bucket_name, s3_bucket_path=s3_bucket_path)
+    if not index.complete:
+        return None
+
+    return sorted(_object_key for _object_key in index.entries if query in _object_key)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+
+import click
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import (
+    TERRAFORM_CACHE_DIRNAME,
+    TERRAFORM_DOT_DIRNAME,
+    TERRAFORM_LOCK_FILENAME,
+    TERRAFORM_TEMPLATE_INITIALIZED_FILENAME,
+)
+from openshift_cli_installer.utils.general import file_lock, run_single_flight
+
+LOGGER = get_logger(name=__name__)
+
+
+def _create_run_terraform_cache_dir() -> str:
+    terraform_cache_dir = tempfile.mkdtemp(prefix="openshift-cli-installer-terraform-")
+    atexit.register(shutil.rmtree, terraform_cache_dir, ignore_errors=True)
+    return terraform_cache_dir
+
+
+def get_terraform_cache_dir(cache_dir: str) -> str:
+    """
+    Terraform cache directory, `<cache-dir>/terraform`; when the cache is disabled, a directory for this run only.
+    """
+    if cache_dir:
+        return os.path.join(cache_dir, TERRAFORM_CACHE_DIRNAME)
+
+    return run_single_flight(key="terraform-run-cache-dir", func=_create_run_terraform_cache_dir)
+
+
+def get_terraform_template_dir(terraform_cache_dir: str, terraform_file: str, provider_mirror_dir: str = "") -> str:
+    """
+    Get a working directory of `terraform_file`, initialized (`terraform init`) once.
+
+    Templates are keyed by the terraform file content. Providers are downloaded to a plugin cache shared by all
+    templates (`TF_PLUGIN_CACHE_DIR` of the template `terraform init` only, unless already set), or installed from
+    `provider_mirror_dir` without network access. Terraform plugin cache is not safe for concurrent `terraform init`, templates are initialized under a
+    lock shared between threads and processes on the same host.
+
+    Args:
+        terraform_cache_dir (str): Terraform cache directory.
+        terraform_file (str): Terraform configuration file.
+        provider_mirror_dir (str): Local providers mirror (`terraform providers mirror`).
+
+    Returns:
+        str: Initialized template directory.
+    """
+    with open(terraform_file, "rb") as fd:
+        template_key = hashlib.sha256(fd.read()).hexdigest()[:16]
+
+    template_dir = os.path.join(terraform_cache_dir, "templates", template_key)
+    with file_lock(lock_file_path=os.path.join(terraform_cache_dir, ".lock")):
+        if os.path.isfile(os.path.join(template_dir, TERRAFORM_TEMPLATE_INITIALIZED_FILENAME)):
+            return template_dir
+
+        # Imported on use, only hypershift clusters run terraform
+        from pyhelper_utils.shell import run_command
+
+        LOGGER.info(f"Initializing terraform template {template_dir} for {os.path.basename(terraform_file)}")
+        # Leftover of an interrupted init
+        shutil.rmtree(template_dir, ignore_errors=True)
+        os.makedirs(template_dir)
+        shutil.copy(terraform_file, template_dir)
+
+        init_command = ["terraform", "init", "-input=false"]
+        init_env = dict(os.environ)
+        if provider_mirror_dir:
+            init_command.append(f"-plugin-dir={provider_mirror_dir}")
+        else:
+            # Not set in `os.environ`, clusters terraform commands use the template providers, see
+            # `prepare_terraform_working_dir`
+            plugin_cache_dir = init_env.setdefault("TF_PLUGIN_CACHE_DIR", os.path.join(terraform_cache_dir, "plugins"))
+            os.makedirs(plugin_cache_dir, exist_ok=True)
+
+        rc, out, err = run_command(
+            command=init_command, verify_stderr=False, check=False, cwd=template_dir, env=init_env
+        )
+        if not rc:
+            LOGGER.error(f"Terraform template {template_dir} init failed. Err: {err}, Out: {out}")
+            raise click.Abort()
+
+        with open(os.path.join(template_dir, TERRAFORM_TEMPLATE_INITIALIZED_FILENAME), "w"):
+            pass
+
+    return template_dir
+
+
+def prepare_terraform_working_dir(template_dir: str, working_dir: str, terraform_file_name: str) -> str:
+    """
+    Prepare `working_dir` from an initialized template, nothing is downloaded by its `terraform init`.
+
+    The dependency lock file is copied, the template modules are linked and the template providers are used as
+    a local mirror (`terraform init -plugin-dir`), Terraform links them instead of copying.
+
+    Args:
+        template_dir (str): Template directory, see `get_terraform_template_dir`.
+        working_dir (str): Terraform working directory (cluster directory).
+        terraform_file_name (str): Terraform configuration file name.
+
+    Returns:
+        str: Template providers directory, to pass as `terraform init` `plugin_dir`.
+    """
+    shutil.copy(os.path.join(template_dir, terraform_file_name), working_dir)
+    shutil.copy(os.path.join(template_dir, TERRAFORM_LOCK_FILENAME), working_dir)
+
+    # Left from a previous init, may link to a removed run template
+    terraform_dot_dir = os.path.join(working_dir, TERRAFORM_DOT_DIRNAME)
+    shutil.rmtree(terraform_dot_dir, ignore_errors=True)
+    os.makedirs(terraform_dot_dir)
+
+    template_terraform_dot_dir = os.path.join(template_dir, TERRAFORM_DOT_DIRNAME)
+    if os.path.isdir(os.path.join(template_terraform_dot_dir, "modules")):
+        os.symlink(os.path.join(template_terraform_dot_dir, "modules"), os.path.join(terraform_dot_dir, "modules"))
+
+    return os.path.join(template_terraform_dot_dir, "providers")